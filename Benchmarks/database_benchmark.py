@@ -0,0 +1,113 @@
+from    os      import  path # -> Project root resolution
+import  sys # -> Import path manipulation
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from    Utilities.database  import  UserData # -> Indexes under benchmark
+import  argparse # -> Command line options
+import  random # -> Query sample
+import  time # -> Timing
+
+def create_collection(uri : str) :
+    """
+    Creates an empty benchmark collection, on a mongod if an uri is given and on mongomock otherwise.
+    @Parameters:
+        uri - Required : Connection string of the mongod, None uses mongomock. (str) -> Used to select the server
+    @Returns:
+        collection - The empty collection. (Collection)
+    """
+    if uri is None :
+        import mongomock
+        client = mongomock.MongoClient()
+    else :
+        import pymongo
+        client = pymongo.MongoClient(uri, serverSelectionTimeoutMS=5000)
+    client.drop_database("trman_benchmark")
+    return client["trman_benchmark"]["user_data"]
+
+def fill_collection(collection, document_count : int, documents_per_owner : int = 4) -> list:
+    """
+    Inserts user data like documents, a few per owner like the saved scenarios.
+    @Parameters:
+        collection - Required : The collection. (Collection) -> Used to be filled
+        document_count - Required : Number of documents. (int) -> Used to size the collection
+        documents_per_owner - Optional : Documents of each owner. (int) (default = 4) -> Used to shape the data
+    @Returns:
+        keys - (owner_id, document_name) of the inserted documents. (list)
+    """
+    keys = [(f"{owner_index:011d}", f"Scenario {document_index}") for owner_index in range(document_count // documents_per_owner) for document_index in range(documents_per_owner)]
+    for batch_start in range(0, len(keys), 10000) :
+        collection.insert_many([{"owner_id" : owner_id, "document_name" : document_name, "parsing_type" : "offline", "semesters" : []} for owner_id, document_name in keys[batch_start:batch_start + 10000]])
+    return keys
+
+def measure_queries(collection, keys : list) -> tuple:
+    """
+    Measures the two query shapes of the application.
+    @Parameters:
+        collection - Required : The collection. (Collection) -> Used to be queried
+        keys - Required : (owner_id, document_name) to be queried. (list) -> Used as the query sample
+    @Returns:
+        (float, float) : Mean seconds of a save/load lookup and of a document listing.
+    """
+    start_time = time.perf_counter()
+    for owner_id, document_name in keys :
+        collection.count_documents({"owner_id" : owner_id, "document_name" : document_name})
+    lookup_time = (time.perf_counter() - start_time) / len(keys)
+
+    start_time = time.perf_counter()
+    for owner_id, _ in keys :
+        list(collection.find({"owner_id" : owner_id}))
+    listing_time = (time.perf_counter() - start_time) / len(keys)
+    return lookup_time, listing_time
+
+def get_plan_stage(collection, owner_id : str, document_name : str) -> str:
+    """
+    Returns the winning plan stage of a lookup, COLLSCAN or IXSCAN. Only a real mongod explains its plans.
+    @Parameters:
+        collection - Required : The collection. (Collection) -> Used to be explained
+        owner_id - Required : Owner of the lookup. (str) -> Used to build the query
+        document_name - Required : Name of the lookup. (str) -> Used to build the query
+    @Returns:
+        stage - Stage of the winning plan. (str)
+    """
+    try :
+        plan = collection.find({"owner_id" : owner_id, "document_name" : document_name}).explain()["queryPlanner"]["winningPlan"]
+    except Exception :
+        return "n/a"
+    while "inputStage" in plan :
+        plan = plan["inputStage"]
+    return plan.get("stage", "n/a")
+
+if __name__ == "__main__":
+
+    argument_parser = argparse.ArgumentParser(description="Query times of the user data collection, without and with its indexes.")
+    argument_parser.add_argument("--uri", default=None, help="Connection string of a local mongod, mongomock is used if it is not given.")
+    argument_parser.add_argument("--documents", type=int, default=100000, help="Number of documents.")
+    argument_parser.add_argument("--queries", type=int, default=200, help="Number of queries of each shape.")
+    arguments = argument_parser.parse_args()
+
+    collection = create_collection(arguments.uri)
+    keys = fill_collection(collection, arguments.documents)
+    sample = random.Random(0).sample(keys, min(arguments.queries, len(keys)))
+
+    # Without the indexes, than with the indexes of UserData.
+    scan_times = measure_queries(collection, sample)
+    scan_stage = get_plan_stage(collection, *sample[0])
+    for index_keys, options in UserData.INDEXES :
+        collection.create_index(index_keys, **options)
+    index_times = measure_queries(collection, sample)
+    index_stage = get_plan_stage(collection, *sample[0])
+
+    print(f"{len(keys)} documents on {'mongomock' if arguments.uri is None else arguments.uri}")
+    print(f"{'':<16} {'lookup (ms)':>12} {'listing (ms)':>13} {'plan':>8}")
+    print(f"{'no index':<16} {scan_times[0] * 1e3:>12.3f} {scan_times[1] * 1e3:>13.3f} {scan_stage:>8}")
+    print(f"{'indexed':<16} {index_times[0] * 1e3:>12.3f} {index_times[1] * 1e3:>13.3f} {index_stage:>8}")
+    if arguments.uri is None :
+        print("mongomock always scans, run it with --uri mongodb://localhost:27017/ for the real query times.")
+
+    # The unique index must reject a second document with the same name.
+    try :
+        collection.insert_one({"owner_id" : sample[0][0], "document_name" : sample[0][1]})
+        print("unique index : NOT enforced")
+    except Exception as error :
+        print(f"unique index : enforced ({type(error).__name__})")
+    collection.database.client.drop_database("trman_benchmark")
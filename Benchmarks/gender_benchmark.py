@@ -0,0 +1,72 @@
+from    os      import  path # -> Project root resolution
+import  sys # -> Import path manipulation
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from    Utilities.gender_index  import  GenderIndex # -> Index under benchmark
+import  gender_guesser.detector as      gender # -> Baseline detector
+import  tempfile # -> Isolated index file
+import  random # -> Lookup sample
+import  time # -> Timing
+
+def detect_with_baseline(detector : gender.Detector, name : str, country : str = "turkey") -> str:
+    """
+    Detects the gender the way the application did before the index, normalization included.
+    @Parameters:
+        detector - Required : Baseline detector. (gender.Detector) -> Used for the detection
+        name - Required : Full name. (str) -> Used for the detection
+        country - Optional : Country of the name. (str) (default = "turkey") -> Used for the detection
+    @Returns:
+        gender - Detected gender. (str)
+    """
+    import re
+    transmap = str.maketrans("ıüöçşğİÜÖÇŞĞ", "iuocsgIUOCSG")
+    name = name.lower().split(" ")[0].translate(transmap).capitalize()
+    return detector.get_gender(name=re.sub(r"[^a-zA-Z]+", "", name), country=country)
+
+def measure(function, repeat : int = 1) -> float:
+    """
+    Measures the best run time of the given function.
+    @Parameters:
+        function - Required : Function to be measured. (callable) -> Used to be timed
+        repeat - Optional : Number of repetitions. (int) (default = 1) -> Used to reduce the noise
+    @Returns:
+        best_time - Best run time in seconds. (float)
+    """
+    best_time = float("inf")
+    for _ in range(repeat) :
+        start_time = time.perf_counter()
+        function()
+        best_time = min(best_time, time.perf_counter() - start_time)
+    return best_time
+
+if __name__ == "__main__":
+
+    with tempfile.TemporaryDirectory() as temporary_folder :
+        index_path = path.join(temporary_folder, "gender_index_turkey.json.z")
+
+        # Startup : the baseline builds the detector at import time, the index is built once and than loaded.
+        detector_time = measure(lambda : gender.Detector(case_sensitive=False), repeat=3)
+        build_time = measure(lambda : GenderIndex(index_path=index_path).get_gender("Ali"))
+        load_time = measure(lambda : GenderIndex(index_path=index_path).get_gender("Ali"), repeat=3)
+        print(f"{'startup':<34} {'time (ms)':>10}")
+        print(f"{'baseline detector construction':<34} {detector_time * 1e3:>10.1f}")
+        print(f"{'index first build (once)':<34} {build_time * 1e3:>10.1f}")
+        print(f"{'index load + first lookup':<34} {load_time * 1e3:>10.1f}")
+
+        # Lookups : a sample of real names with turkish letters, repeated like the logins.
+        detector = gender.Detector(case_sensitive=False)
+        generator = random.Random(0)
+        names = [current_name.capitalize() + " Surname" for current_name in generator.sample(sorted(detector.names), 2000)]
+        names.extend(["Çağrı Yılmaz", "Şule Öztürk", "İlker Güneş", "Gökçe Ünal", "Ömer Faruk Işık"] * 20)
+        lookups = names * 5
+
+        index = GenderIndex(index_path=index_path)
+        baseline_time = measure(lambda : [detect_with_baseline(detector, current_name) for current_name in lookups], repeat=3)
+        index_time = measure(lambda : [index.get_gender(current_name) for current_name in lookups], repeat=3)
+        print(f"\n{'lookups':<34} {'ns/lookup':>10}")
+        print(f"{'baseline':<34} {baseline_time / len(lookups) * 1e9:>10.0f}")
+        print(f"{'index (lru front)':<34} {index_time / len(lookups) * 1e9:>10.0f}")
+
+        # The index must agree with the baseline on every name.
+        mismatches = [current_name for current_name in names if index.get_gender(current_name) != detect_with_baseline(detector, current_name)]
+        print(f"\nmismatches : {len(mismatches)} / {len(names)} {mismatches[:5]}")
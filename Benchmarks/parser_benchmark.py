@@ -0,0 +1,71 @@
+from    os      import  path # -> Project root resolution
+import  sys # -> Import path manipulation
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from    Utilities.lexer import  OfflineParser # -> Parser under benchmark
+import  random # -> Synthetic data generation
+import  time # -> Timing
+
+def generate_transcript_lines(semester_count : int = 20, courses_per_semester : int = 6, seed : int = 0) -> list:
+    """
+    Generates the extracted lines of a synthetic english transcript, in the layout of the MEF transcript PDF.
+    @Parameters:
+        semester_count - Optional : Number of semesters. (int) (default = 20) -> Used to scale the transcript
+        courses_per_semester - Optional : Number of courses in each semester. (int) (default = 6) -> Used to scale the transcript
+        seed - Optional : Seed of the random generator. (int) (default = 0) -> Used to make the runs repeatable
+    @Returns:
+        lines - Extracted lines of the transcript. (list)
+    """
+    generator = random.Random(seed)
+    terms = ["Fall Semester", "Spring Semester", "Summer School"]
+
+    # Header, student information and a prep semester.
+    lines = ["MEF UNIVERSITY", "Office of the Registrar", "01/01/2024 10:00"]
+    for title, value in [("Student ID", "041900001"), ("National ID", "10000000000"), ("Name", "Name"), ("Surname", "Surname"), ("Faculty", "Faculty of Engineering"), ("Program", "Computer Engineering"), ("Language", "English"), ("Status", "Active")] :
+        lines.extend([title, value])
+    lines.extend(["2018-2019 Fall Semester", "Prep", "Semester"])
+
+    # Semesters with their column titles, courses and summaries.
+    for semester_index in range(semester_count) :
+        lines.append(f"{2019 + semester_index // 3}-{2020 + semester_index // 3} {terms[semester_index % 3]}")
+        lines.extend(["Course Code", "Course Name", "Lang.", "Credit", "Grade", "Grade Point", "ECTS"])
+        for course_index in range(courses_per_semester) :
+            retaken = "*" if generator.random() < 0.1 else ""
+            lines.extend([f"COMP {semester_index:02d}{course_index:03d}{retaken}", f"Course {course_index}", "EN", str(generator.randint(1, 7)), generator.choice(["A", "B+", "C", "F", "S", "W"]), f"{generator.uniform(0, 28):.1f}"])
+        lines.extend(["Semester", "Credits Attempted 30", "Cumulative Credits Attempted 90"])
+
+    # Footer of the transcript.
+    lines.extend(f"Footer {footer_index}" for footer_index in range(OfflineParser.FOOTER_LINE_COUNT))
+    return lines
+
+def measure(lines : list, repeat : int = 5) -> float:
+    """
+    Measures the best parsing time of the given lines.
+    @Parameters:
+        lines - Required : Extracted lines of the transcript. (list) -> Used to be parsed
+        repeat - Optional : Number of repetitions. (int) (default = 5) -> Used to reduce the noise
+    @Returns:
+        best_time - Best parsing time in seconds. (float)
+    """
+    best_time = float("inf")
+    for _ in range(repeat) :
+        parser = OfflineParser()
+        parser.extracted = lines
+        start_time = time.perf_counter()
+        parser._parse_transcript_information()
+        best_time = min(best_time, time.perf_counter() - start_time)
+    return best_time
+
+if __name__ == "__main__":
+
+    # Keep 20 semesters and grow the courses, the cost per line must stay flat for a linear parser.
+    print(f"{'courses/semester':>18} {'lines':>8} {'time (ms)':>10} {'ns/line':>9}")
+    results = []
+    for courses_per_semester in [6, 12, 24, 48, 96, 192] :
+        lines = generate_transcript_lines(20, courses_per_semester)
+        elapsed_time = measure(lines)
+        results.append(elapsed_time / len(lines))
+        print(f"{courses_per_semester:>18} {len(lines):>8} {elapsed_time * 1e3:>10.3f} {elapsed_time / len(lines) * 1e9:>9.1f}")
+
+    # A ratio close to 1 means linear scaling, a quadratic parser grows with the size.
+    print(f"\nns/line ratio (largest / smallest) : {results[-1] / results[0]:.2f}")
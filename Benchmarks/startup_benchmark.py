@@ -0,0 +1,92 @@
+from    os      import  path # -> Project root resolution
+import  subprocess # -> Fresh interpreters for each run
+import  argparse # -> Command line options
+import  sys # -> Interpreter path
+
+# Project root, the imports are measured from it like main.py
+PROJECT_ROOT = path.dirname(path.dirname(path.abspath(__file__)))
+
+# Imports of main.py, everything before the first window.
+STARTUP_STATEMENT = "from Utilities import safe_start, safe_execute, safe_end"
+# Target cold start budget of the imports in milliseconds.
+STARTUP_BUDGET_MS = 1500.0
+# Heavy modules which must be loaded on their first use, not at the start.
+DEFERRED_MODULES = ("selenium", "PyPDF2", "fpdf", "googletrans", "gender_guesser", "bs4", "win32com", "matplotlib")
+
+def run_importtime(statement : str) -> list:
+    """
+    Runs the statement in a fresh interpreter with -X importtime and parses its report.
+    @Parameters:
+        statement - Required : Python statement to be measured. (str) -> Used to be imported
+    @Returns:
+        records - (module name, self time in us, cumulative time in us, depth) of each import, in the report order. (list)
+    @Raises:
+        RuntimeError - If the statement fails.
+    """
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], cwd=PROJECT_ROOT, capture_output=True, text=True)
+    if process.returncode != 0 :
+        raise RuntimeError(process.stderr.strip().splitlines()[-1] if process.stderr.strip() else f"exit code {process.returncode}")
+
+    # Lines are "import time: <self> | <cumulative> | <indent><module>", the header line is skipped.
+    records = []
+    for current_line in process.stderr.splitlines() :
+        if not current_line.startswith("import time:") :
+            continue
+        fields = current_line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit() :
+            continue
+        module_name = fields[2].rstrip()
+        records.append((module_name.strip(), int(fields[0]), int(fields[1]), len(module_name) - len(module_name.lstrip())))
+    return records
+
+def summarize(records : list) -> dict:
+    """
+    Summarizes an import report.
+    @Parameters:
+        records - Required : Output of run_importtime. (list) -> Used to be summarized
+    @Returns:
+        summary - Total time in ms, the slowest top level packages and the loaded deferred modules. (dict)
+    """
+    top_depth = min(current_record[3] for current_record in records)
+    total_time = sum(current_record[2] for current_record in records if current_record[3] == top_depth) / 1e3
+
+    # Group the self times by the top level packages, it shows where the time goes.
+    package_times = {}
+    for module_name, self_time, _, _ in records :
+        package_name = module_name.split(".")[0]
+        package_times[package_name] = package_times.get(package_name, 0) + self_time / 1e3
+
+    loaded_modules = {current_record[0].split(".")[0] for current_record in records}
+    return {
+        "total_time" : total_time,
+        "package_times" : sorted(package_times.items(), key=lambda item : item[1], reverse=True),
+        "loaded_deferred_modules" : [module_name for module_name in DEFERRED_MODULES if module_name in loaded_modules]
+    }
+
+if __name__ == "__main__":
+
+    argument_parser = argparse.ArgumentParser(description="Cold start import report of the application.")
+    argument_parser.add_argument("--statement", default=STARTUP_STATEMENT, help="Statement to be measured.")
+    argument_parser.add_argument("--budget", type=float, default=STARTUP_BUDGET_MS, help="Cold start budget in milliseconds.")
+    argument_parser.add_argument("--repeat", type=int, default=5, help="Number of fresh interpreters, the best one is reported.")
+    argument_parser.add_argument("--top", type=int, default=15, help="Number of packages in the report.")
+    arguments = argument_parser.parse_args()
+
+    # Best of the runs, the first one also pays for the cold disk cache and the bytecode compilation.
+    try :
+        summaries = [summarize(run_importtime(arguments.statement)) for _ in range(max(1, arguments.repeat))]
+    except RuntimeError as error :
+        print(f"Import failed : {error}")
+        sys.exit(2)
+    summary = min(summaries, key=lambda current_summary : current_summary["total_time"])
+
+    print(f"{'package':<34} {'self (ms)':>10}")
+    for package_name, package_time in summary["package_times"][:arguments.top] :
+        print(f"{package_name:<34} {package_time:>10.1f}")
+
+    print(f"\n{'total import time':<34} {summary['total_time']:>10.1f} ms (budget {arguments.budget:.0f} ms)")
+    print(f"{'loaded deferred modules':<34} {summary['loaded_deferred_modules'] or 'none'}")
+
+    # Fail when over the budget or when a heavy module sneaks back into the start.
+    if summary["total_time"] > arguments.budget or summary["loaded_deferred_modules"] :
+        sys.exit(1)
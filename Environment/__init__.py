@@ -6,6 +6,10 @@ from    Environment.constants   import (
     ASSETS_DC,
     UTILITIES_DC,
     DATABASE_DC,
+    INGESTION_DC,
+    CACHE_DC,
+    NETWORK_DC,
+    INSTRUMENTATION_DC,
     GUI_DC 
 )
 
@@ -24,4 +28,9 @@ from    Environment.constants   import (
 # Init language map
 from    Environment.language_hash   import (
     to_turkish,
+)
+
+# Init MEF vocabulary
+from    Environment.mef_dictionary  import (
+    mef_vocabulary,
 )
\ No newline at end of file
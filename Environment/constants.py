@@ -1,4 +1,5 @@
 from    dataclasses import  dataclass
+from    typing      import  Optional
 from    os          import  path
 
 def connect_pathes(*pathes : tuple) -> str:
@@ -44,11 +45,17 @@ class ExecutionDC:
         PRE_EXISTING_CHECKLIST_RELATIVE: list
         POST_CACHE_CLEANUP_LIST: list
         POST_CLEANUP_LIST: list
+        PREFLIGHT_TIMEOUT: float
+        PREFLIGHT_CACHE_PATH: str
+        PREFLIGHT_CACHE_TTL: float
     """
     PRE_EXISTING_CHECKLIST_MUST: list
     PRE_EXISTING_CHECKLIST_RELATIVE: list
     POST_CACHE_CLEANUP_LIST: list
     POST_CLEANUP_LIST: list
+    PREFLIGHT_TIMEOUT: float
+    PREFLIGHT_CACHE_PATH: str
+    PREFLIGHT_CACHE_TTL: float
 
 @dataclass
 class AssetsDC:
@@ -75,7 +82,9 @@ class SeleniumDC:
     The dataclass that holds the selenium constants.
     @Attributes:
         CHROME_DRIVER_PATH : str
-        USER_PHOTO_OUTPUT_PATH : str
+        USER_PHOTO_OUTPUT_TEMPLATE : str
+        PHOTO_FETCH_WORKERS : int
+        PHOTO_CACHE_SIZE : int
         OLEXER_SYSTEM_LOGIN_URL : str
         OLEXER_USERNAME_ENTRY_XPATH : str
         OLEXER_PASSWORD_ENTRY_XPATH : str
@@ -88,9 +97,20 @@ class SeleniumDC:
         OLEXER_DROP_DOWN_MENU_XPATH : str
         OLEXER_ID_SELECTION_XPATH : str
         OLEXER_TRANSCRIPT_URL : str
+        OLEXER_BACKEND : str
+        OLEXER_USER_PHOTO_SELECTOR : str
+        OLEXER_DROP_DOWN_MENU_SELECTOR : str
+        BROWSER_POOL_SIZE : int
+        BROWSER_MAX_USES : int
+        WAIT_TIMEOUT : float
+        WAIT_POLL_INTERVAL : float
+        WAIT_BACKOFF_FACTOR : float
+        WAIT_MAX_POLL_INTERVAL : float
     """
     CHROME_DRIVER_PATH : str
-    USER_PHOTO_OUTPUT_PATH : str
+    USER_PHOTO_OUTPUT_TEMPLATE : str
+    PHOTO_FETCH_WORKERS : int
+    PHOTO_CACHE_SIZE : int
     OLEXER_SYSTEM_LOGIN_URL : str
     OLEXER_USERNAME_ENTRY_XPATH : str
     OLEXER_PASSWORD_ENTRY_XPATH : str
@@ -103,6 +123,15 @@ class SeleniumDC:
     OLEXER_DROP_DOWN_MENU_XPATH : str
     OLEXER_ID_SELECTION_XPATH : str
     OLEXER_TRANSCRIPT_URL : str
+    OLEXER_BACKEND : str
+    OLEXER_USER_PHOTO_SELECTOR : str
+    OLEXER_DROP_DOWN_MENU_SELECTOR : str
+    BROWSER_POOL_SIZE : int
+    BROWSER_MAX_USES : int
+    WAIT_TIMEOUT : float
+    WAIT_POLL_INTERVAL : float
+    WAIT_BACKOFF_FACTOR : float
+    WAIT_MAX_POLL_INTERVAL : float
 
 @dataclass
 class PackagesDC:
@@ -140,10 +169,100 @@ class DatabaseDC:
         CONNECTION_STRING : str
         DATABASE_NAME : str
         COLLECTION_NAMES : dict
+        SERVER_SELECTION_TIMEOUT : float
+        CONNECT_TIMEOUT : float
+        MAX_POOL_SIZE : int
+        MIN_POOL_SIZE : int
+        BULK_BATCH_SIZE : int
+        STORAGE_MODE : str
+        LOCAL_STORE_ENABLED : bool
+        LOCAL_STORE_PATH : str
+        SYNC_INTERVAL : float
+        SYNC_PULL_TIMEOUT : float
+        SYNC_EXIT_TIMEOUT : float
     """
     CONNECTION_STRING : str
     DATABASE_NAME : str
     COLLECTION_NAMES : dict
+    SERVER_SELECTION_TIMEOUT : float
+    CONNECT_TIMEOUT : float
+    MAX_POOL_SIZE : int
+    MIN_POOL_SIZE : int
+    BULK_BATCH_SIZE : int
+    STORAGE_MODE : str
+    LOCAL_STORE_ENABLED : bool
+    LOCAL_STORE_PATH : str
+    SYNC_INTERVAL : float
+    SYNC_PULL_TIMEOUT : float
+    SYNC_EXIT_TIMEOUT : float
+
+@dataclass
+class IngestionDC:
+    """
+    The dataclass that holds the batch ingestion constants.
+    @Attributes:
+        MAX_WORKERS : Optional[int]
+        FILE_PATTERN : str
+    """
+    MAX_WORKERS : Optional[int]
+    FILE_PATTERN : str
+
+@dataclass
+class CacheDC:
+    """
+    The dataclass that holds the cache constants.
+    @Attributes:
+        PARSE_CACHE_FOLDER : str
+        PARSE_CACHE_MAX_SIZE : int
+        TRANSLATION_MEMO_PATH : str
+        GENDER_INDEX_FOLDER : str
+        DOCUMENT_CACHE_TTL : float
+        DOCUMENT_CACHE_MAX_ENTRIES : int
+        DOCUMENT_CACHE_WATCH : bool
+    """
+    PARSE_CACHE_FOLDER : str
+    PARSE_CACHE_MAX_SIZE : int
+    TRANSLATION_MEMO_PATH : str
+    GENDER_INDEX_FOLDER : str
+    DOCUMENT_CACHE_TTL : float
+    DOCUMENT_CACHE_MAX_ENTRIES : int
+    DOCUMENT_CACHE_WATCH : bool
+
+@dataclass
+class NetworkDC:
+    """
+    The dataclass that holds the http client constants.
+    @Attributes:
+        POOL_CONNECTIONS : int
+        POOL_MAXSIZE : int
+        CONNECT_TIMEOUT : float
+        READ_TIMEOUT : float
+        RETRY_TOTAL : int
+        RETRY_BACKOFF_FACTOR : float
+        RETRY_STATUS_FORCELIST : tuple
+    """
+    POOL_CONNECTIONS : int
+    POOL_MAXSIZE : int
+    CONNECT_TIMEOUT : float
+    READ_TIMEOUT : float
+    RETRY_TOTAL : int
+    RETRY_BACKOFF_FACTOR : float
+    RETRY_STATUS_FORCELIST : tuple
+
+@dataclass
+class InstrumentationDC:
+    """
+    The dataclass that holds the instrumentation constants.
+    @Attributes:
+        ENABLED : bool
+        TRACE_OUTPUT_PATH : str
+        PROFILED_SPANS : tuple
+        PROFILE_OUTPUT_FOLDER : str
+    """
+    ENABLED : bool
+    TRACE_OUTPUT_PATH : str
+    PROFILED_SPANS : tuple
+    PROFILE_OUTPUT_FOLDER : str
 
 @dataclass
 class GUIDC:
@@ -212,6 +331,9 @@ EXECUTION_DC = ExecutionDC(
     PRE_EXISTING_CHECKLIST_RELATIVE = [SOURCES_FOLDER, TEMP_FOLDER],
     POST_CACHE_CLEANUP_LIST = [ENVIRONMENT_FOLDER, GUI_FOLDER, SERVICES_FOLDER, UTILITIES_FOLDER],
     POST_CLEANUP_LIST = [TEMP_FOLDER],
+    PREFLIGHT_TIMEOUT = 15.0, # Seconds, deadline of all of the start up checks which block the start.
+    PREFLIGHT_CACHE_PATH = connect_pathes(SOURCES_FOLDER, "preflight_cache.json"),
+    PREFLIGHT_CACHE_TTL = 6 * 60 * 60, # Seconds, a successful check younger than it is trusted and rechecked in the background.
 )
 ASSETS_DC = AssetsDC(
     LOADING_ANIMATION_PATH = connect_pathes(ASSETS_FOLDER, "animated", "loader.gif"),
@@ -230,7 +352,9 @@ ASSETS_DC = AssetsDC(
 )
 SELENIUM_DC = SeleniumDC(
     CHROME_DRIVER_PATH = connect_pathes(SOURCES_FOLDER, "chromedriver.exe"),
-    USER_PHOTO_OUTPUT_PATH = connect_pathes(TEMP_FOLDER, "user_photo.png"),
+    USER_PHOTO_OUTPUT_TEMPLATE = connect_pathes(TEMP_FOLDER, "user_photo_{user_key}.png"), # One photo per user, so the sessions do not overwrite each other.
+    PHOTO_FETCH_WORKERS = 2, # Background threads of the photo downloads.
+    PHOTO_CACHE_SIZE = 32, # Normalized photos kept in memory, by their url.
     OLEXER_SYSTEM_LOGIN_URL = "https://sis.mef.edu.tr/auth/login",
     OLEXER_USERNAME_ENTRY_XPATH = "//*[@id=\"kullanici_adi\"]",
     OLEXER_PASSWORD_ENTRY_XPATH = "//*[@id=\"kullanici_sifre\"]",
@@ -242,7 +366,16 @@ SELENIUM_DC = SeleniumDC(
     OLEXER_STUDENT_INFO_XPATH = "/html/body/div[2]/div/div[3]/ul/li/ul/li[1]/a",
     OLEXER_DROP_DOWN_MENU_XPATH = "/html/body/div[2]/div/div[3]/ul/li/ul",
     OLEXER_ID_SELECTION_XPATH = "//*[@id=\"yetkiDegistir\"]/div/ul",
-    OLEXER_TRANSCRIPT_URL = "https://sis.mef.edu.tr/ogrenciler/belge/transkript"
+    OLEXER_TRANSCRIPT_URL = "https://sis.mef.edu.tr/ogrenciler/belge/transkript",
+    OLEXER_BACKEND = "http", # "http" fetches the pages without a browser and falls back to "selenium" on failure.
+    OLEXER_USER_PHOTO_SELECTOR = "body > div:nth-of-type(2) > div > div:nth-of-type(3) > ul > li > a > img", # CSS twin of OLEXER_USER_PHOTO_LABEL_XPATH
+    OLEXER_DROP_DOWN_MENU_SELECTOR = "body > div:nth-of-type(2) > div > div:nth-of-type(3) > ul > li > ul", # CSS twin of OLEXER_DROP_DOWN_MENU_XPATH
+    BROWSER_POOL_SIZE = 2, # Number of warm headless browsers, set it per machine.
+    BROWSER_MAX_USES = 20, # A browser is recycled after this many sessions.
+    WAIT_TIMEOUT = 30.0, # Seconds to wait for an element before giving up.
+    WAIT_POLL_INTERVAL = 0.05, # Seconds between the first polls.
+    WAIT_BACKOFF_FACTOR = 1.5, # Poll interval growth on each failed poll.
+    WAIT_MAX_POLL_INTERVAL = 0.5, # Upper limit of the poll interval.
 )
 PACKAGES_DC = PackagesDC(
     CHROME_DRIVER_DOWNLOAD_URL = "https://chromedriver.chromium.org/downloads",
@@ -258,7 +391,46 @@ UTILITIES_DC = UtilitiesDC(
 DATABASE_DC = DatabaseDC(
     CONNECTION_STRING = "mongodb://localhost:27017/",
     DATABASE_NAME = "trman",
-    COLLECTION_NAMES = {"__user_info_collection_define" : "user_info", "__user_data_collection_define" : "user_data"}
+    COLLECTION_NAMES = {"__user_info_collection_define" : "user_info", "__user_data_collection_define" : "user_data", "__user_base_collection_define" : "user_base"},
+    SERVER_SELECTION_TIMEOUT = 5.0, # Seconds, pymongo waits 30 seconds by default on a dead server.
+    CONNECT_TIMEOUT = 5.0, # Seconds to open a connection, pymongo waits 20 seconds by default.
+    MAX_POOL_SIZE = 10, # Connections of the shared client, the GUI and the sync worker need a few.
+    MIN_POOL_SIZE = 0, # Connections kept open while idle.
+    BULK_BATCH_SIZE = 1000, # Writes sent in one bulk_write call.
+    STORAGE_MODE = "delta", # "delta" stores the transcript once in user_base and only the changes in user_data, "full" stores the whole document in user_data.
+    LOCAL_STORE_ENABLED = True, # Read and write the local store first, the database is synced in the background. The application works without the database then.
+    LOCAL_STORE_PATH = connect_pathes(SOURCES_FOLDER, "local_store.sqlite3"),
+    SYNC_INTERVAL = 30.0, # Seconds between the background syncs, the local writes start one at once.
+    SYNC_PULL_TIMEOUT = 3.0, # Seconds to wait for the first pull of a user's documents on this machine.
+    SYNC_EXIT_TIMEOUT = 5.0, # Seconds to wait for the last sync on exit, the rest is pushed on the next start.
+)
+INGESTION_DC = IngestionDC(
+    MAX_WORKERS = None, # None means one worker per available core.
+    FILE_PATTERN = "*.pdf",
+)
+CACHE_DC = CacheDC(
+    PARSE_CACHE_FOLDER = connect_pathes(SOURCES_FOLDER, "parse_cache"),
+    PARSE_CACHE_MAX_SIZE = 64 * 1024 * 1024, # Bytes, least recently used entries are evicted above it.
+    TRANSLATION_MEMO_PATH = connect_pathes(SOURCES_FOLDER, "translation_memo.json"),
+    GENDER_INDEX_FOLDER = SOURCES_FOLDER, # Name to gender index of each country, built on the first lookup.
+    DOCUMENT_CACHE_TTL = 300.0, # Seconds a cached user_data document or listing is trusted, 0 disables the cache.
+    DOCUMENT_CACHE_MAX_ENTRIES = 64, # Least recently used documents and listings are evicted above it.
+    DOCUMENT_CACHE_WATCH = True, # Invalidate the cache with a change stream, if the server supports it. (Replica sets only)
+)
+NETWORK_DC = NetworkDC(
+    POOL_CONNECTIONS = 8, # Number of hosts that keep their connections alive.
+    POOL_MAXSIZE = 4, # Connections kept alive per host.
+    CONNECT_TIMEOUT = 5.0, # Seconds, default of every request.
+    READ_TIMEOUT = 20.0, # Seconds, default of every request.
+    RETRY_TOTAL = 3, # Retries of the idempotent requests. (POST is never retried)
+    RETRY_BACKOFF_FACTOR = 0.5, # Seconds, doubled on each retry.
+    RETRY_STATUS_FORCELIST = (429, 500, 502, 503, 504),
+)
+INSTRUMENTATION_DC = InstrumentationDC(
+    ENABLED = False, # Records the spans, the trace and the summary are written at the end.
+    TRACE_OUTPUT_PATH = connect_pathes(SOURCES_FOLDER, "trace.json"), # Chrome trace event format, open it on chrome://tracing or ui.perfetto.dev
+    PROFILED_SPANS = (), # Names of the spans profiled with cProfile on DEBUG mode. (EXMP: ("login.parse",))
+    PROFILE_OUTPUT_FOLDER = connect_pathes(SOURCES_FOLDER, "profiles"),
 )
 GUI_DC = GUIDC(
     TITLE = "Transcript Manager",
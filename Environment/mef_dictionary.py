@@ -0,0 +1,55 @@
+# Set up the turkish names of the MEF University faculties, departments and the other transcript values, for translating them without network.
+mef_vocabulary = {
+    # Faculties
+    "Faculty of Engineering" : "Mühendislik Fakültesi",
+    "Faculty of Economics, Administrative and Social Sciences" : "İktisadi, İdari ve Sosyal Bilimler Fakültesi",
+    "Faculty of Law" : "Hukuk Fakültesi",
+    "Faculty of Education" : "Eğitim Fakültesi",
+    "Faculty of Art, Design and Architecture" : "Sanat, Tasarım ve Mimarlık Fakültesi",
+    "School of Foreign Languages" : "Yabancı Diller Yüksekokulu",
+    "Graduate School" : "Lisansüstü Eğitim Enstitüsü",
+
+    # Engineering departments
+    "Computer Engineering" : "Bilgisayar Mühendisliği",
+    "Electrical and Electronics Engineering" : "Elektrik-Elektronik Mühendisliği",
+    "Industrial Engineering" : "Endüstri Mühendisliği",
+    "Civil Engineering" : "İnşaat Mühendisliği",
+    "Mechanical Engineering" : "Makine Mühendisliği",
+
+    # Economics, administrative and social sciences departments
+    "Economics" : "Ekonomi",
+    "Business Administration" : "İşletme",
+    "Political Science and International Relations" : "Siyaset Bilimi ve Uluslararası İlişkiler",
+    "Psychology" : "Psikoloji",
+    "Entrepreneurship" : "Girişimcilik",
+
+    # Law departments
+    "Law" : "Hukuk",
+
+    # Education departments
+    "Guidance and Psychological Counseling" : "Rehberlik ve Psikolojik Danışmanlık",
+    "English Language Teaching" : "İngilizce Öğretmenliği",
+    "Mathematics Teaching" : "Matematik Öğretmenliği",
+    "Elementary Mathematics Teaching" : "İlköğretim Matematik Öğretmenliği",
+    "Science Teaching" : "Fen Bilgisi Öğretmenliği",
+    "Primary School Teaching" : "Sınıf Öğretmenliği",
+    "Early Childhood Education" : "Okul Öncesi Öğretmenliği",
+
+    # Art, design and architecture departments
+    "Architecture" : "Mimarlık",
+    "Interior Architecture and Environmental Design" : "İç Mimarlık ve Çevre Tasarımı",
+    "Industrial Design" : "Endüstriyel Tasarım",
+    "Digital Game Design" : "Dijital Oyun Tasarımı",
+
+    # Languages of instruction
+    "English" : "İngilizce",
+    "Turkish" : "Türkçe",
+
+    # Student statuses
+    "Active" : "Aktif",
+    "Passive" : "Pasif",
+    "Graduated" : "Mezun",
+    "Registration Frozen" : "Kayıt Dondurdu",
+    "Withdrawn" : "Kaydı Silindi",
+    "Exchange Student" : "Değişim Öğrencisi",
+}
@@ -1,4 +1,5 @@
 from    Environment     import  ASSETS_DC, GUI_DC, to_turkish # -> Environment variables
+from    Utilities       import  coerce_course # -> Typed course fields
 from    tkinter         import  messagebox # -> Interract with user
 import  customtkinter   as      ctk # -> GUI
 
@@ -339,8 +340,8 @@ class CourseAdder(ctk.CTkToplevel) :
             "course_grade_point" : self.new_course_grade_point_entry.get()
         }
 
-        # Set the result.
-        self.result = new_course
+        # Set the result, with the typed fields of the course lists.
+        self.result = coerce_course(new_course)
 
         # Destroy the dialog.
         self.destroy()
@@ -1,4 +1,5 @@
 from    Environment     import  ASSETS_DC, GUI_DC, to_turkish # -> Environment variables
+from    Utilities       import  coerce_course # -> Typed course fields
 from    tkinter         import  messagebox # -> Interract with user
 import  customtkinter   as      ctk # -> GUI
 
@@ -220,9 +221,9 @@ class CourseRemover(ctk.CTkToplevel) :
             if course["course_code"] == use_code :
                 self.course_name = ctk.StringVar(value=course["course_name"])
                 self.course_lang = ctk.StringVar(value=course["course_lang"])
-                self.course_credit = ctk.StringVar(value=course["course_credit"])
+                self.course_credit = ctk.StringVar(value=str(course["course_credit"]))
                 self.course_grade = ctk.StringVar(value=course["course_grade"])
-                self.course_grade_point = ctk.StringVar(value=course["course_grade_point"])
+                self.course_grade_point = ctk.StringVar(value=str(course["course_grade_point"]))
                 break
         
         # Load the course items. & Configure the widgets.
@@ -277,8 +278,8 @@ class CourseRemover(ctk.CTkToplevel) :
             "course_grade_point" : self.course_grade_point_entry.get()
         }
 
-        # Set the result.
-        self.result = deleted_course
+        # Set the result, with the typed fields of the course lists.
+        self.result = coerce_course(deleted_course)
 
         # Destroy the window.
         self.destroy()
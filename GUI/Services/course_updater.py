@@ -1,4 +1,5 @@
 from    Environment     import  ASSETS_DC, GUI_DC, to_turkish # -> Environment variables
+from    Utilities       import  coerce_course # -> Typed course fields
 from    tkinter         import  messagebox # -> Interract with user
 import  customtkinter   as      ctk # -> GUI
 
@@ -182,9 +183,9 @@ class CourseUpdater(ctk.CTkToplevel) :
         # Set the new course values.
         self.new_course_name = ctk.StringVar(value=self.selected_course["course_name"])
         self.new_course_lang = ctk.StringVar(value=self.selected_course["course_lang"])
-        self.new_course_credit = ctk.StringVar(value=self.selected_course["course_credit"])
+        self.new_course_credit = ctk.StringVar(value=str(self.selected_course["course_credit"]))
         self.new_course_grade = ctk.StringVar(value=self.selected_course["course_grade"])
-        self.new_course_grade_point = ctk.StringVar(value=self.selected_course["course_grade_point"])
+        self.new_course_grade_point = ctk.StringVar(value=str(self.selected_course["course_grade_point"]))
 
         # Create the widgets. Use the new course values.
         course_name_label = ctk.CTkLabel(self.updater_container, text=self._get_text("New Course Name"),
@@ -368,8 +369,8 @@ class CourseUpdater(ctk.CTkToplevel) :
             "course_grade_point" : self.new_course_grade_point_entry.get()
         }
 
-        # Set the result.
-        self.result = updated_course
+        # Set the result, with the typed fields of the course lists.
+        self.result = coerce_course(updated_course)
 
         # Destroy the window.
         self.destroy()
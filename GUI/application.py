@@ -1,7 +1,8 @@
 from    GUI             import  AchievementAnalyzer, GradeUpdater, StatAnalyzer # -> Program frames
 from    GUI             import  UserAuthenticator, DataLoader, DataSaver # -> Service frames
-from    Utilities       import  get_gender, generate_pdf, translate_text # -> Utilitiy functions
-from    Environment     import  ASSETS_DC, SELENIUM_DC, GUI_DC # -> Environment variables
+from    Utilities       import  LoginPipeline, lazy_import # -> Utilitiy functions
+from    Utilities       import  traced # -> Instrumentation
+from    Environment     import  ASSETS_DC, GUI_DC, DATABASE_DC # -> Environment variables
 from    PIL             import  Image # -> Image processing
 from    tkinter         import  messagebox # -> Interact with user
 from    datetime        import  datetime # -> Get current date
@@ -9,6 +10,9 @@ import  customtkinter   as      ctk # -> GUI
 import  copy # -> Copy objects without reference
 import  os # -> Get current working directory
 
+# Fpdf is imported on the first export.
+pdf_export = lazy_import("Utilities.pdf_export") # -> PDF export
+
 class ApplicationFrame(ctk.CTkFrame) :
 
     def __init__(self, parent : ctk.CTkFrame, root : ctk.CTk, DEBUG : bool = False, *args, **kwargs) -> None:
@@ -45,6 +49,9 @@ class ApplicationFrame(ctk.CTkFrame) :
         self.__load_controller()
         self.__load_programs()
 
+        # Fill the pieces which are still on their way, as they arrive.
+        self.after(100, self.__poll_login_pipeline)
+
     def __load_containers(self) -> None:
         """
         Loads containers into class fields.
@@ -136,10 +143,11 @@ class ApplicationFrame(ctk.CTkFrame) :
 
         # Create student photo label.
         # If online login approved, than add the user photo to available photos. To show it on the label.
-        self.available_photos = ASSETS_DC.GENDERS_PHOTO_PATH
-        if os.path.exists(SELENIUM_DC.USER_PHOTO_OUTPUT_PATH) :
-            self.available_photos["user_photo"] = SELENIUM_DC.USER_PHOTO_OUTPUT_PATH
-            self.current_user_photo_path = SELENIUM_DC.USER_PHOTO_OUTPUT_PATH
+        self.available_photos = dict(ASSETS_DC.GENDERS_PHOTO_PATH) # Copy, so the photo of a user does not leak to the next one.
+        user_photo_path = self.root.get_user_photo_path()
+        if user_photo_path is not None and os.path.exists(user_photo_path) :
+            self.available_photos["user_photo"] = user_photo_path
+            self.current_user_photo_path = user_photo_path
         else :
             self.current_user_photo_path = ASSETS_DC.GENDERS_PHOTO_PATH[self.student_gender]
         self.student_photo = ctk.CTkImage(light_image=Image.open(self.current_user_photo_path), dark_image=Image.open(self.current_user_photo_path), size=GUI_DC.STUDENT_PHOTO_SIZE)
@@ -183,23 +191,23 @@ class ApplicationFrame(ctk.CTkFrame) :
 
         #faculty_department_label = ctk.CTkLabel(self.texts_container, text=self._get_text("Faculty / Department"))
         #faculty_department_label.grid(row=1, column=0)
-        faculty_department_label_value = ctk.CTkLabel(self.texts_container, text=self.student_faculty.split(" / ")[0])
-        faculty_department_label_value.grid(row=1, column=0)
+        self.faculty_department_label_value = ctk.CTkLabel(self.texts_container, text=self.student_faculty.split(" / ")[0])
+        self.faculty_department_label_value.grid(row=1, column=0)
 
         #program_name_label = ctk.CTkLabel(self.texts_container, text=self._get_text("Program Name"))
         #program_name_label.grid(row=1, column=2)
-        program_name_label_value = ctk.CTkLabel(self.texts_container, text=self.student_department)
-        program_name_label_value.grid(row=1, column=1)
+        self.program_name_label_value = ctk.CTkLabel(self.texts_container, text=self.student_department)
+        self.program_name_label_value.grid(row=1, column=1)
 
         #language_of_instruction_label = ctk.CTkLabel(self.texts_container, text=self._get_text("Language of Instruction"))
         #language_of_instruction_label.grid(row=1, column=4)
-        language_of_instruction_label_value = ctk.CTkLabel(self.texts_container, text=self.language_of_instruction)
-        language_of_instruction_label_value.grid(row=1, column=2)
+        self.language_of_instruction_label_value = ctk.CTkLabel(self.texts_container, text=self.language_of_instruction)
+        self.language_of_instruction_label_value.grid(row=1, column=2)
 
         #student_status_label = ctk.CTkLabel(self.texts_container, text=self._get_text("Student Status"))
         #student_status_label.grid(row=1, column=6)
-        student_status_label_value = ctk.CTkLabel(self.texts_container, text=self.student_status)
-        student_status_label_value.grid(row=1, column=3)
+        self.student_status_label_value = ctk.CTkLabel(self.texts_container, text=self.student_status)
+        self.student_status_label_value.grid(row=1, column=3)
 
         # Configure labels.
         for acurrent_text_label in self.texts_container.winfo_children() :
@@ -254,6 +262,7 @@ class ApplicationFrame(ctk.CTkFrame) :
             )
             current_button.grid_configure(padx=GUI_DC.GENERAL_PADDING, pady=GUI_DC.GENERAL_PADDING, sticky="nsew")
 
+    @traced("ApplicationFrame.__load_programs", "gui")
     def __load_programs(self) -> None:
         """
         This method creates the program selection container and its widgets.
@@ -415,20 +424,62 @@ class ApplicationFrame(ctk.CTkFrame) :
         self.student_status : str = given_user_info["student_status"]
         self.student_surname : str = given_user_info["student_surname"]
         
-        # Load rest of user info into class fields. (Which are translatable.)
-        if self.parsing_language == "tr" :
-            self.student_faculty = translate_text(self.student_faculty)
-            self.student_department = translate_text(self.student_department)
-            self.student_status = translate_text(self.student_status)
-            self.language_of_instruction = translate_text(self.language_of_instruction)
-        if self.parsing_language == "en" :
-            self.student_faculty = translate_text(self.student_faculty, "tr", "en")
-            self.student_department = translate_text(self.student_department, "tr", "en")
-            self.student_status = translate_text(self.student_status, "tr", "en")
-            self.language_of_instruction = translate_text(self.language_of_instruction, "tr", "en")
-
-        # Get the gender of the student by using their name.
-        self.student_gender = get_gender(name=self.student_name)
+        # The gender is unknown until the pipeline detects it.
+        self.student_gender : str = "unknown"
+
+        # Translations and the gender detection run on the login pipeline, which is started by the login. Take the ones which are already finished.
+        self.login_pipeline : LoginPipeline = self.root.start_login_pipeline(given_user_info, self.parsing_language)
+        self.login_pipeline.reset_delivery()
+        self.__apply_login_results(self.login_pipeline.collect())
+
+    def __apply_login_results(self, results : dict) -> None:
+        """
+        Applies the finished results of the login pipeline into class fields, and into the labels if they are created.
+        @Parameters:
+            results - Required : Finished results by their names. (dict) -> Which is collected from the login pipeline.
+        @Returns:
+            None
+        """
+        # Apply the translations, failed ones keep the original text.
+        for field_name in LoginPipeline.TRANSLATED_FIELDS :
+            if results.get(field_name) is not None :
+                setattr(self, field_name, results[field_name])
+        if results.get("student_gender") is not None :
+            self.student_gender = results["student_gender"]
+
+        # Nothing to refresh before the labels are created.
+        if not hasattr(self, "student_status_label_value") :
+            return
+
+        # Refresh the labels.
+        self.faculty_department_label_value.configure(text=self.student_faculty.split(" / ")[0])
+        self.program_name_label_value.configure(text=self.student_department)
+        self.language_of_instruction_label_value.configure(text=self.language_of_instruction)
+        self.student_status_label_value.configure(text=self.student_status)
+
+        # Show the gender photo, if the placeholder one is on the screen.
+        if "student_gender" in results and self.current_user_photo_path == ASSETS_DC.GENDERS_PHOTO_PATH["unknown"] :
+            self.current_user_photo_path = ASSETS_DC.GENDERS_PHOTO_PATH.get(self.student_gender, self.current_user_photo_path)
+            self.student_photo = ctk.CTkImage(light_image=Image.open(self.current_user_photo_path), dark_image=Image.open(self.current_user_photo_path), size=GUI_DC.STUDENT_PHOTO_SIZE)
+            self.student_photo_label.configure(image=self.student_photo, text=None) # Text attirbute added for ctk bug.
+            self.student_photo_label.image = self.student_photo
+
+    def __poll_login_pipeline(self) -> None:
+        """
+        Applies the results of the login pipeline as they arrive, until all of them are applied.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        # Stop if the frame is destroyed. (EXMP: restarted)
+        if not self.winfo_exists() :
+            return
+
+        # Apply the arrived ones, than check again later.
+        self.__apply_login_results(self.login_pipeline.collect())
+        if not self.login_pipeline.is_finished() :
+            self.after(100, self.__poll_login_pipeline)
 
     def __create_user_info(self) -> dict:
         """
@@ -546,9 +597,11 @@ class ApplicationFrame(ctk.CTkFrame) :
             self.after(500, lambda : self.load_db_data_button.configure(text=self._get_text("Load Data"), fg_color=GUI_DC.BUTTON_LIGHT_PURPLE, state="normal"))
             return
 
-        # Initialize the match data.
+        # Initialize the match data. Use the list prefetched by the login pipeline, if it is there in time. (Only the names, the dates and the sizes)
         expected_owner_id = self.student_national_id
-        document_list = list(self.root.db_client.user_data.get_available_documents(expected_owner_id))
+        document_list = self.login_pipeline.result("available_documents", timeout=DATABASE_DC.SERVER_SELECTION_TIMEOUT)
+        if document_list is None :
+            document_list = self.root.db_client.user_data.list_documents(expected_owner_id)
 
         # If no data found, fix the button and cancel operation.
         if document_list == [] :
@@ -557,10 +610,13 @@ class ApplicationFrame(ctk.CTkFrame) :
             self.after(500, lambda : self.load_db_data_button.configure(text=self._get_text("Load Data"), fg_color=GUI_DC.BUTTON_LIGHT_PURPLE, state="normal"))
             return
 
-        # If data found, load the available data.
+        # If data found, list the available data. (EXMP: "Scenario 1 | 01/06/2023 12:00:00 | 24.5 KB")
         available_documents = {}
         for document in document_list :
-            available_documents[document["document_name"]] = document
+            option_parts = [document["document_name"], document.get("transcript_manager_date")]
+            if document.get("document_size") is not None :
+                option_parts.append(f"{document['document_size'] / 1024:.1f} KB")
+            available_documents[" | ".join(str(part) for part in option_parts if part)] = document["document_name"]
 
         # Ask the user to select a data.
         options = list(available_documents.keys())
@@ -573,8 +629,13 @@ class ApplicationFrame(ctk.CTkFrame) :
             self.after(500, lambda : self.load_db_data_button.configure(text=self._get_text("Load Data"), fg_color=GUI_DC.BUTTON_LIGHT_PURPLE, state="normal"))
             return
         
-        # If data selected, load the data.
-        selected_user_data_document = available_documents[selected_option]
+        # If data selected, fetch and load the data. If it is deleted in the meantime, cancel operation.
+        selected_user_data_document = self.root.db_client.user_data.get_document(expected_owner_id, available_documents[selected_option])
+        if selected_user_data_document is None :
+            messagebox.showerror(self._get_text("Error"), self._get_text("No data found for this user"))
+            self.load_db_data_button.configure(text=self._get_text("No Data"), fg_color=GUI_DC.BUTTON_LIGHT_RED)
+            self.after(500, lambda : self.load_db_data_button.configure(text=self._get_text("Load Data"), fg_color=GUI_DC.BUTTON_LIGHT_PURPLE, state="normal"))
+            return
         self.root.set_current_data(user_data_document=selected_user_data_document)
         self.__load_user_data(selected_user_data_document)
 
@@ -602,9 +663,11 @@ class ApplicationFrame(ctk.CTkFrame) :
             self.after(500, lambda : self.save_db_data_button.configure(text=self._get_text("Save Data"), fg_color=GUI_DC.BUTTON_LIGHT_YELLOW, state="normal"))
             return
 
-        # Initialize the match data.
+        # Initialize the match data. Use the list prefetched by the login pipeline, if it is there in time.
         expected_owner_id = self.student_national_id
-        document_list = list(self.root.db_client.user_data.get_available_documents(expected_owner_id))
+        document_list = self.login_pipeline.result("available_documents", timeout=DATABASE_DC.SERVER_SELECTION_TIMEOUT)
+        if document_list is None :
+            document_list = self.root.db_client.user_data.list_documents(expected_owner_id)
 
         # Collect the existing document names.
         existing_document_names = []
@@ -627,13 +690,23 @@ class ApplicationFrame(ctk.CTkFrame) :
         # Update the porgram execution date.
         self.program_execution_date = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
 
+        # Wait for the translations, the saved info must not be half translated.
+        self.__apply_login_results(self.login_pipeline.collect(wait=True))
+
         # Create the user data & info documents.
         new_user_data_document = self.__create_user_data()
         user_info_document = self.__create_user_info()
 
-        # Push the documents to the database.
+        # Push the documents to the database. The prefetched document list is stale after it.
         self.root.db_client.user_info.push_init(user_info_document)
-        self.root.db_client.user_data.push_init(new_user_data_document)
+        push_result = self.root.db_client.user_data.push_init(new_user_data_document)
+        self.login_pipeline.invalidate_documents()
+
+        # If the document is not written, fix the button and cancel operation.
+        if push_result["status"] == self.root.db_client.user_data.PUSH_FAILED :
+            self.save_db_data_button.configure(text=self._get_text("Error"), fg_color=GUI_DC.BUTTON_LIGHT_RED)
+            self.after(500, lambda : self.save_db_data_button.configure(text=self._get_text("Save Data"), fg_color=GUI_DC.BUTTON_LIGHT_YELLOW, state="normal"))
+            return
 
         # Set the current data. For root to remember.
         self.root.set_current_data(user_info_document, new_user_data_document)
@@ -683,7 +756,7 @@ class ApplicationFrame(ctk.CTkFrame) :
 
             # Export the data. By direct call to utility method generate_pdf.
             try :
-                generate_pdf(
+                pdf_export.generate_pdf(
                     user_info_document = current_user_info_document, 
                     user_data_document = current_user_data_document, 
                     user_photo_path = self.current_user_photo_path,
@@ -1,7 +1,8 @@
 from    Utilities       import  get_gif_frame_count, authenticate, validate_transcript # -> Utilitiy functions
-from    Utilities       import  OfflineParser, OnlineParser # -> Utilitiy classes
+from    Utilities       import  OfflineParser, OnlineParser, get_browser_pool # -> Utilitiy classes
+from    Utilities       import  span, traced # -> Instrumentation
 from    PIL             import  Image # -> Image processing
-from    Environment     import  ASSETS_DC, GUI_DC # -> Environment variables
+from    Environment     import  ASSETS_DC, GUI_DC, SELENIUM_DC # -> Environment variables
 import  customtkinter   as      ctk # -> GUI
 import  threading # -> Split long processes into threads
 import  time # -> Simulate a long process
@@ -9,6 +10,7 @@ import  os # -> Get current working directory
 
 class LoginFrame(ctk.CTkFrame) :
 
+    @traced("LoginFrame.__init__", "gui")
     def __init__(self, parent : ctk.CTkFrame, root : ctk.CTk, DEBUG : bool = False, *args, **kwargs) -> None:
         """
         Constructor method for LoginFrame class. Used to initialize main window of the login.
@@ -40,6 +42,20 @@ class LoginFrame(ctk.CTkFrame) :
         self.__load_mef_label()
         self.__load_input_field()
 
+        # Warm the browsers up in the background, while the user is typing the credentials. (Only if they will be used)
+        self.__warm_up_browsers()
+
+    def __warm_up_browsers(self) -> None:
+        """
+        Method to warm the browsers up, only on the online tab of the selenium backend. The http backend needs a browser only on its fallback, which launches its own.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        if self.tab_view.get() == "Online Login" and SELENIUM_DC.OLEXER_BACKEND == "selenium" :
+            get_browser_pool(warm_up=True)
+
     def __load_containers(self) -> None:
         """
         Method to load the main containers.
@@ -119,7 +135,8 @@ class LoginFrame(ctk.CTkFrame) :
                                        segmented_button_unselected_hover_color=GUI_DC.SECONDARY_DARK_BACKGROUND,
                                        corner_radius=25,
                                        width=290,
-                                       height=350
+                                       height=350,
+                                       command=self.__warm_up_browsers
         )
         self.tab_view.grid(row=1, column=0, sticky="nsew", padx=GUI_DC.INNER_PADDING, pady=GUI_DC.INNER_PADDING)
         ctk.CTkFrame(self.input_field_container, width=0, height=0, fg_color=GUI_DC.LIGHT_BACKGROUND, bg_color=GUI_DC.LIGHT_BACKGROUND).grid(row=2, column=0, pady=GUI_DC.INNER_PADDING//2, padx=GUI_DC.INNER_PADDING)
@@ -346,14 +363,15 @@ class LoginFrame(ctk.CTkFrame) :
             if self.tab_view.get() == "Online Login" :
                 parser = OnlineParser(username=self.username.get(), password=self.password.get())
             elif self.tab_view.get() == "Offline Login" :
-                parser = OfflineParser(path_to_file=self.path_to_transcript.get())
+                parser = OfflineParser(path_to_file=self.path_to_transcript.get(), use_cache=True)
                 # Simulate a long process by fake sleeping for 3 seconds.
                 time.sleep(2.3) 
             else :
                 raise ValueError("Invalid Execution Mode")
 
             # Parse the transcript.
-            data = parser.get_transcript_data()
+            with span("login.parse", "parser", mode=self.tab_view.get()) :
+                data = parser.get_transcript_data()
 
             # Create user info and user data documents.
             user_info_document, user_data_document = self.root.db_client.documentisize(data)
@@ -365,10 +383,16 @@ class LoginFrame(ctk.CTkFrame) :
             # Set the current data to the root.
             self.root.set_current_data(user_info_document, user_data_document)
 
+            # Start the translations, the gender detection and the document prefetch now. They go on while the application frame is built. (On the Tk thread, it sets the root state)
+            self.root.after(0, self.root.start_login_pipeline, user_info_document, user_data_document["parsing_language"])
+
             # Set the authentication status to the root.
             is_user_authenticated = user_data_document["parsing_type"] != "offline"
             self.root.set_authication_status(is_user_authenticated)
 
+            # Set the user photo to the root, only the online logins have one.
+            self.root.set_user_photo_path(parser.user_photo_path if isinstance(parser, OnlineParser) else None)
+
         # Load the thread.
         self.thread = threading.Thread(target=start_parse, daemon=True)
         # Start the thread.
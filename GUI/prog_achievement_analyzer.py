@@ -1,10 +1,13 @@
 from    Utilities                           import  calculate_performance, generate_gradient_colors, filter_by # -> Utility functions
 from    tkinter                             import  Label as TkinterLabel, Frame as TkinterFrame # -> Manipulate matplotlib widgets.
-from    matplotlib.backends.backend_tkagg   import  FigureCanvasTkAgg, NavigationToolbar2Tk # -> Packing plot and setting toolbar
+from    Utilities                           import  lazy_import # -> Deferred heavy imports
 from    Environment                         import  GUI_DC # -> Environment variables
-from    matplotlib.figure                   import  Figure # -> Plotting and creating figure
 import  customtkinter                       as      ctk # -> Custom tkinter library
 
+# Matplotlib is imported when the tab is opened for the first time.
+backend_tkagg = lazy_import("matplotlib.backends.backend_tkagg") # -> Packing plot and setting toolbar
+matplotlib_figure = lazy_import("matplotlib.figure") # -> Plotting and creating figure
+
 class AchievementAnalyzer(ctk.CTkFrame) :
 
     def __init__(self, application_container : ctk.CTkFrame, parent : ctk.CTkFrame, root : ctk.CTk, current_user_data : dict, DEBUG : bool = False, *args, **kwargs) -> None:
@@ -262,7 +265,7 @@ class AchievementAnalyzer(ctk.CTkFrame) :
         self.sbp_packable_frame.pack(fill="both", expand=True)
 
         # Create semester based plot figure and configure it
-        self.semester_based_plot_figure = Figure(figsize=(5, 5), dpi=100, tight_layout=True)
+        self.semester_based_plot_figure = matplotlib_figure.Figure(figsize=(5, 5), dpi=100, tight_layout=True)
         self.semester_based_plot_figure.subplots_adjust(left=0.12, right=0.97, bottom=0.135, top=0.93)
         self.semester_based_plot_figure.patch.set_facecolor(GUI_DC.LIGHT_BACKGROUND)
         self.semester_based_plot_figure.patch.set_alpha(0.5)
@@ -295,12 +298,12 @@ class AchievementAnalyzer(ctk.CTkFrame) :
         self.semester_based_plot.set_xticklabels(labels=self.semester_based_plot_data["semester_name"], rotation=25, ha="right", fontsize=8)
 
         # Setup the canvas and pack it.
-        self.semester_based_plot_canvas = FigureCanvasTkAgg(self.semester_based_plot_figure, self.sbp_packable_frame)
+        self.semester_based_plot_canvas = backend_tkagg.FigureCanvasTkAgg(self.semester_based_plot_figure, self.sbp_packable_frame)
         self.semester_based_plot_canvas.draw()
         self.semester_based_plot_canvas.get_tk_widget().pack(fill="both", expand=True)
     
         # Setup the toolbar and pack it.
-        self.semester_based_plot_toolbar = NavigationToolbar2Tk(self.semester_based_plot_canvas, self.sbp_packable_frame)
+        self.semester_based_plot_toolbar = backend_tkagg.NavigationToolbar2Tk(self.semester_based_plot_canvas, self.sbp_packable_frame)
         # Set the coloring
         self.semester_based_plot_toolbar.configure(background=GUI_DC.DARK_BACKGROUND)
         # Find the wanted widgets and pack them. Remove the rest.
@@ -332,7 +335,7 @@ class AchievementAnalyzer(ctk.CTkFrame) :
         self.cbp_packable_frame.pack(fill="both", expand=True)
 
         # Create course based plot figure and configure it
-        self.course_based_plot_figure = Figure(figsize=(5, 5), dpi=100, tight_layout=True)
+        self.course_based_plot_figure = matplotlib_figure.Figure(figsize=(5, 5), dpi=100, tight_layout=True)
         self.course_based_plot_figure.subplots_adjust(left=0.12, right=0.97, bottom=0.135, top=0.93)
         self.course_based_plot_figure.patch.set_facecolor(GUI_DC.LIGHT_BACKGROUND)
         self.course_based_plot_figure.patch.set_alpha(0.5)
@@ -368,12 +371,12 @@ class AchievementAnalyzer(ctk.CTkFrame) :
         self.course_based_plot.set_yticklabels(self.all_grades)
 
         # Setup the canvas and pack it.
-        self.course_based_plot_canvas = FigureCanvasTkAgg(self.course_based_plot_figure, self.cbp_packable_frame)
+        self.course_based_plot_canvas = backend_tkagg.FigureCanvasTkAgg(self.course_based_plot_figure, self.cbp_packable_frame)
         self.course_based_plot_canvas.draw()
         self.course_based_plot_canvas.get_tk_widget().pack(fill="both", expand=True)
 
         # Setup the toolbar and pack it.
-        self.course_based_plot_toolbar = NavigationToolbar2Tk(self.course_based_plot_canvas, self.cbp_packable_frame)
+        self.course_based_plot_toolbar = backend_tkagg.NavigationToolbar2Tk(self.course_based_plot_canvas, self.cbp_packable_frame)
         # Set the coloring
         self.course_based_plot_toolbar.configure(background=GUI_DC.DARK_BACKGROUND)
         # Find the wanted widgets and pack them. Remove the rest.
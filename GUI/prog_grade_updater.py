@@ -7,6 +7,7 @@ from Utilities import ( # -> Utility functions
     add_course, # -> Add a course to a course list
     filter_by, # -> Filter a course list by a key
     sort_by, # -> Sort a course list by a key
+    materialize_course_list, # -> Replay the changes on a course list
 )
 from GUI import ( # -> Service frames
     FilterSelecter, # -> Filter selecter service
@@ -565,14 +566,9 @@ class GradeUpdater(ctk.CTkFrame) :
         # Sort feature variables. -> It is done to make the filter selecter look better.
         for key in available_filterings :
             current_value_list = available_filterings[key]
-            # if key is "course_grade_point", make every element is float, then sort, and then convert back to string
-            if key == "course_grade_point" :
-                current_value_list = [float(value) for value in current_value_list]
-                current_value_list.sort()
-                current_value_list = [str(value) for value in current_value_list]
-            else :
-                # If key is not "course_grade_point", than sort normally.
-                current_value_list.sort()
+            # Credits and grade points are numbers, they are sorted numerically. Than convert them to string for the combobox.
+            current_value_list.sort()
+            current_value_list = [str(value) for value in current_value_list]
             # Update available_filterings.
             available_filterings[key] = current_value_list
 
@@ -588,16 +584,7 @@ class GradeUpdater(ctk.CTkFrame) :
 
         # Compare two filtering values, when change detected, rescale the whole course list to avoid data loss & bugs.
         if previous_filtering != current_filtering :
-            self.modified_course_list = self.original_course_list.copy()
-
-            # Apply operations by one by.
-            for course in self.added_course_list :
-                self.modified_course_list = add_course(self.modified_course_list, course)
-            for course in self.subtracted_course_list :
-                self.modified_course_list = subtract_course(self.modified_course_list, course["course_code"])
-            for course in self.updated_course_list :
-                self.modified_course_list = update_course(self.modified_course_list, course)
-            self.modified_course_list = sort_by(self.modified_course_list, self.sorting)
+            self.modified_course_list = materialize_course_list(self.original_course_list, self.added_course_list, self.subtracted_course_list, self.updated_course_list, self.sorting)
 
         # Lastly, apply filtering.
         for current_filter in self.filtering :
@@ -1,10 +1,12 @@
-from    Environment     import  GUI_DC, ASSETS_DC, to_turkish # -> Environment variables
+from    Environment     import  GUI_DC, ASSETS_DC, DATABASE_DC, to_turkish # -> Environment variables
 from    GUI             import  LoginFrame, ApplicationFrame # -> GUI
-from    Utilities       import  MongoClient # -> Database and parsing
+from    Utilities       import  get_mongo_client, get_local_client, LoginPipeline, shutdown_browser_pool # -> Database, login pipeline and parsing
+from    Utilities       import  traced # -> Instrumentation
 import  customtkinter   as      ctk # -> GUI
 
 class TranscriptManager(ctk.CTk) :
 
+    @traced("TranscriptManager.__init__", "gui")
     def __init__(self, DEBUG : bool = False, *args, **kwargs) -> None:
         """
         Constructor of the TranscriptManager. Initializes the driver code.
@@ -28,10 +30,18 @@ class TranscriptManager(ctk.CTk) :
 
         # Set class variables.
         self.DEBUG = DEBUG
-        self.db_client = MongoClient()
+        if DATABASE_DC.LOCAL_STORE_ENABLED :
+            # Local store first, the database is synced in the background.
+            self.db_client = get_local_client()
+        else :
+            self.db_client = get_mongo_client()
+        # Keep the document cache of the database fresh, the sync worker of the local store reads through it too.
+        self.db_client.watch_changes()
         self.user_info_document = None
         self.user_data_document = None
         self.is_user_authenticated = False
+        self.user_photo_path = None
+        self.login_pipeline = None
 
         # Configure window's gridding.
         self.grid_rowconfigure(0, weight=1)
@@ -147,6 +157,43 @@ class TranscriptManager(ctk.CTk) :
         # Return the authication status.
         return self.authication_status
 
+    def set_user_photo_path(self, user_photo_path : str) -> None:
+        """
+        Sets the photo path of the current user.
+        @Parameters:
+            user_photo_path - Required : Path of the downloaded photo, None if there is no photo. (str) -> Which is used to show the user photo.
+        @Return:
+            None
+        """
+        # Update the user photo path.
+        self.user_photo_path = user_photo_path
+    def get_user_photo_path(self) -> str:
+        """
+        Gets the photo path of the current user.
+        @Parameters:
+            None
+        @Return:
+            user_photo_path - Path of the downloaded photo, None if there is no photo. (str) -> Which is used to show the user photo.
+        """
+        # Return the user photo path.
+        return self.user_photo_path
+
+    def start_login_pipeline(self, user_info_document : dict, parsing_language : str) -> LoginPipeline:
+        """
+        Starts the post login steps (translations, gender detection, document list prefetch) in the background. The running one is reused for the same user info.
+        @Parameters:
+            user_info_document - Required : The user info document. (dict) -> Which is used to get the translated fields.
+            parsing_language - Required : The parsing language. (str) -> Which is used to select the translation direction.
+        @Return:
+            login_pipeline - The pipeline of the user info. (LoginPipeline) -> Which is used to collect the results.
+        """
+        # Start a new pipeline only if the user info is changed.
+        if self.login_pipeline is None or self.login_pipeline.key != LoginPipeline.make_key(user_info_document, parsing_language) :
+            owner_id = user_info_document["_id"]
+            self.login_pipeline = LoginPipeline(user_info_document, parsing_language, document_loader=lambda : self.db_client.user_data.list_documents(owner_id))
+        # Return the pipeline.
+        return self.login_pipeline
+
 
     def get_text(self, text : str, parsing_language : str) -> str:
         """
@@ -173,4 +220,6 @@ class TranscriptManager(ctk.CTk) :
         @Return:
             None
         """
+        # Close the warm browsers, they would outlive the application otherwise.
+        shutdown_browser_pool()
         self.destroy()
@@ -0,0 +1,137 @@
+from    os      import  path # -> Project root resolution
+import  sys # -> Import path manipulation
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from    Utilities.http_client   import  configure_http_client, reset_http_client # -> Injection point under test
+from    Utilities.utils     import  create_authenticated_session, check_internet_connection # -> Http helpers under test
+from    Utilities.lexer     import  OnlineParser # -> Http transcript backend under test
+from    Environment         import  UTILITIES_DC, PACKAGES_DC, SELENIUM_DC # -> Patched urls
+from    requests.adapters   import  HTTPAdapter # -> Stub transport
+from    unittest            import  mock # -> Url patches
+from    PIL                 import  Image # -> Stub user photo
+import  http.server # -> Stub SIS server
+import  threading # -> Server thread
+import  tempfile # -> Photo output
+import  unittest # -> Test runner
+import  io # -> Stub user photo
+
+USERNAME, PASSWORD = "041901001", "secret"
+
+HOME_PAGE = """<html><body><div></div><div><div><div></div><div></div><div><ul><li>
+<a><img src="/photo/1.jpg"></a><ul><li><a>Profile</a></li></ul>
+</li></ul></div></div></div></body></html>"""
+
+TRANSCRIPT_PAGE = """<html><body>
+<table><tr><td>MEF UNIVERSITY</td></tr></table>
+<table><tr><td>Date: 01/01/2024</td></tr></table>
+<table><tr><td>Student ID</td><td>041901001</td><td>National ID</td><td>12345678901</td></tr>
+<tr><td>Name</td><td>Ali</td><td>Surname</td><td>Veli</td></tr>
+<tr><td>Faculty / Department</td><td>Faculty of Engineering</td><td>Program Name</td><td>Computer Engineering</td></tr>
+<tr><td>Language of Instruction</td><td>English</td><td>Student Status</td><td>Active</td></tr></table>
+<table><tr><th colspan=6>2019-2020 Fall Semester</th></tr><tr><th>Course Code</th><th>Course Name</th><th>Lang</th><th>Credit</th><th>Grade</th><th>Point</th></tr>
+<tr><td>COMP 101</td><td>Intro to Programming</td><td>EN</td><td>6</td><td>A</td><td>24.0</td></tr>
+<tr><td>Semester Credits Attempted</td><td>6</td></tr><tr><td>Cumulative Credits Attempted</td><td>6</td></tr></table>
+<table><tr><td>address</td></tr></table><table><tr><td>grading</td></tr></table>
+</body></html>"""
+
+class StubSISHandler(http.server.BaseHTTPRequestHandler) :
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def _respond(self, status : int, body : bytes = b"", headers : dict = None) -> None:
+        self.send_response(status)
+        for header_name, header_value in (headers or {}).items() :
+            self.send_header(header_name, header_value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD" :
+            self.wfile.write(body)
+
+    def do_HEAD(self) -> None:
+        self._respond(200)
+
+    def do_POST(self) -> None:
+        # The login form, a right password sets the session cookie.
+        form = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode("utf-8")
+        headers = {"Set-Cookie" : "sid=1; Path=/"} if f"kullanici_adi={USERNAME}" in form and f"kullanici_sifre={PASSWORD}" in form else {}
+        self._respond(200, b"login", headers)
+
+    def do_GET(self) -> None:
+        # The login pages are open, the secure pages redirect back to the login without the session cookie.
+        if self.path.startswith("/auth/") :
+            return self._respond(200, b"login")
+        if "sid=1" not in self.headers.get("Cookie", "") :
+            return self._respond(302, headers={"Location" : "/auth/login"})
+        if self.path == "/" :
+            return self._respond(200, HOME_PAGE.encode("utf-8"), {"Content-Type" : "text/html; charset=utf-8"})
+        if self.path == "/transkript" :
+            return self._respond(200, TRANSCRIPT_PAGE.encode("utf-8"), {"Content-Type" : "text/html; charset=utf-8"})
+        if self.path == "/photo/1.jpg" :
+            photo = io.BytesIO()
+            Image.new("RGB", (8, 8)).save(photo, "JPEG")
+            return self._respond(200, photo.getvalue(), {"Content-Type" : "image/jpeg"})
+        self._respond(404)
+
+class TestHttpClient(unittest.TestCase) :
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StubSISHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        # The stub server is local, no retries and a short timeout.
+        self.adapter = HTTPAdapter(max_retries=0)
+        configure_http_client(adapter=self.adapter, timeout=(1.0, 2.0))
+        self.photo_directory = tempfile.TemporaryDirectory()
+        self.patches = [
+            mock.patch.object(UTILITIES_DC, "AUTH_LOG_URL", f"{self.base_url}/auth/login/ln/tr"),
+            mock.patch.object(UTILITIES_DC, "AUTH_SEC_URL", f"{self.base_url}/"),
+            mock.patch.object(SELENIUM_DC, "OLEXER_TRANSCRIPT_URL", f"{self.base_url}/transkript"),
+            mock.patch.object(SELENIUM_DC, "USER_PHOTO_OUTPUT_TEMPLATE", path.join(self.photo_directory.name, "user_photo_{user_key}.png")),
+            mock.patch.object(PACKAGES_DC, "CONNECTION_TEST_URL", self.base_url),
+        ]
+        for current_patch in self.patches :
+            current_patch.start()
+
+    def tearDown(self) -> None:
+        for current_patch in reversed(self.patches) :
+            current_patch.stop()
+        reset_http_client()
+        self.photo_directory.cleanup()
+
+    def test_authenticated_session(self) -> None:
+        session = create_authenticated_session(USERNAME, PASSWORD)
+        self.assertIsNotNone(session)
+        self.assertIs(session.get_adapter(self.base_url), self.adapter)
+        self.assertEqual(session.cookies.get("sid"), "1")
+        session.close()
+
+    def test_rejected_credentials(self) -> None:
+        self.assertIsNone(create_authenticated_session(USERNAME, "wrong"))
+
+    def test_internet_connection(self) -> None:
+        self.assertTrue(check_internet_connection())
+        with mock.patch.object(PACKAGES_DC, "CONNECTION_TEST_URL", "http://127.0.0.1:9") :
+            self.assertFalse(check_internet_connection(timeout=1.0))
+
+    def test_http_transcript_backend(self) -> None:
+        parser = OnlineParser(USERNAME, PASSWORD, backend="http")
+        # A fallback to the browser is a failure of the http backend here.
+        with mock.patch.object(parser, "_extract_over_browser", side_effect=AssertionError("fell back to the browser")) :
+            transcript_data = parser.get_transcript_data()
+        self.assertEqual(parser.used_backend, "http")
+        self.assertEqual(transcript_data["student_name"], "Ali")
+        self.assertTrue(path.isfile(parser.user_photo_path))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+from    os      import  path # -> Project root resolution
+import  sys # -> Import path manipulation
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from    Utilities.database  import  migrate_collection, rekey_base_documents, remove_unreferenced_base_documents, UserBase # -> Migration under test
+from    Utilities.transcript_schema import  SCHEMA_VERSION, encode_document, decode_document # -> Stored document schema
+import  hashlib # -> Version 1 base ids
+import  unittest # -> Test runner
+import  json # -> Version 1 base ids
+
+# mongomock is the in-memory server of the database benchmark too.
+import  mongomock # -> In-memory collections
+
+STRING_COURSE = {"course_code" : "COMP 101", "course_name" : "Programming", "course_lang" : "English", "course_credit" : "6", "course_grade" : "B+", "course_grade_point" : "19.8"}
+BROKEN_COURSE = {"course_code" : "HIST 101", "course_name" : "History", "course_lang" : "Turkish", "course_credit" : "-", "course_grade" : "W", "course_grade_point" : ""}
+
+class TestMigrateCollection(unittest.TestCase) :
+
+    def setUp(self) -> None:
+        self.collection = mongomock.MongoClient()["trman_test"]["user_data"]
+        self.collection.insert_many([
+            {"owner_id" : "10000000000", "document_name" : f"Scenario {document_index}", "original_course_list" : [STRING_COURSE, BROKEN_COURSE], "added_course_list" : [], "updated_course_list" : None}
+            for document_index in range(5)
+        ])
+
+    def test_documents_are_migrated(self) -> None:
+        summary = migrate_collection(self.collection, batch_size=2)
+        self.assertEqual((summary["migrated"], summary["failed"]), (5, 0))
+        self.assertEqual(self.collection.count_documents({"schema_version" : SCHEMA_VERSION}), 5)
+
+    def test_migration_is_idempotent(self) -> None:
+        migrate_collection(self.collection)
+        migrated_documents = list(self.collection.find())
+        summary = migrate_collection(self.collection)
+        self.assertEqual(summary["migrated"], 0)
+        self.assertEqual(list(self.collection.find()), migrated_documents)
+
+    def test_dry_run_does_not_write(self) -> None:
+        original_documents = list(self.collection.find())
+        summary = migrate_collection(self.collection, dry_run=True)
+        self.assertEqual(summary["migrated"], 5)
+        self.assertGreater(summary["size_before"], 0)
+        self.assertEqual(list(self.collection.find()), original_documents)
+
+    def test_unconvertible_values_are_normalised(self) -> None:
+        migrate_collection(self.collection)
+        course_list = decode_document(self.collection.find_one())["original_course_list"]
+        self.assertEqual(course_list[0]["course_credit"], 6)
+        self.assertEqual(course_list[0]["course_grade_point"], 19.8)
+        self.assertEqual((course_list[1]["course_credit"], course_list[1]["course_grade_point"]), (0, 0.0))
+
+class TestRekeyBaseDocuments(unittest.TestCase) :
+
+    def setUp(self) -> None:
+        database = mongomock.MongoClient()["trman_test"]
+        self.base_collection = database["user_base"]
+        self.data_collection = database["user_data"]
+
+        # A version 1 base, keyed by the hash of its strings.
+        self.base_fields = {"semesters" : {"semester_1" : {"semester_definition" : "2022-2023 Fall", "course_list" : [STRING_COURSE]}}, "original_course_list" : [STRING_COURSE]}
+        self.old_base_id = "10000000000:" + hashlib.sha1(json.dumps(self.base_fields, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")).hexdigest()
+        self.base_collection.insert_one(dict(self.base_fields, _id=self.old_base_id, owner_id="10000000000"))
+        self.data_collection.insert_one({"owner_id" : "10000000000", "document_name" : "Scenario", "storage_mode" : "delta", "base_id" : self.old_base_id})
+        migrate_collection(self.base_collection)
+        self.new_base_id = UserBase.create_base_document(dict(decode_document(self.base_fields), owner_id="10000000000"))["_id"]
+
+    def test_bases_are_rekeyed(self) -> None:
+        self.assertEqual(rekey_base_documents(self.base_collection, self.data_collection), {"rekeyed" : 1, "merged" : 0})
+        self.assertEqual([base_document["_id"] for base_document in self.base_collection.find()], [self.new_base_id])
+        self.assertEqual(self.data_collection.find_one()["base_id"], self.new_base_id)
+        self.assertEqual(rekey_base_documents(self.base_collection, self.data_collection)["rekeyed"], 0)
+
+    def test_existing_bases_are_merged(self) -> None:
+        # The same transcript is pushed again after the typing, before the migration.
+        self.base_collection.insert_one(encode_document(UserBase.create_base_document(dict(decode_document(self.base_fields), owner_id="10000000000"))))
+        self.assertEqual(rekey_base_documents(self.base_collection, self.data_collection), {"rekeyed" : 1, "merged" : 1})
+        self.assertEqual(self.base_collection.count_documents({}), 1)
+
+    def test_dry_run_does_not_write(self) -> None:
+        self.assertEqual(rekey_base_documents(self.base_collection, self.data_collection, dry_run=True)["rekeyed"], 1)
+        self.assertEqual(self.data_collection.find_one()["base_id"], self.old_base_id)
+
+class TestRemoveUnreferencedBaseDocuments(unittest.TestCase) :
+
+    def setUp(self) -> None:
+        database = mongomock.MongoClient()["trman_test"]
+        self.base_collection = database["user_base"]
+        self.data_collection = database["user_data"]
+        self.base_collection.insert_many([{"_id" : "10000000000:referenced"}, {"_id" : "10000000000:unreferenced"}])
+        self.data_collection.insert_one({"owner_id" : "10000000000", "document_name" : "Scenario", "storage_mode" : "delta", "base_id" : "10000000000:referenced"})
+
+    def test_unreferenced_bases_are_removed(self) -> None:
+        self.assertEqual(remove_unreferenced_base_documents(self.base_collection, self.data_collection), 1)
+        self.assertEqual([base_document["_id"] for base_document in self.base_collection.find()], ["10000000000:referenced"])
+
+    def test_dry_run_does_not_write(self) -> None:
+        self.assertEqual(remove_unreferenced_base_documents(self.base_collection, self.data_collection, dry_run=True), 1)
+        self.assertEqual(self.base_collection.count_documents({}), 2)
+
+if __name__ == "__main__":
+    unittest.main()
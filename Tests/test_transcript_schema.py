@@ -0,0 +1,112 @@
+from    os      import  path # -> Project root resolution
+import  sys # -> Import path manipulation
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from    Utilities.transcript_schema import  Grade, GRADE_CODES, GRADES_BY_CODE, SCHEMA_VERSION, COURSE_LIST_FIELDS # -> Schema under test
+from    Utilities.transcript_schema import  coerce_course, coerce_course_field, encode_course_list, decode_course_list, encode_document, decode_document, migrate_document # -> Schema under test
+import  unittest # -> Test runner
+
+# A course as the version 1 documents and the GUI entries hold it, and the same course typed.
+STRING_COURSE = {"course_code" : "COMP 101", "course_name" : "Programming", "course_lang" : "English", "course_credit" : "6", "course_grade" : "B+", "course_grade_point" : "19.8"}
+TYPED_COURSE = {"course_code" : "COMP 101", "course_name" : "Programming", "course_lang" : "English", "course_credit" : 6, "course_grade" : "B+", "course_grade_point" : 19.8}
+OTHER_COURSE = {"course_code" : "MATH 101*", "course_name" : "Calculus", "course_lang" : "English", "course_credit" : 6, "course_grade" : "F", "course_grade_point" : 0.0}
+
+class TestCoercion(unittest.TestCase) :
+
+    def test_string_fields_are_typed(self) -> None:
+        self.assertEqual(coerce_course(STRING_COURSE), TYPED_COURSE)
+
+    def test_typed_fields_are_kept(self) -> None:
+        self.assertEqual(coerce_course(TYPED_COURSE), TYPED_COURSE)
+        self.assertIsInstance(coerce_course_field("course_credit", 6), int)
+        self.assertEqual(coerce_course_field("course_credit", "6.0"), 6)
+
+    def test_unconvertible_values_are_normalised(self) -> None:
+        self.assertEqual(coerce_course_field("course_credit", "-"), 0)
+        self.assertEqual(coerce_course_field("course_credit", None), 0)
+        self.assertEqual(coerce_course_field("course_grade_point", ""), 0.0)
+        self.assertIsInstance(coerce_course_field("course_grade_point", "N/A"), float)
+
+    def test_other_fields_are_not_changed(self) -> None:
+        self.assertEqual(coerce_course_field("course_grade", "B+"), "B+")
+        self.assertEqual(coerce_course_field("course_code", "COMP 101"), "COMP 101")
+
+class TestGradeCodes(unittest.TestCase) :
+
+    def test_codes_are_the_enum_positions(self) -> None:
+        self.assertEqual(len(GRADE_CODES), len(Grade))
+        for grade_code, grade in enumerate(Grade) :
+            self.assertEqual(GRADE_CODES[grade.value], grade_code)
+            self.assertEqual(GRADES_BY_CODE[grade_code], grade.value)
+
+    def test_stored_codes_are_stable(self) -> None:
+        # The codes are stored, a reordered enum would decode the old documents wrong.
+        self.assertEqual(GRADE_CODES["A"], 0)
+        self.assertEqual(GRADE_CODES["F"], 10)
+        self.assertEqual(GRADE_CODES["N/A"], 15)
+
+    def test_grades_are_plain_strings(self) -> None:
+        self.assertEqual(Grade.B_PLUS, "B+")
+
+class TestCourseListEncoding(unittest.TestCase) :
+
+    def test_round_trip(self) -> None:
+        course_list = [TYPED_COURSE, OTHER_COURSE]
+        self.assertEqual(decode_course_list(encode_course_list(course_list)), course_list)
+
+    def test_columns_hold_grade_codes(self) -> None:
+        columns = encode_course_list([TYPED_COURSE, OTHER_COURSE])
+        self.assertEqual(columns["course_grade"], [GRADE_CODES["B+"], GRADE_CODES["F"]])
+        self.assertEqual(columns["course_credit"], [6, 6])
+
+    def test_unknown_grades_are_kept(self) -> None:
+        course = dict(TYPED_COURSE, course_grade="P")
+        self.assertEqual(decode_course_list(encode_course_list([course])), [course])
+
+    def test_none_and_empty_lists(self) -> None:
+        self.assertIsNone(encode_course_list(None))
+        self.assertIsNone(decode_course_list(None))
+        self.assertEqual(decode_course_list(encode_course_list([])), [])
+
+class TestDocumentEncoding(unittest.TestCase) :
+
+    def setUp(self) -> None:
+        self.document = {
+            "owner_id" : "10000000000",
+            "document_name" : "Scenario",
+            "semesters" : {"semester_1" : {"semester_definition" : "2022-2023 Fall", "course_list" : [TYPED_COURSE, OTHER_COURSE]}},
+            "original_course_list" : [TYPED_COURSE],
+            "added_course_list" : [],
+            "updated_course_list" : None,
+        }
+
+    def test_round_trip(self) -> None:
+        encoded_document = encode_document(self.document)
+        self.assertEqual(encoded_document["schema_version"], SCHEMA_VERSION)
+        self.assertEqual(decode_document(encoded_document), self.document)
+
+    def test_encoding_does_not_change_the_input(self) -> None:
+        encode_document(self.document)
+        self.assertEqual(self.document["original_course_list"], [TYPED_COURSE])
+        self.assertNotIn("schema_version", self.document)
+
+    def test_version_1_documents_are_typed(self) -> None:
+        version_1_document = {"owner_id" : "10000000000", "original_course_list" : [STRING_COURSE], "semesters" : {"semester_1" : {"semester_definition" : "x", "course_list" : [STRING_COURSE]}}}
+        decoded_document = decode_document(version_1_document)
+        self.assertEqual(decoded_document["original_course_list"], [TYPED_COURSE])
+        self.assertEqual(decoded_document["semesters"]["semester_1"]["course_list"], [TYPED_COURSE])
+
+    def test_migration_is_idempotent(self) -> None:
+        version_1_document = {"owner_id" : "10000000000", "original_course_list" : [STRING_COURSE]}
+        migrated_document = migrate_document(version_1_document)
+        self.assertEqual(migrate_document(migrated_document), migrated_document)
+        self.assertEqual(decode_document(migrated_document)["original_course_list"], [TYPED_COURSE])
+
+    def test_every_course_list_field_is_encoded(self) -> None:
+        document = {field_name : [TYPED_COURSE] for field_name in COURSE_LIST_FIELDS}
+        encoded_document = encode_document(document)
+        for field_name in COURSE_LIST_FIELDS :
+            self.assertIsInstance(encoded_document[field_name], dict)
+
+if __name__ == "__main__":
+    unittest.main()
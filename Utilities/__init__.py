@@ -1,52 +1,194 @@
-# Init Custom Selenium Module 
-from    Utilities.web   import (
-    Web, 
-    By
+from    Utilities.lazy  import  LazyModule, lazy_import # -> Deferred heavy imports
+import  importlib # -> Importing the submodules on demand
+
+# The submodules are imported on the first access of their names, so the heavy ones (selenium, PyPDF2, fpdf, googletrans...) are not loaded at the start. (PEP 562)
+_LAZY_EXPORTS = {}
+
+# Init Custom Selenium Module
+_LAZY_EXPORTS["Utilities.web"] = (
+    "Web",
+    "By",
+    "WaitMetrics",
+    "WAIT_METRICS",
+)
+
+# Init Http Client
+_LAZY_EXPORTS["Utilities.http_client"] = (
+    "get_http_session",
+    "create_http_session",
+    "configure_http_client",
+    "reset_http_client",
+)
+
+# Init Photo Fetcher
+_LAZY_EXPORTS["Utilities.photo_fetcher"] = (
+    "PhotoFetcher",
+    "get_photo_fetcher",
+    "get_user_photo_path",
+)
+
+# Init Browser Pool
+_LAZY_EXPORTS["Utilities.browser_pool"] = (
+    "BrowserPool",
+    "get_browser_pool",
+    "shutdown_browser_pool",
 )
 
 # Init Database
-from    Utilities.database  import (
-    MongoClient, 
-    check_database_connection
+_LAZY_EXPORTS["Utilities.database"] = (
+    "MongoClient",
+    "check_database_connection",
+    "PoolMetrics",
+    "POOL_METRICS",
+    "create_mongo_client",
+    "get_mongo_client",
+    "close_mongo_client",
+    "migrate_collection",
+    "rekey_base_documents",
+    "remove_unreferenced_base_documents",
+)
+
+# Init Transcript Grammar
+_LAZY_EXPORTS["Utilities.grammar"] = (
+    "TranscriptParseError",
+    "parse_course_row",
+    "parse_course_fields",
+    "is_semester_header",
+)
+
+# Init Transcript Schema
+_LAZY_EXPORTS["Utilities.transcript_schema"] = (
+    "SCHEMA_VERSION",
+    "Grade",
+    "coerce_course",
+    "coerce_course_field",
+    "encode_document",
+    "decode_document",
+    "migrate_document",
+)
+
+# Init Parse Cache
+_LAZY_EXPORTS["Utilities.parse_cache"] = (
+    "ParseCache",
+)
+
+# Init Document Cache
+_LAZY_EXPORTS["Utilities.document_cache"] = (
+    "DocumentCache",
+    "MemoryCacheBackend",
+)
+
+# Init Local Store
+_LAZY_EXPORTS["Utilities.local_store"] = (
+    "LocalStore",
+    "SyncWorker",
+    "LocalClient",
+    "get_local_client",
+    "close_local_client",
 )
 
 # Init Selenium Classes
-from    Utilities.lexer import (
-    OfflineParser, 
-    OnlineParser,
-    UserVerifier
+_LAZY_EXPORTS["Utilities.lexer"] = (
+    "OfflineParser",
+    "OnlineParser",
+    "UserVerifier",
+)
+
+# Init Batch Ingestion module
+_LAZY_EXPORTS["Utilities.ingestion"] = (
+    "ingest_transcripts",
+    "collect_transcript_files",
+    "push_ingested_transcripts",
 )
 
 # Init PDF Export module
-from    Utilities.pdf_export    import (
-    generate_pdf
+_LAZY_EXPORTS["Utilities.pdf_export"] = (
+    "generate_pdf",
+)
+
+# Init Translation Service
+_LAZY_EXPORTS["Utilities.translation"] = (
+    "TranslationService",
+    "get_translation_service",
+)
+
+# Init Gender Index
+_LAZY_EXPORTS["Utilities.gender_index"] = (
+    "GenderIndex",
+    "get_gender_index",
 )
 
 # Init Utillity Functions
-from    Utilities.utils import (
-    get_gif_frame_count,
-    authenticate,
-    validate_transcript,
-    check_internet_connection,
-    get_connection_details,
-    download_chrome_driver,
-    push_dpi,
-    get_gender,
-    translate_text,
-
-    sort_by,
-    filter_by,
-    add_course,
-    subtract_course,
-    update_course,
-    calculate_performance,
-
-    generate_gradient_colors
+_LAZY_EXPORTS["Utilities.utils"] = (
+    "get_gif_frame_count",
+    "authenticate",
+    "create_authenticated_session",
+    "validate_transcript",
+    "check_internet_connection",
+    "get_connection_details",
+    "download_chrome_driver",
+    "push_dpi",
+    "get_gender",
+    "translate_text",
+    "sort_by",
+    "filter_by",
+    "add_course",
+    "subtract_course",
+    "update_course",
+    "materialize_course_list",
+    "calculate_performance",
+    "generate_gradient_colors",
+)
+
+# Init Login Pipeline
+_LAZY_EXPORTS["Utilities.login_pipeline"] = (
+    "LoginPipeline",
+)
+
+# Init Instrumentation
+_LAZY_EXPORTS["Utilities.instrumentation"] = (
+    "Tracer",
+    "TRACER",
+    "span",
+    "traced",
+)
+
+# Init Preflight Checks
+_LAZY_EXPORTS["Utilities.preflight"] = (
+    "Preflight",
+    "PreflightCache",
+    "get_preflight",
 )
 
 # Init Safe Run module
-from    Utilities.safe_run  import (
-    safe_start,
-    safe_execute,
-    safe_end
-)
\ No newline at end of file
+_LAZY_EXPORTS["Utilities.safe_run"] = (
+    "safe_start",
+    "safe_execute",
+    "safe_end",
+)
+
+# Module of each exported name
+_EXPORTED_MODULES = {name : module_name for module_name, names in _LAZY_EXPORTS.items() for name in names}
+
+__all__ = ["LazyModule", "lazy_import"] + list(_EXPORTED_MODULES)
+
+def __getattr__(name : str) :
+    """
+    Imports the submodule of an exported name on its first access.
+    @Parameters:
+        name - Required : The exported name. (str) -> Used to find the submodule
+    @Returns:
+        value - The exported object. (object)
+    @Raises:
+        AttributeError - If the name is not exported.
+    """
+    if name not in _EXPORTED_MODULES :
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Import the submodule, than keep the name so the next accesses skip this method.
+    value = getattr(importlib.import_module(_EXPORTED_MODULES[name]), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_EXPORTED_MODULES))
@@ -0,0 +1,248 @@
+from    Environment     import  SELENIUM_DC # -> Selenium constants
+from    Utilities.lazy  import  lazy_import # -> Deferred heavy imports
+from    contextlib      import  contextmanager # -> Session scopes
+import  threading # -> Thread safe pool
+import  logging # -> Failed browser launches
+import  queue # -> Idle browsers
+
+# Selenium is imported on the first browser.
+web = lazy_import("Utilities.web") # -> Browser wrapper
+
+logger = logging.getLogger(__name__)
+
+class BrowserPool :
+
+    def __init__(self, size : int = None, max_uses : int = None, driver_path : str = None) -> None:
+        """
+        Constructor method for BrowserPool class, a pool of warm headless browsers shared by the logins.
+        @Parameters:
+            size - Optional : Maximum number of browsers in use at the same time. (int) (default = None) -> None loads SELENIUM_DC.BROWSER_POOL_SIZE
+            max_uses - Optional : Number of sessions before a browser is recycled. (int) (default = None) -> None loads SELENIUM_DC.BROWSER_MAX_USES
+            driver_path - Optional : Path to the driver. (str) (default = None) -> Used to initialize the browsers
+        @Returns:
+            None
+        """
+        # Check for pool config, for ungivens load the default ones from SELENIUM_DC
+        if size is None :
+            size = SELENIUM_DC.BROWSER_POOL_SIZE
+        if max_uses is None :
+            max_uses = SELENIUM_DC.BROWSER_MAX_USES
+
+        # Initialize class fields
+        self.size = max(1, size)
+        self.max_uses = max(1, max_uses)
+        self.driver_path = driver_path
+
+        self.idle_browsers = queue.LifoQueue() # The most recently used one is the warmest.
+        self.slots = threading.BoundedSemaphore(self.size)
+        self.is_closed = False
+        self.lock = threading.Lock()
+        self.active_count = 0 # Browsers taken by acquire.
+        self.launching_count = 0 # Browsers launched by warm_up, not parked yet.
+
+    def _create_browser(self) -> "web.Web":
+        """
+        Private method for launching a new headless browser.
+        @Parameters:
+            None
+        @Returns:
+            client - New browser. (web.Web)
+        """
+        return web.Web(driver_path=self.driver_path, isHidden=True)
+
+    def warm_up(self, count : int = None) -> None:
+        """
+        Launches browsers in the background, so the first logins do not wait for the browser startup.
+        The idle, the taken and the still launching browsers are counted, a second call does not launch more than the pool holds.
+        @Parameters:
+            count - Optional : Number of browsers to launch. (int) (default = None) -> None fills the pool
+        @Returns:
+            None
+        """
+        def launch() -> None:
+            """
+            Launches a browser and parks it as idle.
+            """
+            try :
+                self.__park(self._create_browser())
+            except Exception as error :
+                logger.warning("Browser warm up failed -> %s : %s", type(error).__name__, error)
+            finally :
+                with self.lock :
+                    self.launching_count -= 1
+
+        # Launch each browser on its own thread, they start in parallel.
+        with self.lock :
+            missing_count = max(0, self.size - self.idle_browsers.qsize() - self.active_count - self.launching_count)
+            launch_count = missing_count if count is None else min(count, missing_count)
+            self.launching_count += launch_count
+        for _ in range(launch_count) :
+            threading.Thread(target=launch, daemon=True).start()
+
+    def acquire(self, timeout : float = None) -> "web.Web":
+        """
+        Takes a healthy browser from the pool, launches a new one when there is no idle browser.
+        @Parameters:
+            timeout - Optional : Seconds to wait for a free slot. (float) (default = None) -> None waits forever
+        @Returns:
+            client - A browser with a clean session. (web.Web)
+        @Raises:
+            TimeoutError : If no slot is freed in time.
+        """
+        if self.is_closed :
+            raise RuntimeError("Browser pool is closed")
+
+        # Wait for a free slot.
+        if not self.slots.acquire(timeout=timeout) :
+            raise TimeoutError("No browser available in the pool")
+
+        # Prefer the warm ones, drop the ones which are not responding anymore.
+        try :
+            while True :
+                try :
+                    client = self.idle_browsers.get_nowait()
+                except queue.Empty :
+                    client = self._create_browser()
+                    break
+                if client.is_healthy() :
+                    break
+                self.__terminate(client)
+        except Exception :
+            self.slots.release()
+            raise
+        with self.lock :
+            self.active_count += 1
+        return client
+
+    def release(self, client : "web.Web", is_reusable : bool = True) -> None:
+        """
+        Gives a browser back to the pool. Its session is wiped, or it is recycled when it is worn out.
+        @Parameters:
+            client - Required : The browser taken by acquire. (web.Web) -> Used to be released
+            is_reusable - Optional : False terminates the browser. (bool) (default = True) -> Used for the browsers which failed in the session
+        @Returns:
+            None
+        """
+        try :
+            client.use_count += 1
+            if not is_reusable or self.is_closed or client.use_count >= self.max_uses :
+                self.__terminate(client)
+                return
+
+            # Wipe the session of the previous user, a failure means the browser is broken.
+            try :
+                client.reset_session()
+            except Exception :
+                self.__terminate(client)
+                return
+            self.__park(client)
+        finally :
+            with self.lock :
+                self.active_count -= 1
+            self.slots.release()
+
+    @contextmanager
+    def session(self, timeout : float = None) :
+        """
+        Scope of a browser session, the browser is released on exit and dropped on errors.
+        @Parameters:
+            timeout - Optional : Seconds to wait for a free slot. (float) (default = None) -> None waits forever
+        @Yields:
+            client - A browser with a clean session. (web.Web)
+        """
+        client = self.acquire(timeout=timeout)
+        try :
+            yield client
+        except BaseException :
+            self.release(client, is_reusable=False)
+            raise
+        else :
+            self.release(client)
+
+    def shutdown(self) -> None:
+        """
+        Terminates all of the idle browsers, browsers in use are terminated on their release.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        self.is_closed = True
+        while True :
+            try :
+                self.__terminate(self.idle_browsers.get_nowait())
+            except queue.Empty :
+                break
+
+    def __park(self, client : "web.Web") -> None:
+        """
+        Private method for keeping a browser as idle, terminates it if the pool is full or closed.
+        """
+        if self.is_closed or self.idle_browsers.qsize() >= self.size :
+            self.__terminate(client)
+        else :
+            self.idle_browsers.put(client)
+
+    @staticmethod
+    def __terminate(client : "web.Web") -> None:
+        """
+        Private method for terminating a browser, ignores the already dead ones.
+        """
+        try :
+            client.terminate_client()
+        except Exception :
+            pass
+
+# Process wide pool, created on the first use.
+_BROWSER_POOL = None
+_BROWSER_POOL_LOCK = threading.Lock()
+
+def get_browser_pool(warm_up : bool = False) -> BrowserPool:
+    """
+    Returns the process wide browser pool.
+    @Parameters:
+        warm_up - Optional : Launch the idle browsers in the background. (bool) (default = False) -> Used to hide the browser startup from the first login
+    @Returns:
+        browser_pool - The shared pool. (BrowserPool)
+    """
+    global _BROWSER_POOL
+    with _BROWSER_POOL_LOCK :
+        if _BROWSER_POOL is None or _BROWSER_POOL.is_closed :
+            _BROWSER_POOL = BrowserPool()
+        if warm_up :
+            _BROWSER_POOL.warm_up()
+        return _BROWSER_POOL
+
+def shutdown_browser_pool() -> None:
+    """
+    Terminates the process wide browser pool, if it is created.
+    @Parameters:
+        None
+    @Returns:
+        None
+    """
+    global _BROWSER_POOL
+    with _BROWSER_POOL_LOCK :
+        if _BROWSER_POOL is not None :
+            _BROWSER_POOL.shutdown()
+            _BROWSER_POOL = None
+
+@contextmanager
+def open_web_client(isHidden : bool = True, browser_pool : BrowserPool = None) :
+    """
+    Scope of a browser for a single scraping. Hidden browsers come from the pool, visible ones are launched and terminated for the scope.
+    @Parameters:
+        isHidden - Optional : If the browser is hidden or not. (bool) (default = True) -> Used to select the source of the browser
+        browser_pool - Optional : Pool of the hidden browsers. (BrowserPool) (default = None) -> None uses the process wide pool
+    @Yields:
+        client - The browser. (web.Web)
+    """
+    if isHidden :
+        with (browser_pool or get_browser_pool()).session() as client :
+            yield client
+    else :
+        client = web.Web(isHidden=False)
+        try :
+            yield client
+        finally :
+            client.terminate_client()
@@ -1,37 +1,393 @@
-from 	Environment	import	DATABASE_DC # Database values & connection and config
+from 	Environment	import	DATABASE_DC, CACHE_DC # Database values & connection and config
+from 	Utilities.document_cache	import	DocumentCache # Read-through document cache
+from 	Utilities.instrumentation	import	traced # Database spans
+from 	Utilities.utils	import	materialize_course_list # Scenario replay
+from 	Utilities.transcript_schema	import	SCHEMA_VERSION, encode_document, decode_document, migrate_document # Stored document schema
+from 	pymongo	import	monitoring # Connection pool events
+import 	threading # Shared client and thread safe metrics
+import 	logging # Orphan delta documents
+import 	hashlib # Base transcript keys
 import 	pymongo # Database connection
+import 	json # Base transcript keys
+import 	bson # Document sizes
+import 	time # Pool wait times
 
-def check_database_connection() -> tuple:
+logger = logging.getLogger(__name__)
+
+def check_database_connection(timeout : float = None, bootstrap_indexes : bool = False) -> tuple:
 	"""
 	Method to check if securely connected to database
 	@Parameters:
-		None
+		timeout - Optional : Seconds to wait for the server. (float) (default = None) -> None loads DATABASE_DC.SERVER_SELECTION_TIMEOUT
+		bootstrap_indexes - Optional : Create the missing indexes after connecting. (bool) (default = False) -> Used by the start up check
 	@Returns:
-		(bool, str) : (True, "Database connection successful on port {port}") or (False, "Database connection failed")
+		(bool, str) : (True, "Database connection successful on port {port}") or (False, "Database connection failed"), an index error is only reported in the message
 	"""
-	# Try to establish a connection to database
+	# Check for timeout, for ungiven load the default one from DATABASE_DC
+	if timeout is None :
+		timeout = DATABASE_DC.SERVER_SELECTION_TIMEOUT
+
+	# Try to establish a connection to database, over the shared client. Its pool is warm for the application after the check.
 	try :
-		client = MongoClient()
-		client.server_info()
-		port = client.address[1]
-		# If connection is successful, return True
-		return (True, f"Database connection successful on port {port}")
+		client = get_mongo_client()
+		with pymongo.timeout(timeout) :
+			client.admin.command("ping")
+			port = client.address[1]
 	except :
 		# If connection is not successful, return False
 		return (False, "Database connection failed")
 
+	# Create the missing indexes, it does nothing if they already exist. The server is reachable, so an index error (EXMP: no createIndex privilege) does not fail the check.
+	if bootstrap_indexes :
+		try :
+			with pymongo.timeout(timeout) :
+				return (True, f"Database connection successful on port {port}, {client.bootstrap_indexes()}")
+		except pymongo.errors.PyMongoError as error :
+			return (True, f"Database connection successful on port {port}, indexes failed -> {error}")
+
+	# If connection is successful, return True
+	return (True, f"Database connection successful on port {port}")
+
+def create_user_documents(data : dict) -> tuple:
+	"""
+	Method to create user_info and user_data documents from given data, shared by MongoClient and LocalClient
+	@Parameters:
+		data - Required : Data to create documents (dict) -> Used to create documents
+	@Returns:
+		(tuple) : Tuple of user_info and user_data documents
+	"""
+	# Create user_info from given data
+	user_info_document = {
+		"_id" : data["student_national_id"],
+		"student_school_id" : data["student_school_id"],
+		"student_name" : data["student_name"],
+		"student_surname" : data["student_surname"],
+		"student_faculty" : data["student_faculty"],
+		"student_department" : data["student_department"],
+		"language_of_instruction" : data["language_of_instruction"],
+		"student_status" : data["student_status"]
+	}
+
+	# Create user_data from given data (INITIALIZE WITH NONE !)
+	user_data_document = {
+		"owner_id" : data["student_national_id"],
+		"parsing_type" : data["parsing_type"],
+		"parsing_language" : data["parsing_language"],
+		"transcript_manager_date" : data["transcript_manager_date"],
+		"transcript_creation_date" : data["transcript_creation_date"],
+		"semesters" : data["semesters"],
+		"original_course_list" : data["original_course_list"],
+		"filtering" : None,
+		"sorting" : None,
+		"modified_course_list" : None,
+		"document_name" : "Transcript Document",
+		"updated_course_list" : None,
+		"subtracted_course_list" : None,
+		"added_course_list" : None,
+	}
+
+	# Return user_info and user_data documents
+	return user_info_document, user_data_document
+
+def split_into_batches(items : list, batch_size : int = None) -> list:
+	"""
+	Method to split the items into the batches of the bulk writes
+	@Parameters:
+		items - Required : Items to be split (list) -> Used to create the batches
+		batch_size - Optional : Items in each batch (int) (default = None) -> None loads DATABASE_DC.BULK_BATCH_SIZE
+	@Returns:
+		(list) : List of the batches
+	"""
+	# Check for batch size, for ungiven load the default one from DATABASE_DC
+	if batch_size is None :
+		batch_size = DATABASE_DC.BULK_BATCH_SIZE
+	batch_size = max(1, batch_size)
+
+	# Return the batches
+	return [items[batch_start:batch_start + batch_size] for batch_start in range(0, len(items), batch_size)]
+
+def run_bulk_write(collection : pymongo.collection.Collection, requests : list) -> tuple:
+	"""
+	Method to run an unordered bulk write, a failed request does not stop the others
+	@Parameters:
+		collection - Required : Collection to write (pymongo.collection.Collection) -> Used to run the requests
+		requests - Required : Write requests (list) -> Used to be written
+	@Returns:
+		(tuple) : (upserted ids by the request indexes, write errors by the request indexes)
+	"""
+	try :
+		result = collection.bulk_write(requests, ordered=False)
+		return (result.upserted_ids, {})
+	except pymongo.errors.BulkWriteError as e :
+		# The successful ones are still written, collect them with the failed ones.
+		upserted_ids = {upsert["index"] : upsert["_id"] for upsert in e.details.get("upserted", [])}
+		write_errors = {write_error["index"] : write_error for write_error in e.details.get("writeErrors", [])}
+		return (upserted_ids, write_errors)
+
+def migrate_collection(collection : pymongo.collection.Collection, batch_size : int = None, dry_run : bool = False) -> dict:
+	"""
+	Method to migrate the documents of a user_data or user_base collection to the current schema, with unordered bulk writes. It is idempotent, migrated documents are skipped.
+	@Parameters:
+		collection - Required : The collection (pymongo.collection.Collection) -> Used to read and replace the documents
+		batch_size - Optional : Documents in each bulk write (int) (default = None) -> None loads DATABASE_DC.BULK_BATCH_SIZE
+		dry_run - Optional : Only measure the migration, do not write (bool) (default = False) -> Used to preview the size change
+	@Returns:
+		(dict) : {"migrated" : int, "failed" : int, "size_before" : bytes, "size_after" : bytes}
+	"""
+	summary = {"migrated" : 0, "failed" : 0, "size_before" : 0, "size_after" : 0}
+	requests = []
+
+	def __flush() -> None:
+		# Replace only if an other migration has not replaced it yet
+		if not dry_run and requests :
+			_, write_errors = run_bulk_write(collection, requests)
+			summary["failed"] += len(write_errors)
+			summary["migrated"] -= len(write_errors)
+		requests.clear()
+
+	# Check for batch size, for ungiven load the default one from DATABASE_DC
+	if batch_size is None :
+		batch_size = DATABASE_DC.BULK_BATCH_SIZE
+
+	for document in collection.find({"schema_version" : {"$ne" : SCHEMA_VERSION}}) :
+		migrated_document = migrate_document(document)
+		summary["migrated"] += 1
+		summary["size_before"] += len(bson.encode(document))
+		summary["size_after"] += len(bson.encode(migrated_document))
+		requests.append(pymongo.ReplaceOne({"_id" : document["_id"], "schema_version" : document.get("schema_version")}, migrated_document))
+		if len(requests) >= batch_size :
+			__flush()
+	__flush()
+	return summary
+
+def rekey_base_documents(base_collection : pymongo.collection.Collection, data_collection : pymongo.collection.Collection, dry_run : bool = False) -> dict:
+	"""
+	Method to move the base documents to the _id of their typed content. Version 1 bases are keyed by the hash of their strings, the same transcript pushed after the
+	migration would get a second base otherwise. It is idempotent, bases with the right _id are skipped. Run it after the base collection is migrated.
+	@Parameters:
+		base_collection - Required : The user_base collection (pymongo.collection.Collection) -> Used to move the bases
+		data_collection - Required : The user_data collection (pymongo.collection.Collection) -> Used to point the documents to the moved bases
+		dry_run - Optional : Only count the bases, do not write (bool) (default = False) -> Used to preview the migration
+	@Returns:
+		(dict) : {"rekeyed" : int, "merged" : int} merged ones already had a base with the new _id
+	"""
+	summary = {"rekeyed" : 0, "merged" : 0}
+	for base_document in base_collection.find() :
+		old_base_id = base_document["_id"]
+		new_base_document = UserBase.create_base_document(decode_document(base_document))
+		new_base_id = new_base_document["_id"]
+		if new_base_id == old_base_id :
+			continue
+		summary["rekeyed"] += 1
+		if dry_run :
+			continue
+
+		# Create the new base first, than point the documents to it, so a reader never sees a missing base.
+		update_result = base_collection.update_one({"_id" : new_base_id}, {"$setOnInsert" : encode_document(new_base_document)}, upsert=True)
+		if update_result.upserted_id is None :
+			summary["merged"] += 1
+		data_collection.update_many({"base_id" : old_base_id}, {"$set" : {"base_id" : new_base_id}})
+		base_collection.delete_one({"_id" : old_base_id})
+	return summary
+
+def remove_unreferenced_base_documents(base_collection : pymongo.collection.Collection, data_collection : pymongo.collection.Collection, dry_run : bool = False) -> int:
+	"""
+	Method to remove the base documents which no user_data document points to. (EXMP: the base of a save which found an other document with the same name)
+	It is a maintenance step, run it while no client is saving. A save writes its base before its document, a base of a running save looks unreferenced.
+	@Parameters:
+		base_collection - Required : The user_base collection (pymongo.collection.Collection) -> Used to remove the bases
+		data_collection - Required : The user_data collection (pymongo.collection.Collection) -> Used to find the referenced bases
+		dry_run - Optional : Only count the bases, do not remove (bool) (default = False) -> Used to preview the cleanup
+	@Returns:
+		(int) : Number of the unreferenced bases
+	"""
+	referenced_base_ids = set(data_collection.distinct("base_id", {"storage_mode" : "delta"}))
+	unreferenced_base_ids = [base_document["_id"] for base_document in base_collection.find({}, {"_id" : 1}) if base_document["_id"] not in referenced_base_ids]
+	if not dry_run :
+		for batch in split_into_batches(unreferenced_base_ids) :
+			base_collection.delete_many({"_id" : {"$in" : batch}})
+	return len(unreferenced_base_ids)
+
+class PoolMetrics(monitoring.ConnectionPoolListener) :
+
+	def __init__(self) -> None:
+		"""
+		Constructor method for PoolMetrics class, a listener of the connection pool events which counts the connections and measures the check out waits.
+		@Parameters:
+			None
+		@Returns:
+			None
+		"""
+		# Initialize class fields
+		self.lock = threading.Lock()
+		self.check_out_start_times = {}
+		self.reset()
+
+	def reset(self) -> None:
+		"""
+		Method to reset the metrics
+		@Parameters:
+			None
+		@Returns:
+			None
+		"""
+		with self.lock :
+			self.open_count = 0
+			self.checked_out_count = 0
+			self.max_checked_out_count = 0
+			self.check_out_count = 0
+			self.check_out_failure_count = 0
+			self.total_wait_time = 0.0
+			self.max_wait_time = 0.0
+			self.pool_clear_count = 0
+
+	def _end_wait(self) -> float:
+		"""
+		Private method for ending the check out wait of the current thread. The pool events are published on the thread which checks out.
+		@Parameters:
+			None
+		@Returns:
+			(float) : Seconds waited, 0 if the start is not seen
+		"""
+		start_time = self.check_out_start_times.pop(threading.get_ident(), None)
+		return time.perf_counter() - start_time if start_time is not None else 0.0
+
+	def connection_check_out_started(self, event) -> None:
+		with self.lock :
+			self.check_out_start_times[threading.get_ident()] = time.perf_counter()
+
+	def connection_checked_out(self, event) -> None:
+		with self.lock :
+			wait_time = self._end_wait()
+			self.check_out_count += 1
+			self.total_wait_time += wait_time
+			self.max_wait_time = max(self.max_wait_time, wait_time)
+			self.checked_out_count += 1
+			self.max_checked_out_count = max(self.max_checked_out_count, self.checked_out_count)
+
+	def connection_check_out_failed(self, event) -> None:
+		with self.lock :
+			self.total_wait_time += self._end_wait()
+			self.check_out_failure_count += 1
+
+	def connection_checked_in(self, event) -> None:
+		with self.lock :
+			self.checked_out_count = max(0, self.checked_out_count - 1)
+
+	def connection_created(self, event) -> None:
+		with self.lock :
+			self.open_count += 1
+
+	def connection_closed(self, event) -> None:
+		with self.lock :
+			self.open_count = max(0, self.open_count - 1)
+
+	def pool_cleared(self, event) -> None:
+		with self.lock :
+			self.pool_clear_count += 1
+
+	def connection_ready(self, event) -> None:
+		pass
+
+	def pool_created(self, event) -> None:
+		pass
+
+	def pool_ready(self, event) -> None:
+		pass
+
+	def pool_closed(self, event) -> None:
+		pass
+
+	def get_summary(self) -> dict:
+		"""
+		Method to get the metrics of the pool
+		@Parameters:
+			None
+		@Returns:
+			(dict) : {"open", "checked_out", "max_checked_out", "check_outs", "check_out_failures", "mean_wait_time", "max_wait_time", "pool_clears"}, the times in seconds
+		"""
+		with self.lock :
+			return {
+				"open" : self.open_count,
+				"checked_out" : self.checked_out_count,
+				"max_checked_out" : self.max_checked_out_count,
+				"check_outs" : self.check_out_count,
+				"check_out_failures" : self.check_out_failure_count,
+				"mean_wait_time" : self.total_wait_time / max(1, self.check_out_count + self.check_out_failure_count),
+				"max_wait_time" : self.max_wait_time,
+				"pool_clears" : self.pool_clear_count,
+			}
+
+# Process wide pool metrics, listens the shared client.
+POOL_METRICS = PoolMetrics()
+
+# Process wide client, created by the first use.
+_MONGO_CLIENT = None
+_MONGO_CLIENT_LOCK = threading.Lock()
+
+def create_mongo_client(**client_options) -> "MongoClient":
+	"""
+	Method to create a MongoClient with the pool and timeout settings of DATABASE_DC, its pool is listened by POOL_METRICS. Use get_mongo_client unless a separate client is needed.
+	@Parameters:
+		client_options - Optional : Options of pymongo.MongoClient, they override DATABASE_DC. (EXMP: maxPoolSize=50) (dict) -> Used to configure the connection
+	@Returns:
+		(MongoClient) : The new client
+	"""
+	# Check for client config, for ungivens load the default ones from DATABASE_DC
+	options = {
+		"maxPoolSize" : DATABASE_DC.MAX_POOL_SIZE,
+		"minPoolSize" : DATABASE_DC.MIN_POOL_SIZE,
+		"serverSelectionTimeoutMS" : int(DATABASE_DC.SERVER_SELECTION_TIMEOUT * 1000),
+		"connectTimeoutMS" : int(DATABASE_DC.CONNECT_TIMEOUT * 1000),
+		"event_listeners" : [POOL_METRICS],
+	}
+	options.update(client_options)
+
+	# Return the client, it connects in the background on its first use.
+	return MongoClient(**options)
+
+def get_mongo_client() -> "MongoClient":
+	"""
+	Method to get the process wide MongoClient, every caller shares its pool and monitor threads.
+	@Parameters:
+		None
+	@Returns:
+		(MongoClient) : The shared client
+	"""
+	global _MONGO_CLIENT
+	with _MONGO_CLIENT_LOCK :
+		if _MONGO_CLIENT is None :
+			_MONGO_CLIENT = create_mongo_client()
+		return _MONGO_CLIENT
+
+def close_mongo_client() -> None:
+	"""
+	Method to close the process wide MongoClient, if it is created. The next get_mongo_client creates a new one.
+	@Parameters:
+		None
+	@Returns:
+		None
+	"""
+	global _MONGO_CLIENT
+	with _MONGO_CLIENT_LOCK :
+		client, _MONGO_CLIENT = _MONGO_CLIENT, None
+	if client is not None :
+		client.close()
+
 class MongoClient(pymongo.MongoClient) :
 
 	# Class fields
 	__user_info_collection_define = DATABASE_DC.COLLECTION_NAMES["__user_info_collection_define"]
 	__user_data_collection_define = DATABASE_DC.COLLECTION_NAMES["__user_data_collection_define"]
+	__user_base_collection_define = DATABASE_DC.COLLECTION_NAMES["__user_base_collection_define"]
 
-	def __init__(self, connection_string : str = None, db_name : str = None) -> None:
+	def __init__(self, connection_string : str = None, db_name : str = None, **client_options) -> None:
 		"""
 		Constructor method for MongoClient class, which is a wrapper for pymongo.MongoClient class
 		@Parameters:
 			connection_string - Optional : Connection string for database connection. (str) (default = None) -> Used to connect to database
 			db_name - Optional : Database name to connect. (str) (default = None) -> Used to connect to database
+			client_options - Optional : Options of pymongo.MongoClient. (EXMP: serverSelectionTimeoutMS=5000) (dict) -> Used to configure the connection
 		@Returns:
 			None
 		"""
@@ -41,12 +397,38 @@ class MongoClient(pymongo.MongoClient) :
 		if connection_string is None:
 			connection_string = DATABASE_DC.CONNECTION_STRING
 		# Initialize MongoClient class
-		super().__init__(connection_string)
+		super().__init__(connection_string, **client_options)
 
 		# Initialize database and collections
 		self.db = self[db_name]
 		self.user_info = UserInfo(self, self.db, self.__user_info_collection_define)
 		self.user_data = UserData(self, self.db, self.__user_data_collection_define)
+		self.user_base = UserBase(self, self.db, self.__user_base_collection_define)
+
+	def bootstrap_indexes(self) -> str:
+		"""
+		Method to create the indexes of the collections. It is idempotent, existing indexes are kept as they are.
+		@Parameters:
+			None
+		@Returns:
+			(str) : Summary of the created indexes
+		"""
+		# Create the indexes of each collection
+		index_names = self.user_data.bootstrap_indexes()
+
+		# Return the summary
+		return f"indexes approved -> {index_names}"
+
+	def watch_changes(self) -> None:
+		"""
+		Method to start invalidating the document cache with the change stream of user_data, the writes of the other clients are seen at once. Does nothing if it is disabled.
+		@Parameters:
+			None
+		@Returns:
+			None
+		"""
+		if CACHE_DC.DOCUMENT_CACHE_WATCH :
+			self.user_data.document_cache.watch(self.user_data)
 
 	def get_all_user_ids(self) -> list:
 		"""
@@ -67,38 +449,7 @@ class MongoClient(pymongo.MongoClient) :
 		@Returns:
 			(tuple) : Tuple of user_info and user_data documents
 		"""
-		# Create user_info from given data
-		user_info_document = {
-			"_id" : data["student_national_id"],
-			"student_school_id" : data["student_school_id"],
-			"student_name" : data["student_name"],
-			"student_surname" : data["student_surname"],
-			"student_faculty" : data["student_faculty"],
-			"student_department" : data["student_department"],
-			"language_of_instruction" : data["language_of_instruction"],
-			"student_status" : data["student_status"]
-		}
-
-		# Create user_data from given data (INITIALIZE WITH NONE !)
-		user_data_document = {
-			"owner_id" : data["student_national_id"],
-			"parsing_type" : data["parsing_type"],
-			"parsing_language" : data["parsing_language"],
-			"transcript_manager_date" : data["transcript_manager_date"],
-			"transcript_creation_date" : data["transcript_creation_date"],
-			"semesters" : data["semesters"],
-			"original_course_list" : data["original_course_list"],
-			"filtering" : None,
-			"sorting" : None,
-			"modified_course_list" : None,
-			"document_name" : "Transcript Document",
-			"updated_course_list" : None,
-			"subtracted_course_list" : None,
-			"added_course_list" : None,
-		}
-
-		# Return user_info and user_data documents
-		return user_info_document, user_data_document
+		return create_user_documents(data)
 
 class UserInfo(pymongo.collection.Collection) :
 
@@ -118,6 +469,7 @@ class UserInfo(pymongo.collection.Collection) :
 		# Initialize client
 		self.client = client
 
+	@traced("UserInfo.push_init", "db")
 	def push_init(self, document : dict) -> None:
 		"""
 		Method to push user_info document to database
@@ -141,8 +493,111 @@ class UserInfo(pymongo.collection.Collection) :
 			#print("User added")
 			pass
 
+	@traced("UserInfo.bulk_push", "db")
+	def bulk_push(self, documents : list, batch_size : int = None) -> list:
+		"""
+		Method to push many user_info documents with unordered bulk writes, same as push_init for each of them
+		@Parameters:
+			documents - Required : User_info documents (list) -> Used to push to database
+			batch_size - Optional : Documents in each bulk write (int) (default = None) -> None loads DATABASE_DC.BULK_BATCH_SIZE
+		@Returns:
+			(list) : {"status" : "inserted", "updated" or "failed", "_id" : str, "error" : str or None} of each document, in the given order
+		"""
+		results = []
+		for batch in split_into_batches(documents, batch_size) :
+			# Same upsert with push_init, one request for each document
+			requests = [pymongo.UpdateOne({"_id" : document["_id"]}, {"$set" : document}, upsert=True) for document in batch]
+			upserted_ids, write_errors = run_bulk_write(self, requests)
+
+			# Check for the result of each document
+			for batch_index, document in enumerate(batch) :
+				if batch_index in write_errors :
+					results.append({"status" : "failed", "_id" : document["_id"], "error" : write_errors[batch_index].get("errmsg")})
+				elif batch_index in upserted_ids :
+					results.append({"status" : "inserted", "_id" : document["_id"], "error" : None})
+				else :
+					results.append({"status" : "updated", "_id" : document["_id"], "error" : None})
+		return results
+
+class UserBase(pymongo.collection.Collection):
+
+	# Fields of a user_data document which belong to the parsed transcript, they are stored once in this collection on the delta storage.
+	BASE_FIELDS = ("semesters", "original_course_list")
+
+	def __init__(self, client : pymongo.MongoClient, db : str, collection_name : str) -> None:
+		"""
+		Constructor method for UserBase class, which is a wrapper for pymongo.collection.Collection class. It holds the base transcripts of the scenarios.
+		@Parameters:
+			client - Required : MongoClient object (pymongo.MongoClient) -> Used to connect to database
+			db - Required : Database name (str) -> Used to connect to database
+			collection_name - Required : Collection name (str) -> Used to connect to database
+		@Returns:
+			None
+		"""
+		# Initialize pymongo.collection.Collection class
+		super().__init__(db, collection_name)
+
+		# Initialize client
+		self.client = client
+
+	@classmethod
+	def create_base_document(cls, document : dict) -> dict:
+		"""
+		Method to create the base document of a user_data document. Same transcripts of an owner give the same _id, so it is stored once.
+		@Parameters:
+			document - Required : User_data document (dict) -> Used to get the transcript fields
+		@Returns:
+			(dict) : Base document
+		"""
+		# Key the base by its owner and its content
+		base_document = {field_name : document[field_name] for field_name in cls.BASE_FIELDS}
+		content_hash = hashlib.sha1(json.dumps(base_document, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")).hexdigest()
+		base_document["_id"] = f"{document['owner_id']}:{content_hash}"
+		base_document["owner_id"] = document["owner_id"]
+		return base_document
+
+	@traced("UserBase.bulk_push", "db")
+	def bulk_push(self, base_documents : list) -> None:
+		"""
+		Method to push the base documents which do not exist yet, with one unordered bulk write
+		@Parameters:
+			base_documents - Required : Base documents (list) -> Used to push to database
+		@Returns:
+			None
+		"""
+		# Once for each base, existing ones are kept as they are.
+		unique_base_documents = list({base_document["_id"] : base_document for base_document in base_documents}.values())
+		for batch in split_into_batches(unique_base_documents) :
+			_, write_errors = run_bulk_write(self, [pymongo.UpdateOne({"_id" : base_document["_id"]}, {"$setOnInsert" : base_document}, upsert=True) for base_document in batch])
+			# A duplicated key means the same base is written by an other save at the same time.
+			failed_write_errors = [write_error for write_error in write_errors.values() if write_error.get("code") != 11000]
+			if failed_write_errors :
+				raise pymongo.errors.OperationFailure(failed_write_errors[0].get("errmsg"))
+
+	@traced("UserBase.get_base_documents", "db")
+	def get_base_documents(self, base_ids : list) -> dict:
+		"""
+		Method to get the base documents with one query
+		@Parameters:
+			base_ids - Required : Ids of the base documents (list) -> Used to find the documents
+		@Returns:
+			(dict) : Base documents by their ids
+		"""
+		return {base_document["_id"] : base_document for base_document in self.find({"_id" : {"$in" : list(set(base_ids))}})}
+
 class UserData(pymongo.collection.Collection):
 
+	# Statuses of push_init
+	PUSH_INSERTED = "inserted"
+	PUSH_EXISTS = "exists"
+	PUSH_OWNER_NOT_FOUND = "owner_not_found"
+	PUSH_FAILED = "failed"
+
+	# Indexes of the collection as (keys, options). Saves and loads match on {owner_id, document_name} and the listings on owner_id, both are served by the compound one.
+	INDEXES = [
+		([("owner_id", pymongo.ASCENDING), ("document_name", pymongo.ASCENDING)], {"name" : "owner_id_document_name_unique", "unique" : True}),
+	]
+
 	def __init__(self, client : pymongo.MongoClient, db : str, collection_name : str) -> None:
 		"""
 		Constructor method for UserData class, which is a wrapper for pymongo.collection.Collection class
@@ -159,37 +614,279 @@ class UserData(pymongo.collection.Collection):
 		# Initialize client
 		self.client = client     
 
-	def push_init(self, document : dict) -> None:
+		# Initialize the read-through cache of the documents and listings
+		self.document_cache = DocumentCache()
+
+	def bootstrap_indexes(self) -> list:
 		"""
-		Method to push user_data document to database
+		Method to create the indexes of INDEXES. It is idempotent, create_index does nothing for an existing index.
+		If a unique index can not be created because of the duplicated documents, the same index is created without the uniqueness, so the queries are still fast.
+		The unique index is tried again on every call, until the duplicates are cleaned.
+		@Parameters:
+			None
+		@Returns:
+			(list) : Names of the indexes
+		"""
+		index_names = []
+		for keys, options in self.INDEXES :
+			fallback_name = f"{options['name']}_non_unique"
+			# The fallback index of an earlier call has the same keys, the unique one conflicts with it. (IndexOptionsConflict)
+			if options.get("unique") and fallback_name in self.index_information() :
+				self.drop_index(fallback_name)
+			try :
+				index_names.append(self.create_index(keys, **options))
+			except pymongo.errors.DuplicateKeyError :
+				# Old duplicated documents, keep the lookups indexed until they are cleaned.
+				fallback_options = {key : value for key, value in options.items() if key != "unique"}
+				fallback_options["name"] = fallback_name
+				index_names.append(self.create_index(keys, **fallback_options))
+		return index_names
+
+	def _split_document(self, document : dict) -> tuple:
+		"""
+		Private method for splitting a user_data document for the storage. On the delta storage the transcript goes to the base document,
+		and the modified course list is dropped if it can be replayed from the changes. Both are encoded into the current schema.
+		@Parameters:
+			document - Required : User_data document (dict) -> Used to be split
+		@Returns:
+			(tuple) : (base document or None on the full storage, stored user_data document)
+		"""
+		if DATABASE_DC.STORAGE_MODE != "delta" :
+			return (None, encode_document(document))
+
+		# Keep every field except the transcript, than point to the base.
+		base_document = UserBase.create_base_document(document)
+		stored_document = {field_name : value for field_name, value in document.items() if field_name not in UserBase.BASE_FIELDS}
+		stored_document["storage_mode"] = "delta"
+		stored_document["base_id"] = base_document["_id"]
+
+		# The modified course list is stored only if the replay of the changes gives an other list. (EXMP: changes made after a sort)
+		stored_document["is_modified_course_list_replayed"] = False
+		if document.get("modified_course_list") is not None :
+			try :
+				replayed_course_list = materialize_course_list(document["original_course_list"], document.get("added_course_list"), document.get("subtracted_course_list"), document.get("updated_course_list"), document.get("sorting"), document.get("filtering"))
+			except (KeyError, TypeError, ValueError) :
+				replayed_course_list = None
+			if replayed_course_list == document["modified_course_list"] :
+				stored_document["modified_course_list"] = None
+				stored_document["is_modified_course_list_replayed"] = True
+		return (encode_document(base_document), encode_document(stored_document))
+
+	def _materialize_documents(self, documents : list) -> list:
+		"""
+		Private method for materializing the stored user_data documents into their full views, the bases are read with one query.
+		@Parameters:
+			documents - Required : Stored user_data documents (list) -> Used to be materialized
+		@Returns:
+			(list) : Full documents, the ones with a missing base are dropped and logged
+		"""
+		# Decode the documents of any schema version, than read the bases of the delta documents.
+		documents = [decode_document(document) for document in documents]
+		base_ids = [document["base_id"] for document in documents if document.get("storage_mode") == "delta"]
+		base_documents = {base_id : decode_document(base_document) for base_id, base_document in self.client.user_base.get_base_documents(base_ids).items()} if base_ids else {}
+
+		materialized_documents = []
+		for document in documents :
+			# Full documents are already materialized
+			if document.get("storage_mode") != "delta" :
+				materialized_documents.append(document)
+				continue
+			base_document = base_documents.get(document["base_id"])
+			if base_document is None :
+				logger.warning("Base %s of the document %s / %s is missing, the document is skipped", document["base_id"], document.get("owner_id"), document.get("document_name"))
+				continue
+
+			# Put the transcript back, than replay the changes if the modified course list is not stored.
+			full_document = {field_name : value for field_name, value in document.items() if field_name not in ("storage_mode", "base_id", "is_modified_course_list_replayed")}
+			for field_name in UserBase.BASE_FIELDS :
+				full_document[field_name] = base_document[field_name]
+			if document.get("is_modified_course_list_replayed") :
+				full_document["modified_course_list"] = materialize_course_list(full_document["original_course_list"], full_document.get("added_course_list"), full_document.get("subtracted_course_list"), full_document.get("updated_course_list"), full_document.get("sorting"), full_document.get("filtering"))
+			materialized_documents.append(full_document)
+		return materialized_documents
+
+	@traced("UserData.push_init", "db")
+	def push_init(self, document : dict) -> dict:
+		"""
+		Method to push user_data document to database, if the owner exists and has no document with the same name.
 		@Parameters:
 			document - Required : User_data document (dict) -> Used to push to database
 		@Returns:
-			None
+			(dict) : {"status" : PUSH_INSERTED, PUSH_EXISTS, PUSH_OWNER_NOT_FOUND or PUSH_FAILED, "owner_id" : str, "document_name" : str, "document_id" : id of the inserted document or None, "error" : str or None}
 		"""
 		# Setup match variables
 		owner_id = document["owner_id"]
-		if owner_id not in self.client.get_all_user_ids() :
+		result = {"status" : None, "owner_id" : owner_id, "document_name" : document["document_name"], "document_id" : None, "error" : None}
+
+		# Check for the owner on its _id only, one indexed lookup.
+		if self.client.user_info.find_one({"_id" : owner_id}, {"_id" : 1}) is None :
 			#print("User not found, data is not pushed")
-			return
-		
+			result["status"] = self.PUSH_OWNER_NOT_FOUND
+			return result
+
 		# Setup match variables
 		filter = { # Only one change between them is enough ! For example different name of document and etc ...
 			"owner_id" : owner_id,
 			"document_name" : document["document_name"],
 		}
 
-		# Check if document already exists
-		if self.count_documents(filter) > 0 :
+		# Store the base transcript first on the delta storage
+		base_document, stored_document = self._split_document(document)
+		try :
+			if base_document is not None :
+				self.client.user_base.bulk_push([base_document])
+
+			# Insert the document only if it does not exist, in one round trip. The unique index rejects the concurrent second insert.
+			update_result = self.update_one(filter, {"$setOnInsert" : stored_document}, upsert=True)
+		except pymongo.errors.DuplicateKeyError :
+			update_result = None
+		except pymongo.errors.PyMongoError as error :
+			result["status"] = self.PUSH_FAILED
+			result["error"] = str(error)
+			return result
+		finally :
+			# The cached listing of the owner is stale now
+			self.document_cache.invalidate(owner_id, document["document_name"])
+
+		# Check for result
+		if update_result is not None and update_result.upserted_id is not None :
+			result["status"] = self.PUSH_INSERTED
+			result["document_id"] = update_result.upserted_id
+		else :
 			#print("Same document already exists, data is not pushed")
-			return
-		
-		# Push applied document to database
-		self.insert_one(document)
+			result["status"] = self.PUSH_EXISTS
+		return result
+
+	@traced("UserData.bulk_push", "db")
+	def bulk_push(self, documents : list, batch_size : int = None) -> list:
+		"""
+		Method to push many user_data documents with unordered bulk writes, same as push_init for each of them
+		@Parameters:
+			documents - Required : User_data documents (list) -> Used to push to database
+			batch_size - Optional : Documents in each bulk write (int) (default = None) -> None loads DATABASE_DC.BULK_BATCH_SIZE
+		@Returns:
+			(list) : Result of each document like push_init, in the given order. Failed ones have the PUSH_FAILED status and the error.
+		"""
+		results = []
+		for batch in split_into_batches(documents, batch_size) :
+			# Check for the owners of the batch with one query
+			owner_ids = list({document["owner_id"] for document in batch})
+			existing_owner_ids = {user_info["_id"] for user_info in self.client.user_info.find({"_id" : {"$in" : owner_ids}}, {"_id" : 1})}
+
+			# Store the base transcripts first on the delta storage
+			request_indexes = [batch_index for batch_index, document in enumerate(batch) if document["owner_id"] in existing_owner_ids]
+			split_documents = [self._split_document(batch[batch_index]) for batch_index in request_indexes]
+			base_documents = [base_document for base_document, _ in split_documents if base_document is not None]
+			if base_documents :
+				self.client.user_base.bulk_push(base_documents)
+
+			# Insert the documents of the existing owners only if they do not exist, the unique index rejects the duplicates.
+			requests = [pymongo.UpdateOne({"owner_id" : stored_document["owner_id"], "document_name" : stored_document["document_name"]}, {"$setOnInsert" : stored_document}, upsert=True) for _, stored_document in split_documents]
+			try :
+				upserted_ids, write_errors = run_bulk_write(self, requests) if requests else ({}, {})
+			finally :
+				# The cached listings of the owners are stale now
+				for _, stored_document in split_documents :
+					self.document_cache.invalidate(stored_document["owner_id"], stored_document["document_name"])
+			request_positions = {batch_index : request_index for request_index, batch_index in enumerate(request_indexes)}
+
+			# Check for the result of each document
+			for batch_index, document in enumerate(batch) :
+				result = {"status" : None, "owner_id" : document["owner_id"], "document_name" : document["document_name"], "document_id" : None, "error" : None}
+				request_index = request_positions.get(batch_index)
+				if request_index is None :
+					result["status"] = self.PUSH_OWNER_NOT_FOUND
+				elif request_index in write_errors :
+					# A duplicated key means an other request with the same name is written first.
+					if write_errors[request_index].get("code") == 11000 :
+						result["status"] = self.PUSH_EXISTS
+					else :
+						result["status"] = self.PUSH_FAILED
+						result["error"] = write_errors[request_index].get("errmsg")
+				elif request_index in upserted_ids :
+					result["status"] = self.PUSH_INSERTED
+					result["document_id"] = upserted_ids[request_index]
+				else :
+					result["status"] = self.PUSH_EXISTS
+				results.append(result)
+		return results
+
+	@traced("UserData.list_documents", "db")
+	def list_documents(self, owner_id : str) -> list:
+		"""
+		Method to list the documents of given user, without their transcripts. Use get_document for the selected one.
+		@Parameters:
+			owner_id - Required : Owner id (str) -> Used to list the documents
+		@Returns:
+			(list) : {"document_name" : str, "transcript_manager_date" : str, "document_size" : bytes of the document or None} of each document, ordered by the names
+		"""
+		return self.document_cache.get_listing(owner_id, lambda : self._list_documents(owner_id))
+
+	def _list_documents(self, owner_id : str) -> list:
+		"""
+		Private method for listing the documents of given user from the database, list_documents reads it through the cache.
+		@Parameters:
+			owner_id - Required : Owner id (str) -> Used to list the documents
+		@Returns:
+			(list) : Same as list_documents
+		"""
+		# Only the listed fields leave the server, the size is computed by the server. ($bsonSize needs MongoDB 4.4)
+		pipeline = [
+			{"$match" : {"owner_id" : owner_id}},
+			{"$project" : {"_id" : 0, "document_name" : 1, "transcript_manager_date" : 1, "storage_mode" : 1, "base_id" : 1, "document_size" : {"$bsonSize" : "$$ROOT"}}},
+			{"$sort" : {"document_name" : 1}},
+		]
+		try :
+			found = list(self.aggregate(pipeline))
+		except pymongo.errors.OperationFailure :
+			# Older servers, list without the sizes.
+			found = [dict(document, document_size=None) for document in self.find({"owner_id" : owner_id}, {"_id" : 0, "document_name" : 1, "transcript_manager_date" : 1, "storage_mode" : 1, "base_id" : 1}).sort("document_name", pymongo.ASCENDING)]
 
+		# Drop the delta documents with a missing base, same as _materialize_documents. The bases are checked with one query.
+		base_ids = list({document["base_id"] for document in found if document.get("storage_mode") == "delta"})
+		existing_base_ids = {base_document["_id"] for base_document in self.client.user_base.find({"_id" : {"$in" : base_ids}}, {"_id" : 1})} if base_ids else set()
+		listed_documents = []
+		for document in found :
+			if document.get("storage_mode") == "delta" and document["base_id"] not in existing_base_ids :
+				logger.warning("Base %s of the document %s / %s is missing, the document is not listed", document["base_id"], owner_id, document["document_name"])
+				continue
+			listed_documents.append({field_name : value for field_name, value in document.items() if field_name not in ("storage_mode", "base_id")})
+		return listed_documents
+
+	@traced("UserData.get_document", "db")
+	def get_document(self, owner_id : str, document_name : str) -> dict:
+		"""
+		Method to get one document of given user by its name
+		@Parameters:
+			owner_id - Required : Owner id (str) -> Used to find the document
+			document_name - Required : Name of the document (str) -> Used to find the document
+		@Returns:
+			(dict) : The full document, None if it does not exist
+		"""
+		return self.document_cache.get_document(owner_id, document_name, lambda : self._get_document(owner_id, document_name))
+
+	def _get_document(self, owner_id : str, document_name : str) -> dict:
+		"""
+		Private method for getting one document of given user from the database, get_document reads it through the cache.
+		@Parameters:
+			owner_id - Required : Owner id (str) -> Used to find the document
+			document_name - Required : Name of the document (str) -> Used to find the document
+		@Returns:
+			(dict) : Same as get_document
+		"""
+		# One indexed lookup on the unique (owner_id, document_name) index
+		document = self.find_one({"owner_id" : owner_id, "document_name" : document_name})
+		if document is None :
+			return None
+
+		# Materialize it, if it is stored as a delta
+		materialized_documents = self._materialize_documents([document])
+		return materialized_documents[0] if materialized_documents else None
+
+	@traced("UserData.get_available_documents", "db")
 	def get_available_documents(self, owner_id : str) -> list:
 		"""
-		Method to get available documents of given user
+		Method to get available documents of given user, the full documents
 		@Parameters:
 			owner_id - Required : Owner id (str) -> Used to get available documents
 		@Returns:
@@ -199,15 +896,8 @@ class UserData(pymongo.collection.Collection):
 		filter = {
 			"owner_id" : owner_id,
 		}
-		# Setup projection variables - NOT USED CURRENTLY
-		projection = {
-			"_id" : 0,
-			"document_name" : 1,
-		}
-		
-		#found = self.find(filter, projection)
-		# Get available documents
-		found = self.find(filter)
+		# Get available documents, with their transcripts. (list_documents is enough for the names)
+		found = self._materialize_documents(list(self.find(filter)))
 
 		# Return found documents
 		return found
\ No newline at end of file
@@ -0,0 +1,272 @@
+from    Environment     import  CACHE_DC # -> Cache constants
+from    collections     import  OrderedDict # -> Least recently used order
+import  threading # -> Thread safe entries and the change stream watcher
+import  pymongo # -> Change stream errors
+import  copy # -> Callers never share the cached documents
+import  time # -> Expiration times
+
+class MemoryCacheBackend :
+
+    def __init__(self, max_entries : int = None) -> None:
+        """
+        Constructor method for MemoryCacheBackend class, an in-memory least recently used store of the cache entries.
+        Any object with the same get, set, delete, keys and clear methods can be given to DocumentCache instead. (EXMP: a shared store of the tests)
+        @Parameters:
+            max_entries - Optional : Maximum number of entries. (int) (default = None) -> None loads CACHE_DC.DOCUMENT_CACHE_MAX_ENTRIES
+        @Returns:
+            None
+        """
+        # Check for backend config, for ungivens load the default ones from CACHE_DC
+        if max_entries is None :
+            max_entries = CACHE_DC.DOCUMENT_CACHE_MAX_ENTRIES
+
+        # Initialize class fields
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key : tuple) -> tuple:
+        """
+        Gets an entry and marks it as the most recently used one.
+        @Parameters:
+            key - Required : Cache key. (tuple) -> Used to find the entry
+        @Returns:
+            (float, object) : (expiration time, value), None on miss.
+        """
+        with self.lock :
+            entry = self.entries.get(key)
+            if entry is not None :
+                self.entries.move_to_end(key)
+            return entry
+
+    def set(self, key : tuple, value : object, expiration_time : float) -> None:
+        """
+        Sets an entry, than evicts the least recently used entries above the limit.
+        @Parameters:
+            key - Required : Cache key. (tuple) -> Used to address the entry
+            value - Required : Value of the entry. (object) -> Used to be cached
+            expiration_time - Required : time.monotonic of the expiration. (float) -> Used to expire the entry
+        @Returns:
+            None
+        """
+        with self.lock :
+            self.entries[key] = (expiration_time, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries :
+                self.entries.popitem(last=False)
+
+    def delete(self, key : tuple) -> None:
+        """
+        Deletes an entry, ignores the missing ones.
+        @Parameters:
+            key - Required : Cache key. (tuple) -> Used to find the entry
+        @Returns:
+            None
+        """
+        with self.lock :
+            self.entries.pop(key, None)
+
+    def keys(self) -> list:
+        """
+        Returns the keys of the entries.
+        @Parameters:
+            None
+        @Returns:
+            keys - Cache keys. (list)
+        """
+        with self.lock :
+            return list(self.entries.keys())
+
+    def clear(self) -> None:
+        """
+        Deletes all of the entries.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        with self.lock :
+            self.entries.clear()
+
+class DocumentCache :
+
+    # Kinds of the cache keys, (DOCUMENT, owner_id, document_name) and (LISTING, owner_id)
+    DOCUMENT = "document"
+    LISTING = "listing"
+
+    def __init__(self, backend : object = None, ttl : float = None) -> None:
+        """
+        Constructor method for DocumentCache class, a read-through cache of the user_data documents and listings.
+        The entries expire after the ttl, the local writes invalidate them at once and a change stream can invalidate the writes of the other clients.
+        It sits on the remote UserData, with the local store enabled it serves the pulls of the sync worker. (LocalClient.watch_changes starts its change stream)
+        @Parameters:
+            backend - Optional : Store of the entries. (MemoryCacheBackend) (default = None) -> None creates a MemoryCacheBackend
+            ttl - Optional : Seconds an entry is trusted. (float) (default = None) -> None loads CACHE_DC.DOCUMENT_CACHE_TTL
+        @Returns:
+            None
+        """
+        # Check for cache config, for ungivens load the default ones from CACHE_DC
+        if ttl is None :
+            ttl = CACHE_DC.DOCUMENT_CACHE_TTL
+
+        # Initialize class fields
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttl = ttl
+        self.hit_count = 0
+        self.miss_count = 0
+        self.generation = 0
+        self.watcher = None
+        self.is_watching = False
+        self.stop_event = threading.Event()
+
+    def _get_or_load(self, key : tuple, loader) :
+        """
+        Private method for reading an entry through the cache. The loaded value is cached even if it is None, so a missing document is not asked again and again.
+        @Parameters:
+            key - Required : Cache key. (tuple) -> Used to find the entry
+            loader - Required : Callable returning the value on a miss. (callable) -> Used to read the database
+        @Returns:
+            value - A copy of the cached or loaded value. (object)
+        """
+        # Return a fresh entry
+        entry = self.backend.get(key)
+        if entry is not None and entry[0] > time.monotonic() :
+            self.hit_count += 1
+            return copy.deepcopy(entry[1])
+
+        # Load and cache it otherwise. If an invalidation happens during the load, the loaded value may be stale and it is not cached.
+        self.miss_count += 1
+        generation = self.generation
+        value = loader()
+        if self.ttl > 0 and generation == self.generation :
+            self.backend.set(key, copy.deepcopy(value), time.monotonic() + self.ttl)
+        return value
+
+    def get_document(self, owner_id : str, document_name : str, loader) -> dict:
+        """
+        Reads a document through the cache.
+        @Parameters:
+            owner_id - Required : Owner id. (str) -> Used to build the key
+            document_name - Required : Name of the document. (str) -> Used to build the key
+            loader - Required : Callable returning the document. (callable) -> Used on a miss
+        @Returns:
+            document - The document, None if it does not exist. (dict)
+        """
+        return self._get_or_load((self.DOCUMENT, owner_id, document_name), loader)
+
+    def get_listing(self, owner_id : str, loader) -> list:
+        """
+        Reads the document listing of an owner through the cache.
+        @Parameters:
+            owner_id - Required : Owner id. (str) -> Used to build the key
+            loader - Required : Callable returning the listing. (callable) -> Used on a miss
+        @Returns:
+            listing - The listing. (list)
+        """
+        return self._get_or_load((self.LISTING, owner_id), loader)
+
+    def invalidate(self, owner_id : str, document_name : str = None) -> None:
+        """
+        Invalidates a document and the listing of its owner, or every entry of the owner if no name is given.
+        @Parameters:
+            owner_id - Required : Owner id. (str) -> Used to find the entries
+            document_name - Optional : Name of the document. (str) (default = None) -> None invalidates every document of the owner
+        @Returns:
+            None
+        """
+        self.generation += 1
+        self.backend.delete((self.LISTING, owner_id))
+        if document_name is not None :
+            self.backend.delete((self.DOCUMENT, owner_id, document_name))
+            return
+        for key in self.backend.keys() :
+            if key[0] == self.DOCUMENT and key[1] == owner_id :
+                self.backend.delete(key)
+
+    def clear(self) -> None:
+        """
+        Invalidates every entry.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        self.generation += 1
+        self.backend.clear()
+
+    def _invalidate_change(self, change : dict) -> None:
+        """
+        Private method for invalidating the entries of a change stream event. Deletes do not carry the fields of the document, so their owner is unknown and everything is invalidated.
+        @Parameters:
+            change - Required : Change stream event. (dict) -> Used to find the entries
+        @Returns:
+            None
+        """
+        full_document = change.get("fullDocument") or {}
+        if "owner_id" in full_document :
+            self.invalidate(full_document["owner_id"], full_document.get("document_name"))
+        else :
+            self.clear()
+
+    def watch(self, collection : object, retry_interval : float = None) -> None:
+        """
+        Starts a daemon thread which invalidates the entries with the change stream of the collection.
+        Servers without change streams (standalone mongod) stop the watcher, the ttl keeps the entries fresh enough then.
+        @Parameters:
+            collection - Required : The watched collection. (pymongo.collection.Collection) -> Used to open the change stream
+            retry_interval - Optional : Seconds before reopening a broken stream. (float) (default = None) -> None uses the ttl
+        @Returns:
+            None
+        """
+        if self.watcher is not None :
+            return
+        if retry_interval is None :
+            retry_interval = max(self.ttl, 1.0)
+
+        def __watch() -> None:
+            while not self.stop_event.is_set() :
+                try :
+                    with collection.watch(full_document="updateLookup", max_await_time_ms=1000) as stream :
+                        self.is_watching = True
+                        # The events until the stream is opened are missed.
+                        self.clear()
+                        while not self.stop_event.is_set() and stream.alive :
+                            change = stream.try_next()
+                            if change is not None :
+                                self._invalidate_change(change)
+                except pymongo.errors.OperationFailure :
+                    # Change streams are not supported by the server.
+                    break
+                except pymongo.errors.PyMongoError :
+                    # Connection is lost, try again later.
+                    pass
+                finally :
+                    self.is_watching = False
+                self.stop_event.wait(retry_interval)
+
+        self.stop_event.clear()
+        self.watcher = threading.Thread(target=__watch, name="document_cache_watcher", daemon=True)
+        self.watcher.start()
+
+    def stop_watching(self) -> None:
+        """
+        Stops the change stream watcher.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        self.stop_event.set()
+        if self.watcher is not None :
+            self.watcher.join(timeout=2.0)
+        self.watcher = None
+
+    def get_stats(self) -> dict:
+        """
+        Returns the hit and miss counts of the cache.
+        @Parameters:
+            None
+        @Returns:
+            stats - {"hits", "misses", "entries", "is_watching"} (dict)
+        """
+        return {"hits" : self.hit_count, "misses" : self.miss_count, "entries" : len(self.backend.keys()), "is_watching" : self.is_watching}
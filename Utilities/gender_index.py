@@ -0,0 +1,156 @@
+from    Environment     import  CACHE_DC # -> Index location
+from    functools       import  lru_cache # -> Front cache of the lookups
+import  threading # -> Thread safe lazy build
+import  json # -> Index serialization
+import  zlib # -> Compression
+import  re # -> Name normalization
+import  os # -> File operations
+
+# Name normalization, compiled once. (Turkish letters to ascii, than only the letters are kept)
+NAME_TRANSLATION_MAP = str.maketrans("ıüöçşğİÜÖÇŞĞ", "iuocsgIUOCSG")
+NON_ALPHABETIC_PATTERN = re.compile(r"[^a-zA-Z]+")
+
+def normalize_name(name : str) -> str:
+    """
+    Normalizes a full name into the lookup key of its first name.
+    @Parameters:
+        name - Required : Full name of the user. (str) -> Used to be normalized
+    @Returns:
+        key - Lower case ascii first name. (str)
+    """
+    # Same steps with the detector input, than lower case for the case insensitive lookup.
+    first_name = name.lower().split(" ")[0].translate(NAME_TRANSLATION_MAP)
+    return NON_ALPHABETIC_PATTERN.sub("", first_name.capitalize()).lower()
+
+class GenderIndex :
+
+    # Version of the index layout, must be increased on any change of it. (Rebuilds the index)
+    INDEX_VERSION = 1
+
+    def __init__(self, country : str = "turkey", index_path : str = None) -> None:
+        """
+        Constructor method for GenderIndex class, a compact name to gender table of a country. It is built from gender_guesser once, than loaded from the disk.
+        @Parameters:
+            country - Optional : Country of the names. (str) (default = "turkey") -> Used to resolve the genders
+            index_path - Optional : Path of the index file. (str) (default = None) -> None uses CACHE_DC.GENDER_INDEX_FOLDER
+        @Returns:
+            None
+        """
+        # Check for index path, for ungiven load the default one from CACHE_DC
+        if index_path is None :
+            index_path = os.path.join(CACHE_DC.GENDER_INDEX_FOLDER, f"gender_index_{country}.json.z")
+
+        # Initialize class fields
+        self.country = country
+        self.index_path = index_path
+        self.genders = None # name -> gender, loaded on the first lookup
+        self.lock = threading.Lock()
+
+        # Lookups are cached per instance
+        self.get_gender = lru_cache(maxsize=1024)(self._get_gender)
+
+    @staticmethod
+    def _get_source_signature() -> list:
+        """
+        Private method for getting the signature of the gender_guesser data file, a new release rebuilds the index.
+        @Parameters:
+            None
+        @Returns:
+            signature - Size and modification time of the data file. (list)
+        """
+        import gender_guesser
+        source_path = os.path.join(os.path.dirname(gender_guesser.__file__), "data", "nam_dict.txt")
+        source_stat = os.stat(source_path)
+        return [source_stat.st_size, int(source_stat.st_mtime)]
+
+    def _build(self) -> dict:
+        """
+        Private method for building the index, by resolving every name of the detector for the country.
+        @Parameters:
+            None
+        @Returns:
+            genders - Names by their genders. (dict)
+        """
+        import gender_guesser.detector as gender
+
+        # Resolve each name once, the detector is dropped after it.
+        detector = gender.Detector(case_sensitive=False)
+        genders = {}
+        for current_name in detector.names :
+            genders.setdefault(detector.get_gender(current_name, self.country), []).append(current_name)
+        return genders
+
+    def _load(self) -> None:
+        """
+        Private method for loading the index, builds and saves it if the saved one is missing or out of date.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        source_signature = self._get_source_signature()
+
+        # Read the saved index, a broken or an old one is rebuilt.
+        try :
+            with open(self.index_path, "rb") as index_file :
+                index = json.loads(zlib.decompress(index_file.read()).decode("utf-8"))
+            if index["version"] != self.INDEX_VERSION or index["country"] != self.country or index["source"] != source_signature :
+                raise ValueError("Out of date gender index")
+            genders = index["genders"]
+        except (OSError, ValueError, KeyError, zlib.error) :
+            genders = self._build()
+            self._save({"version" : self.INDEX_VERSION, "country" : self.country, "source" : source_signature, "genders" : genders})
+
+        # Flatten into name -> gender
+        self.genders = {current_name : current_gender for current_gender, names in genders.items() for current_name in names}
+
+    def _save(self, index : dict) -> None:
+        """
+        Private method for saving the index, over a temporary file so the readers never see a partial index.
+        @Parameters:
+            index - Required : The index. (dict) -> Used to be saved
+        @Returns:
+            None
+        """
+        try :
+            os.makedirs(os.path.dirname(self.index_path) or ".", exist_ok=True)
+            temporary_path = f"{self.index_path}.{os.getpid()}.tmp"
+            with open(temporary_path, "wb") as index_file :
+                index_file.write(zlib.compress(json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")))
+            os.replace(temporary_path, self.index_path)
+        except OSError :
+            pass
+
+    def _get_gender(self, name : str) -> str:
+        """
+        Private method for getting the gender of a name, behind the lru cache of get_gender.
+        @Parameters:
+            name - Required : Full name of the user. (str) -> Used for the gender detection
+        @Returns:
+            gender - "male", "female", "mostly_male", "mostly_female", "andy" or "unknown". (str)
+        """
+        # Load the index on the first lookup
+        if self.genders is None :
+            with self.lock :
+                if self.genders is None :
+                    self._load()
+
+        # Return the gender of the first name
+        return self.genders.get(normalize_name(name), "unknown")
+
+# Process wide indexes by their countries, created on the first use.
+_GENDER_INDEXES = {}
+_GENDER_INDEXES_LOCK = threading.Lock()
+
+def get_gender_index(country : str = "turkey") -> GenderIndex:
+    """
+    Returns the process wide gender index of a country.
+    @Parameters:
+        country - Optional : Country of the names. (str) (default = "turkey") -> Used to select the index
+    @Returns:
+        gender_index - The shared index. (GenderIndex)
+    """
+    with _GENDER_INDEXES_LOCK :
+        if country not in _GENDER_INDEXES :
+            _GENDER_INDEXES[country] = GenderIndex(country)
+        return _GENDER_INDEXES[country]
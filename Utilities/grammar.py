@@ -0,0 +1,97 @@
+from    Utilities.transcript_schema import  coerce_course # -> Typed course fields
+import  re # -> Regular expressions for the transcript grammar
+
+class TranscriptParseError(ValueError) :
+    """
+    Raised when a line of the transcript does not fit to the expected grammar, which means the layout of the source has drifted.
+    """
+    pass
+
+# Terms that follow the academic year on a semester header. (EN and TR)
+SEMESTER_TERMS = (
+    "Fall Semester", "Spring Semester", "Summer School", "Fall Dönemi", "Spring Dönemi", "Bahar Dönemi", "Güz Dönemi", "Yaz Okulu"
+)
+
+# Semester header, EXMP: "2019-2020 Fall Semester"
+SEMESTER_HEADER_PATTERN = re.compile(r"^[^ ]* (?P<semester_term>" + "|".join(map(re.escape, SEMESTER_TERMS)) + r")$")
+
+# Semester summary table of the online transcript, EXMP: "Semester Credits Attempted ..."
+SEMESTER_SUMMARY_PATTERN = re.compile(r"^(?:Semester Credits Attempted|Dönem Alınan Kredi)")
+
+# Academic standing row at the end of an online semester table.
+ACADEMIC_STANDING_PATTERN = re.compile(r"(?:Academic Standing|Akademik Durum)")
+
+# Course fields, each one is a line on the offline transcript.
+COURSE_FIELD_PATTERNS = {
+    "course_code" : re.compile(r"^\S+ \S+$"),
+    "course_name" : re.compile(r"^.*$"),
+    "course_lang" : re.compile(r"^\S+$"),
+    "course_credit" : re.compile(r"^\d+$"),
+    "course_grade" : re.compile(r"^(?:[A-Z]{1,2}[+-]?|N/A)$"),
+    "course_grade_point" : re.compile(r"^\d+(?:\.\d+)?$"),
+}
+
+# Course row of the online transcript, all fields are on the same line. EXMP: "COMP 101 Introduction to Programming EN 6 A 24.0"
+COURSE_ROW_PATTERN = re.compile(
+    r"^(?P<course_code>\S+ \S+)"
+    r" (?:(?P<course_name>.*?) )?"
+    r"(?P<course_lang>\S+)"
+    r" (?P<course_credit>\d+)"
+    r" (?P<course_grade>(?:[A-Z]{1,2}[+-]?|N/A))"
+    r" (?P<course_grade_point>\d+(?:\.\d+)?)$"
+)
+
+def is_semester_header(line : str) -> bool:
+    """
+    Checks if the given line is a semester header.
+    @Parameters:
+        line - Required : Line of the transcript. (str) -> Used to be checked
+    @Returns:
+        True if the line is a semester header, False otherwise. (bool)
+    """
+    # Return the match status
+    return SEMESTER_HEADER_PATTERN.match(line) is not None
+
+def parse_course_row(row : str) -> dict:
+    """
+    Parses a single line course row of the online transcript.
+    @Parameters:
+        row - Required : Course row. (str) -> Used to be parsed
+    @Returns:
+        course (dict) : Parsed course, with int credit and float grade point.
+    @Raises:
+        TranscriptParseError : If the row does not fit to the course grammar.
+    """
+    # Match the row
+    matched = COURSE_ROW_PATTERN.match(row)
+    if matched is None :
+        raise TranscriptParseError(f"Unexpected course row -> \"{row}\"")
+
+    # Return the parsed course with its typed fields, name can be empty.
+    course = matched.groupdict()
+    course["course_name"] = course["course_name"] or ""
+    return coerce_course(course)
+
+def parse_course_fields(fields : tuple) -> dict:
+    """
+    Parses a course of the offline transcript, which is written one field per line.
+    @Parameters:
+        fields - Required : Lines of the course, in the order of COURSE_FIELD_PATTERNS. (tuple) -> Used to be parsed
+    @Returns:
+        course (dict) : Parsed course, with int credit and float grade point.
+    @Raises:
+        TranscriptParseError : If the course is incomplete or a field does not fit to its grammar.
+    """
+    # Check for the completeness
+    if len(fields) != len(COURSE_FIELD_PATTERNS) :
+        raise TranscriptParseError(f"Incomplete course -> {list(fields)}")
+
+    # Validate each field and build the course
+    course = {}
+    for (field_name, field_pattern), field_value in zip(COURSE_FIELD_PATTERNS.items(), fields) :
+        if field_pattern.match(field_value) is None :
+            raise TranscriptParseError(f"Unexpected {field_name} -> \"{field_value}\" in {list(fields)}")
+        course[field_name] = field_value
+
+    # Return the parsed course with its typed fields
+    return coerce_course(course)
@@ -0,0 +1,140 @@
+from    Environment         import  NETWORK_DC # -> Http client constants
+from    requests.adapters   import  HTTPAdapter # -> Pooled transport
+from    urllib3.util.retry  import  Retry # -> Retry with backoff
+import  threading # -> Thread safe singletons
+import  requests # -> Web requests
+
+class HttpSession(requests.Session) :
+
+    def __init__(self, adapter : HTTPAdapter, timeout : tuple) -> None:
+        """
+        Constructor method for HttpSession class, a session over the shared transport with a default timeout on every request.
+        @Parameters:
+            adapter - Required : Transport of the session. (HTTPAdapter) -> Used to share the pooled connections between the sessions
+            timeout - Required : Default (connect, read) timeout in seconds. (tuple) -> Used for the requests which do not give their own
+        @Returns:
+            None
+        """
+        super().__init__()
+
+        # Initialize class fields
+        self.timeout = timeout
+
+        # Route both of the schemes over the shared transport
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def request(self, method : str, url : str, *args, **kwargs) -> requests.Response:
+        """
+        Sends a request, with the default timeout if no timeout is given.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, *args, **kwargs)
+
+    def close(self) -> None:
+        """
+        Drops the cookies of the session. The shared transport stays open, other sessions keep using its connections.
+        """
+        self.cookies.clear()
+
+def create_http_adapter() -> HTTPAdapter:
+    """
+    Creates a pooled transport with the retry policy of NETWORK_DC.
+    @Parameters:
+        None
+    @Returns:
+        adapter - The transport. (HTTPAdapter)
+    """
+    # Retry the idempotent requests on connection errors and on the listed statuses, with an exponential backoff.
+    retry_policy = Retry(
+        total=NETWORK_DC.RETRY_TOTAL,
+        backoff_factor=NETWORK_DC.RETRY_BACKOFF_FACTOR,
+        status_forcelist=NETWORK_DC.RETRY_STATUS_FORCELIST,
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        raise_on_status=False,
+    )
+
+    # Return the transport, it keeps POOL_MAXSIZE connections alive for each of POOL_CONNECTIONS hosts.
+    return HTTPAdapter(pool_connections=NETWORK_DC.POOL_CONNECTIONS, pool_maxsize=NETWORK_DC.POOL_MAXSIZE, max_retries=retry_policy)
+
+# Process wide transport and session, created on the first use.
+_HTTP_ADAPTER = None
+_HTTP_SESSION = None
+_HTTP_TIMEOUT = None
+_HTTP_LOCK = threading.Lock()
+
+def _get_http_adapter() -> HTTPAdapter:
+    """
+    Private function for getting the process wide transport, must be called with the lock.
+    """
+    global _HTTP_ADAPTER
+    if _HTTP_ADAPTER is None :
+        _HTTP_ADAPTER = create_http_adapter()
+    return _HTTP_ADAPTER
+
+def _get_http_timeout() -> tuple:
+    """
+    Private function for getting the default timeout.
+    """
+    return _HTTP_TIMEOUT or (NETWORK_DC.CONNECT_TIMEOUT, NETWORK_DC.READ_TIMEOUT)
+
+def get_http_session() -> HttpSession:
+    """
+    Returns the process wide session, for the requests which do not need their own cookies.
+    @Parameters:
+        None
+    @Returns:
+        session - The shared session. (HttpSession)
+    """
+    global _HTTP_SESSION
+    with _HTTP_LOCK :
+        if _HTTP_SESSION is None :
+            _HTTP_SESSION = HttpSession(_get_http_adapter(), _get_http_timeout())
+        return _HTTP_SESSION
+
+def create_http_session() -> HttpSession:
+    """
+    Creates a session with its own cookies, over the shared connection pool. (EXMP: a login)
+    @Parameters:
+        None
+    @Returns:
+        session - A new session. (HttpSession)
+    """
+    with _HTTP_LOCK :
+        return HttpSession(_get_http_adapter(), _get_http_timeout())
+
+def configure_http_client(adapter : HTTPAdapter = None, timeout : tuple = None) -> None:
+    """
+    Replaces the transport or the default timeout of the sessions created after the call. (EXMP: a local stub server in tests)
+    @Parameters:
+        adapter - Optional : Transport to be used. (HTTPAdapter) (default = None) -> None keeps the current one
+        timeout - Optional : Default (connect, read) timeout in seconds. (tuple) (default = None) -> None keeps the current one
+    @Returns:
+        None
+    """
+    global _HTTP_ADAPTER, _HTTP_SESSION, _HTTP_TIMEOUT
+    with _HTTP_LOCK :
+        if adapter is not None :
+            _HTTP_ADAPTER = adapter
+        if timeout is not None :
+            _HTTP_TIMEOUT = timeout
+        # Drop the shared session, it is created again over the new config.
+        if _HTTP_SESSION is not None :
+            _HTTP_SESSION.close()
+            _HTTP_SESSION = None
+
+def reset_http_client() -> None:
+    """
+    Closes the pooled connections and restores the default config.
+    @Parameters:
+        None
+    @Returns:
+        None
+    """
+    global _HTTP_ADAPTER, _HTTP_SESSION, _HTTP_TIMEOUT
+    with _HTTP_LOCK :
+        if _HTTP_SESSION is not None :
+            _HTTP_SESSION.close()
+        if _HTTP_ADAPTER is not None :
+            _HTTP_ADAPTER.close()
+        _HTTP_ADAPTER, _HTTP_SESSION, _HTTP_TIMEOUT = None, None, None
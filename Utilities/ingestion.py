@@ -0,0 +1,112 @@
+from    concurrent.futures  import  ProcessPoolExecutor, as_completed # -> Process pool for parallel parsing
+from    Environment         import  INGESTION_DC # -> Ingestion constants
+from    Utilities.lexer     import  OfflineParser # -> Offline transcript parser
+import  glob # -> File pattern matching
+import  os # -> Path operations
+
+def collect_transcript_files(source : str, recursive : bool = False) -> list:
+    """
+    Collects the transcript files from the given source.
+    @Parameters:
+        source - Required : A directory or a glob pattern of transcript files. (str) -> Used to find the transcript files
+        recursive - Optional : Search the sub directories too. (bool) (default = False) -> Used to find the transcript files
+    @Returns:
+        transcript_files - Sorted list of transcript file paths. (list)
+    """
+    # If a directory is given, search the transcript files inside of it.
+    if os.path.isdir(source) :
+        if recursive :
+            pattern = os.path.join(source, "**", INGESTION_DC.FILE_PATTERN)
+        else :
+            pattern = os.path.join(source, INGESTION_DC.FILE_PATTERN)
+    else :
+        pattern = source
+
+    # Return the found files, sorted to keep the submission order stable.
+    return sorted(current_path for current_path in glob.glob(pattern, recursive=recursive) if os.path.isfile(current_path))
+
+def _parse_transcript_file(path_to_file : str) -> dict:
+    """
+    Parses a single transcript file. Runs inside of the worker processes, so it must stay picklable (module level).
+    @Parameters:
+        path_to_file - Required : Path to the transcript file. (str) -> Used to parse the transcript
+    @Returns:
+        result - The ingestion result of the file. (dict)
+    """
+    # Parse the transcript, capture any error to keep the batch alive.
+    try :
+        transcript_data = OfflineParser(path_to_file=path_to_file, stream=True).get_transcript_data()
+        return {
+            "path" : path_to_file,
+            "status" : "success",
+            "transcript_data" : transcript_data,
+            "error" : None,
+        }
+    except Exception as e :
+        return {
+            "path" : path_to_file,
+            "status" : "failure",
+            "transcript_data" : None,
+            "error" : f"{type(e).__name__}: {e}",
+        }
+
+def ingest_transcripts(source, max_workers : int = None, recursive : bool = False):
+    """
+    Parses the transcript files over a process pool and streams the results back as the workers finish.
+    @Parameters:
+        source - Required : A directory, a glob pattern or a list of transcript file paths. (str | list) -> Used to find the transcript files
+        max_workers - Optional : Number of worker processes. (int) (default = None) -> None loads INGESTION_DC.MAX_WORKERS, which defaults to the core count
+        recursive - Optional : Search the sub directories too. (bool) (default = False) -> Used to find the transcript files
+    @Yields:
+        result - The ingestion result of each file, in completion order. (dict) -> {"path", "status", "transcript_data", "error"}
+    """
+    # Collect the files to be parsed.
+    if isinstance(source, (list, tuple)) :
+        transcript_files = list(source)
+    else :
+        transcript_files = collect_transcript_files(source, recursive=recursive)
+
+    # Nothing to do, if there is no file.
+    if not transcript_files :
+        return
+
+    # Check for worker count, for ungiven load the default one from INGESTION_DC.
+    if max_workers is None :
+        max_workers = INGESTION_DC.MAX_WORKERS or os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(transcript_files)))
+
+    # Fan the files out over the pool and stream the results back as they are finished.
+    with ProcessPoolExecutor(max_workers=max_workers) as executor :
+        futures = {executor.submit(_parse_transcript_file, current_path) : current_path for current_path in transcript_files}
+        for future in as_completed(futures) :
+            try :
+                yield future.result()
+            except Exception as e :
+                # The worker itself died (e.g. BrokenProcessPool), report it for the file and move on.
+                yield {
+                    "path" : futures[future],
+                    "status" : "failure",
+                    "transcript_data" : None,
+                    "error" : f"{type(e).__name__}: {e}",
+                }
+
+def push_ingested_transcripts(results : list, client, batch_size : int = None) -> list:
+    """
+    Pushes the successfully ingested transcripts to the database with bulk writes, the user infos first so the owners of the user datas exist.
+    @Parameters:
+        results - Required : Successful ingestion results. (list) -> Used to create the documents
+        client - Required : Database client. (Utilities.MongoClient) -> Used to push the documents
+        batch_size - Optional : Documents in each bulk write. (int) (default = None) -> None loads DATABASE_DC.BULK_BATCH_SIZE
+    @Returns:
+        push_results - {"status", "document_id", "error"} of each result, in the given order. The status is one of the UserData push statuses. (list)
+    """
+    # Create the documents of each transcript
+    documents = [client.documentisize(result["transcript_data"]) for result in results]
+
+    # Push the user infos, once for each owner, than the user datas.
+    user_info_documents = list({user_info_document["_id"] : user_info_document for user_info_document, _ in documents}.values())
+    client.user_info.bulk_push(user_info_documents, batch_size=batch_size)
+    user_data_results = client.user_data.bulk_push([user_data_document for _, user_data_document in documents], batch_size=batch_size)
+
+    # Return the result of each transcript
+    return [{"status" : push_result["status"], "document_id" : push_result["document_id"], "error" : push_result["error"]} for push_result in user_data_results]
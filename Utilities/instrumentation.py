@@ -0,0 +1,198 @@
+from    Environment     import  INSTRUMENTATION_DC, DEBUG # -> Instrumentation constants
+from    contextlib      import  contextmanager # -> Span scopes
+import  functools # -> Traced functions
+import  threading # -> Thread safe events
+import  json # -> Trace serialization
+import  time # -> Timing
+import  os # -> File operations
+
+class Tracer :
+
+    def __init__(self, enabled : bool = None, profiled_spans : tuple = None, profile_output_folder : str = None) -> None:
+        """
+        Constructor method for Tracer class, which records named spans as Chrome trace events.
+        @Parameters:
+            enabled - Optional : Record the spans. (bool) (default = None) -> None loads INSTRUMENTATION_DC.ENABLED
+            profiled_spans - Optional : Names of the spans profiled with cProfile on DEBUG mode. (tuple) (default = None) -> None loads INSTRUMENTATION_DC.PROFILED_SPANS
+            profile_output_folder - Optional : Folder of the profile outputs. (str) (default = None) -> None loads INSTRUMENTATION_DC.PROFILE_OUTPUT_FOLDER
+        @Returns:
+            None
+        """
+        # Check for tracer config, for ungivens load the default ones from INSTRUMENTATION_DC
+        if enabled is None :
+            enabled = INSTRUMENTATION_DC.ENABLED
+        if profiled_spans is None :
+            profiled_spans = INSTRUMENTATION_DC.PROFILED_SPANS
+        if profile_output_folder is None :
+            profile_output_folder = INSTRUMENTATION_DC.PROFILE_OUTPUT_FOLDER
+
+        # Initialize class fields
+        self.enabled = enabled
+        self.profiled_spans = set(profiled_spans)
+        self.profile_output_folder = profile_output_folder
+        self.origin = time.perf_counter()
+        self.events = []
+        self.thread_names = {}
+        self.profile_counts = {}
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name : str, category : str = "app", **arguments) :
+        """
+        Records the time spent inside the with block as a span. Does nothing when the tracer is disabled.
+        @Parameters:
+            name - Required : Name of the span. (EXMP: "login.parse") (str) -> Used to group the spans
+            category - Optional : Category of the span. (str) (default = "app") -> Used to filter the trace
+            arguments - Optional : Extra values shown on the trace. (dict) -> Used to describe the span
+        @Returns:
+            None
+        """
+        if not self.enabled :
+            yield
+            return
+
+        # Profile the span on DEBUG mode, if it is chosen.
+        profiler = None
+        if DEBUG and name in self.profiled_spans :
+            import cProfile
+            profiler = cProfile.Profile()
+            profiler.enable()
+
+        start_time = time.perf_counter()
+        try :
+            yield
+        finally :
+            end_time = time.perf_counter()
+            if profiler is not None :
+                profiler.disable()
+                self._save_profile(name, profiler)
+            self.record(name, start_time, end_time, category, **arguments)
+
+    def traced(self, name : str = None, category : str = "app") :
+        """
+        Decorator version of span.
+        @Parameters:
+            name - Optional : Name of the span. (str) (default = None) -> None uses the qualified name of the function
+            category - Optional : Category of the span. (str) (default = "app") -> Used to filter the trace
+        @Returns:
+            decorator - The decorator. (callable)
+        """
+        def decorator(function) :
+            span_name = name or function.__qualname__
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs) :
+                if not self.enabled :
+                    return function(*args, **kwargs)
+                with self.span(span_name, category) :
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def record(self, name : str, start_time : float, end_time : float, category : str = "app", **arguments) -> None:
+        """
+        Records a finished span, for the spans measured without the context manager.
+        @Parameters:
+            name - Required : Name of the span. (str) -> Used to group the spans
+            start_time - Required : Start of the span. (time.perf_counter) (float) -> Used to place the span
+            end_time - Required : End of the span. (time.perf_counter) (float) -> Used to place the span
+            category - Optional : Category of the span. (str) (default = "app") -> Used to filter the trace
+            arguments - Optional : Extra values shown on the trace. (dict) -> Used to describe the span
+        @Returns:
+            None
+        """
+        if not self.enabled :
+            return
+        current_thread = threading.current_thread()
+        event = {
+            "name" : name,
+            "cat" : category,
+            "ph" : "X",
+            "ts" : (start_time - self.origin) * 1e6,
+            "dur" : (end_time - start_time) * 1e6,
+            "pid" : os.getpid(),
+            "tid" : current_thread.ident,
+            "args" : {key : str(value) for key, value in arguments.items()},
+        }
+        with self.lock :
+            self.events.append(event)
+            self.thread_names[current_thread.ident] = current_thread.name
+
+    def _save_profile(self, name : str, profiler : object) -> None:
+        """
+        Private method for saving the profile of a span, each run of the span has its own file.
+        @Parameters:
+            name - Required : Name of the span. (str) -> Used to name the file
+            profiler - Required : The finished profiler. (cProfile.Profile) -> Used to be saved
+        @Returns:
+            None
+        """
+        with self.lock :
+            self.profile_counts[name] = self.profile_counts.get(name, 0) + 1
+            run_index = self.profile_counts[name]
+        try :
+            os.makedirs(self.profile_output_folder, exist_ok=True)
+            profiler.dump_stats(os.path.join(self.profile_output_folder, f"{name}.{run_index}.prof"))
+        except OSError :
+            pass
+
+    def get_summary(self) -> dict:
+        """
+        Returns the count and the times of each span, the slowest total first.
+        @Parameters:
+            None
+        @Returns:
+            summary - {name : {"count", "total_time", "mean_time", "max_time"}} in seconds. (dict)
+        """
+        summary = {}
+        with self.lock :
+            for event in self.events :
+                current_record = summary.setdefault(event["name"], {"count" : 0, "total_time" : 0.0, "max_time" : 0.0})
+                current_record["count"] += 1
+                current_record["total_time"] += event["dur"] / 1e6
+                current_record["max_time"] = max(current_record["max_time"], event["dur"] / 1e6)
+        for current_record in summary.values() :
+            current_record["mean_time"] = current_record["total_time"] / current_record["count"]
+        return dict(sorted(summary.items(), key=lambda item : item[1]["total_time"], reverse=True))
+
+    def save_trace(self, output_path : str = None) -> str:
+        """
+        Saves the spans in the Chrome trace event format.
+        @Parameters:
+            output_path - Optional : Path of the trace. (str) (default = None) -> None loads INSTRUMENTATION_DC.TRACE_OUTPUT_PATH
+        @Returns:
+            output_path - Path of the saved trace. (str)
+        """
+        # Check for output path, for ungiven load the default one from INSTRUMENTATION_DC
+        if output_path is None :
+            output_path = INSTRUMENTATION_DC.TRACE_OUTPUT_PATH
+
+        # Name the threads, than add the spans
+        with self.lock :
+            trace_events = [{"name" : "thread_name", "ph" : "M", "pid" : os.getpid(), "tid" : thread_id, "args" : {"name" : thread_name}} for thread_id, thread_name in self.thread_names.items()]
+            trace_events.extend(self.events)
+
+        # Write to a temporary file and move it, so the readers never see a partial trace.
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        temporary_path = f"{output_path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as trace_file :
+            json.dump({"traceEvents" : trace_events, "displayTimeUnit" : "ms"}, trace_file)
+        os.replace(temporary_path, output_path)
+        return output_path
+
+    def reset(self) -> None:
+        """
+        Drops the recorded spans.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        with self.lock :
+            self.events.clear()
+            self.thread_names.clear()
+
+# Process wide tracer, shared by the whole application.
+TRACER = Tracer()
+span = TRACER.span
+traced = TRACER.traced
@@ -0,0 +1,55 @@
+import  importlib # -> Deferred module imports
+import  threading # -> Thread safe first load
+import  types # -> Module proxies
+import  sys # -> Already imported modules
+
+class LazyModule(types.ModuleType) :
+
+    def __init__(self, module_name : str) -> None:
+        """
+        Constructor method for LazyModule class, a stand in of a module which imports it on the first attribute access.
+        @Parameters:
+            module_name - Required : Full name of the module. (EXMP: "matplotlib.figure") (str) -> Used to import the module
+        @Returns:
+            None
+        """
+        super().__init__(module_name)
+
+        # Initialize class fields, over the dict so __getattr__ is not triggered.
+        self.__dict__["_lazy_module"] = None
+        self.__dict__["_lazy_lock"] = threading.Lock()
+
+    def _load(self) -> types.ModuleType:
+        """
+        Private method for importing the module, only the first call imports it.
+        @Parameters:
+            None
+        @Returns:
+            module - The imported module. (module)
+        """
+        if self.__dict__["_lazy_module"] is None :
+            with self.__dict__["_lazy_lock"] :
+                if self.__dict__["_lazy_module"] is None :
+                    self.__dict__["_lazy_module"] = importlib.import_module(self.__name__)
+        return self.__dict__["_lazy_module"]
+
+    def __getattr__(self, attribute_name : str) :
+        return getattr(self._load(), attribute_name)
+
+    def __dir__(self) -> list:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        return f"<lazy module '{self.__name__}' ({'loaded' if self.__dict__['_lazy_module'] is not None else 'not loaded'})>"
+
+def lazy_import(module_name : str) -> types.ModuleType:
+    """
+    Returns a module which is imported on its first use. Already imported modules are returned as they are.
+    @Parameters:
+        module_name - Required : Full name of the module. (EXMP: "PyPDF2") (str) -> Used to import the module
+    @Returns:
+        module - The module or its lazy stand in. (module)
+    """
+    if module_name in sys.modules :
+        return sys.modules[module_name]
+    return LazyModule(module_name)
@@ -1,13 +1,27 @@
-from    urllib.request  import  urlretrieve as get_photo # -> Wrapped utility function for downloading photos from web
 from    abc             import  ABC, abstractmethod # -> Abstract class for creating abstract methods
-from    Environment     import  SELENIUM_DC # -> Selenium constants
+from    Environment     import  SELENIUM_DC, UTILITIES_DC # -> Selenium and SIS constants
 from    datetime        import  datetime # -> Datetime for timestamping
-from    Utilities       import  Web, By # -> Web class for web automation
-from    PIL             import  Image # -> Image for image processing
-import  PyPDF2          as      ppdf # -> PDF reader
+from    Utilities.lazy  import  lazy_import # -> Deferred heavy imports
+from    Utilities.instrumentation   import  traced # -> Parser spans
+from    Utilities.browser_pool  import  BrowserPool, open_web_client # -> Pool of warm browsers
+from    Utilities.parse_cache   import  ParseCache # -> Content addressed cache of parsed transcripts
+from    Utilities.utils     import  create_authenticated_session # -> Logged in SIS session for the http backend
+from    Utilities.photo_fetcher import  get_photo_fetcher, get_user_photo_path # -> Background photo downloads
+from    Utilities.grammar   import  TranscriptParseError, is_semester_header, parse_course_row, parse_course_fields, SEMESTER_SUMMARY_PATTERN, ACADEMIC_STANDING_PATTERN # -> Transcript grammar
+from    urllib.parse    import  urljoin # -> Absolute url of the user photo
+from    collections     import  deque # -> Bounded look behind for the streamed lines
+import  logging # -> Fallback reasons of the http backend
 import  json # -> JSON for file I/O
+import  io # -> In memory file for the already read transcript
 import  re # -> Regular expressions for parsing
 
+# Heavy modules, imported on their first use. (PyPDF2 for the offline parsing, bs4 for the http backend, selenium for the browser backend)
+ppdf = lazy_import("PyPDF2") # -> PDF reader
+bs4 = lazy_import("bs4") # -> HTML parsing for the http backend
+web = lazy_import("Utilities.web") # -> Tag definer for web automation
+
+logger = logging.getLogger(__name__)
+
 class Parser(ABC) :
 
     @abstractmethod
@@ -35,7 +49,13 @@ class Parser(ABC) :
 
 class OnlineParser(Parser) :
 
-    def __init__(self, username : str = None, password : str = None, isHidden : bool = True, save_to_file : bool = False, *args, **kwargs) -> None:
+    # Drop down entries which mean the user has more than one identity, the browser backend selects the major one.
+    IDENTITY_SWITCH_TEXTS = ("Diğer Kimlikler", "Other IDs", "Anadal", "Major")
+
+    # Errors of the http backend which mean the pages drifted from it, only these fall back to the browser. (IndexError and KeyError are LookupErrors too)
+    HTTP_FALLBACK_ERRORS = (LookupError, TranscriptParseError)
+
+    def __init__(self, username : str = None, password : str = None, isHidden : bool = True, save_to_file : bool = False, browser_pool : BrowserPool = None, backend : str = None, *args, **kwargs) -> None:
         """
         Constructor method for OnlineParser class.
         @Parameters:
@@ -43,6 +63,8 @@ class OnlineParser(Parser) :
             password - Optional : Password for logging in to the system. (str) (default = None) -> Used to login to the system
             isHidden - Optional : Boolean value for hiding the browser. (bool) (default = True) -> Used to hide the browser
             save_to_file - Optional : Boolean value for saving the transcript data to a file. (bool) (default = False) -> Used to save the transcript data to a file
+            browser_pool - Optional : Pool of the hidden browsers. (BrowserPool) (default = None) -> None uses the process wide pool
+            backend - Optional : "http" or "selenium". (str) (default = None) -> None loads SELENIUM_DC.OLEXER_BACKEND, "http" falls back to "selenium" on failure
         @Returns:
             None
         """
@@ -54,12 +76,19 @@ class OnlineParser(Parser) :
         self.password = password
 
         self.isHidden = isHidden
+        self.browser_pool = browser_pool
+        self.backend = SELENIUM_DC.OLEXER_BACKEND if backend is None else backend
+        self.used_backend = None
+
+        self.user_photo_path = None
+        self.photo_future = None
 
         self.save_to_file = save_to_file
 
         self.extracted = None
         self.transcript_data = None
 
+    @traced("OnlineParser._extract_transcript_information", "parser")
     def _extract_transcript_information(self) -> None:
         """
         Private method for extracting transcript information from the source.
@@ -68,81 +97,176 @@ class OnlineParser(Parser) :
         @Returns:
             None
         """
+        # Extract over the selected backend
+        if self.backend == "http" :
+            self._extract_over_http()
+        else :
+            self._extract_over_browser()
+
+    def _wait_for_photo(self) -> None:
+        """
+        Private method for waiting the background photo download. A failed download leaves the user without a photo, it does not fail the parsing.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        if self.photo_future is None :
+            return
+        try :
+            self.user_photo_path = self.photo_future.result()
+        except Exception :
+            self.user_photo_path = None
+        self.photo_future = None
+
+    @staticmethod
+    def _get_table_text(table : object) -> str:
+        """
+        Private method for converting a html table to the text that the browser renders for it. (Rows by lines, cells by spaces)
+        @Parameters:
+            table - Required : Table tag. (bs4.Tag) -> Used to be converted
+        @Returns:
+            table_text - Text of the table. (str)
+        """
+        # Join the cells of each row of the table, rows of the nested tables are already inside of their cells.
+        rows = []
+        for current_row in table.find_all("tr") :
+            if current_row.find_parent("table") is not table :
+                continue
+            row_text = " ".join(" ".join(current_cell.get_text(" ", strip=True).split()) for current_cell in current_row.find_all(["th", "td"], recursive=False))
+            if row_text.strip() :
+                rows.append(row_text.strip())
+
+        # Return the rendered text
+        return "\n".join(rows)
+
+    def _extract_over_http(self) -> None:
+        """
+        Private method for extracting transcript information over a logged in http session, without a browser.
+        @Parameters:
+            None
+        @Returns:
+            None
+        @Raises:
+            PermissionError : If the credentials are rejected.
+            LookupError : If the page does not fit to the http backend. (identity selection is needed, transcript tables are missing)
+        """
+        # Log in with a plain session
+        session = create_authenticated_session(self.username, self.password)
+        if session is None :
+            raise PermissionError("SIS authentication failed")
+
+        with session :
+            # Read the home page, it holds the user photo and the identity menu.
+            home_page = session.get(UTILITIES_DC.AUTH_SEC_URL)
+            home_page.raise_for_status()
+            parsed_home_page = bs4.BeautifulSoup(home_page.text, "html.parser")
+
+            # Users with more than one identity need the major selection, which is done by the browser backend.
+            drop_down_menu = parsed_home_page.select_one(SELENIUM_DC.OLEXER_DROP_DOWN_MENU_SELECTOR)
+            if drop_down_menu is not None and any(current_tag.get_text(strip=True) in self.IDENTITY_SWITCH_TEXTS for current_tag in drop_down_menu.find_all("a")) :
+                raise LookupError("Identity selection is required")
+
+            # Download user photo in the background, while the transcript page is fetched. A missing photo leaves the user without a photo, same as a failed download.
+            user_photo_label = parsed_home_page.select_one(SELENIUM_DC.OLEXER_USER_PHOTO_SELECTOR)
+            if user_photo_label is not None and user_photo_label.get(SELENIUM_DC.OLEXER_SOURCE_ATTRIBUTE_TAGS[0]) :
+                user_photo_src = urljoin(home_page.url, user_photo_label.get(SELENIUM_DC.OLEXER_SOURCE_ATTRIBUTE_TAGS[0]))
+                self.photo_future = get_photo_fetcher().fetch(user_photo_src, get_user_photo_path(self.username), session=session, user_key=self.username)
+            else :
+                logger.info("User photo is not found on the home page, going on without it")
+
+            # Open transcript page
+            transcript_page = session.get(SELENIUM_DC.OLEXER_TRANSCRIPT_URL)
+            transcript_page.raise_for_status()
+
+            # The photo needs the cookies of the session, so wait for it before the session is closed.
+            self._wait_for_photo()
+
+        # Extract data from tables
+        parsed_transcript_page = bs4.BeautifulSoup(transcript_page.text, "html.parser")
+        output = [self._get_table_text(current_table) for current_table in parsed_transcript_page.find_all(SELENIUM_DC.OLEXER_SOURCE_ATTRIBUTE_TAGS[2])]
+        if not output :
+            raise LookupError("Transcript tables are not found")
+
+        # Set extracted data
+        self.extracted = output
+
+    def _extract_over_browser(self) -> None:
+        """
+        Private method for extracting transcript information by driving a browser.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
 
         # Get main url
         main_url = SELENIUM_DC.OLEXER_SYSTEM_LOGIN_URL
 
-        # Initialize web client with main url
-        client = Web(isHidden=self.isHidden)
-        client.open_web_page(main_url)
+        # Take a browser with a clean session, hidden ones come from the warm pool
+        with open_web_client(isHidden=self.isHidden, browser_pool=self.browser_pool) as client :
+            client.open_web_page(main_url)
 
-        # Get username entry and send username
-        username_entry = client.create_element(SELENIUM_DC.OLEXER_USERNAME_ENTRY_XPATH)
-        username_entry.send_keys(self.username)
+            # Get username entry and send username
+            username_entry = client.create_element(SELENIUM_DC.OLEXER_USERNAME_ENTRY_XPATH)
+            username_entry.send_keys(self.username)
 
-        # Get password entry and send password
-        password_entry = client.create_element(SELENIUM_DC.OLEXER_PASSWORD_ENTRY_XPATH)
-        password_entry.send_keys(self.password)
+            # Get password entry and send password
+            password_entry = client.create_element(SELENIUM_DC.OLEXER_PASSWORD_ENTRY_XPATH)
+            password_entry.send_keys(self.password)
 
-        # Get login button and click
-        login_button = client.create_element(SELENIUM_DC.OLEXER_LOGIN_BUTTON_XPATH)
-        login_button.click()
+            # Get login button and click
+            login_button = client.create_element(SELENIUM_DC.OLEXER_LOGIN_BUTTON_XPATH)
+            login_button.click()
 
-        # Get continue button and click
-        continue_button = client.create_element(SELENIUM_DC.OLEXER_CONTINUE_BUTTON_XPATH)
-        continue_button.click()
-                
-        # Get user photo label and source
-        user_photo_label = client.create_element(SELENIUM_DC.OLEXER_USER_PHOTO_LABEL_XPATH)
-        user_photo_src = user_photo_label.get_attribute(SELENIUM_DC.OLEXER_SOURCE_ATTRIBUTE_TAGS[0])
-
-        # Download user photo
-        get_photo(user_photo_src, SELENIUM_DC.USER_PHOTO_OUTPUT_PATH)
-        # Convert the photo.
-        photo = Image.open(SELENIUM_DC.USER_PHOTO_OUTPUT_PATH)
-        photo.save(SELENIUM_DC.USER_PHOTO_OUTPUT_PATH, "PNG")
-
-        # Get profile selection label and click to move on.
-        profile_selection_label = client.create_element(SELENIUM_DC.OLEXER_PROFILE_SELECTION_XPATH)
-        profile_selection_label.click()
-
-        # Iterate through the drop down menu and select the major inside list if exist.
-        drop_down_menu = client.create_element(SELENIUM_DC.OLEXER_DROP_DOWN_MENU_XPATH)
-        check_list = ["Diğer Kimlikler", "Other IDs", "Anadal", "Major"]
-        flag = False
-        for current_element in drop_down_menu.find_elements(by=By.TAG_NAME, value="a") :
-            # Search for major inside the drop down menu
-            if current_element.text in check_list :
-                client.click_on_element(current_element)
-                # check if major is found
-                idSelectionMenu = client.create_element(SELENIUM_DC.OLEXER_ID_SELECTION_XPATH)
-                for element in idSelectionMenu.find_elements(by=By.TAG_NAME, value="a") :
-                    if element.get_attribute(SELENIUM_DC.OLEXER_SOURCE_ATTRIBUTE_TAGS[1]).split("-")[-1].strip() in check_list :
-                        # if also passed the check, click on it, open the system with major and continue
-                        client.click_on_element(element)
-                        flag = True
-                        # break the loop to avoid unnecessary iterations and buggy result
-                        break
-                break
-        if flag:
-            # If flag is set, it means the page refreshed with major, so repeat the continue_button process
+            # Get continue button and click
             continue_button = client.create_element(SELENIUM_DC.OLEXER_CONTINUE_BUTTON_XPATH)
-            client.click_on_element(continue_button)
+            continue_button.click()
+                
+            # Get user photo label and source
+            user_photo_label = client.create_element(SELENIUM_DC.OLEXER_USER_PHOTO_LABEL_XPATH)
+            user_photo_src = user_photo_label.get_attribute(SELENIUM_DC.OLEXER_SOURCE_ATTRIBUTE_TAGS[0])
 
-        # Open transcript page
-        transkriptUrl = SELENIUM_DC.OLEXER_TRANSCRIPT_URL
-        client.open_web_page(transkriptUrl)
+            # Download user photo in the background, the scraping goes on meanwhile.
+            self.photo_future = get_photo_fetcher().fetch(user_photo_src, get_user_photo_path(self.username), user_key=self.username)
 
-        # Get transcript table
-        table_elements = client.browser.find_elements(By.TAG_NAME, SELENIUM_DC.OLEXER_SOURCE_ATTRIBUTE_TAGS[2])
+            # Get profile selection label and click to move on.
+            profile_selection_label = client.create_element(SELENIUM_DC.OLEXER_PROFILE_SELECTION_XPATH)
+            profile_selection_label.click()
 
-        # Extract data from table
-        output = []
-        for element in table_elements :
-            output.append(element.text)
+            # Iterate through the drop down menu and select the major inside list if exist.
+            drop_down_menu = client.create_element(SELENIUM_DC.OLEXER_DROP_DOWN_MENU_XPATH)
+            flag = False
+            for current_element in drop_down_menu.find_elements(by=web.By.TAG_NAME, value="a") :
+                # Search for major inside the drop down menu
+                if current_element.text in self.IDENTITY_SWITCH_TEXTS :
+                    client.click_on_element(current_element, metric_key=SELENIUM_DC.OLEXER_DROP_DOWN_MENU_XPATH)
+                    # check if major is found
+                    idSelectionMenu = client.create_element(SELENIUM_DC.OLEXER_ID_SELECTION_XPATH)
+                    for element in idSelectionMenu.find_elements(by=web.By.TAG_NAME, value="a") :
+                        if element.get_attribute(SELENIUM_DC.OLEXER_SOURCE_ATTRIBUTE_TAGS[1]).split("-")[-1].strip() in self.IDENTITY_SWITCH_TEXTS :
+                            # if also passed the check, click on it, open the system with major and continue
+                            client.click_on_element(element, metric_key=SELENIUM_DC.OLEXER_ID_SELECTION_XPATH)
+                            flag = True
+                            # break the loop to avoid unnecessary iterations and buggy result
+                            break
+                    break
+            if flag:
+                # If flag is set, it means the page refreshed with major, so repeat the continue_button process
+                continue_button = client.create_element(SELENIUM_DC.OLEXER_CONTINUE_BUTTON_XPATH)
+                client.click_on_element(continue_button, metric_key=SELENIUM_DC.OLEXER_CONTINUE_BUTTON_XPATH)
 
-        # Close the browser
-        client.browser.quit()
+            # Open transcript page
+            transkriptUrl = SELENIUM_DC.OLEXER_TRANSCRIPT_URL
+            client.open_web_page(transkriptUrl)
+
+            # Get transcript table
+            table_elements = client.browser.find_elements(web.By.TAG_NAME, SELENIUM_DC.OLEXER_SOURCE_ATTRIBUTE_TAGS[2])
+
+            # Extract data from table
+            output = []
+            for element in table_elements :
+                output.append(element.text)
 
         # Set extracted data
         self.extracted = output
@@ -182,6 +306,7 @@ class OnlineParser(Parser) :
         # Return the data
         return data_1, data_2
 
+    @traced("OnlineParser._parse_transcript_information", "parser")
     def _parse_transcript_information(self) -> None:
         """
         Private method for parsing extracted transcript information from the source.
@@ -222,7 +347,7 @@ class OnlineParser(Parser) :
         for current_course in output :
 
             prep = "PREP" in current_course
-            semester = current_course.startswith("Semester Credits Attempted") or current_course.startswith("Dönem Alınan Kredi")
+            semester = SEMESTER_SUMMARY_PATTERN.match(current_course) is not None
             student = "Student ID" in current_course or "Öğrenci Numarası" in current_course
 
             # Pass the prep courses when parsing
@@ -232,28 +357,19 @@ class OnlineParser(Parser) :
             semester_parse = current_course.split("\n")
             semester_definition = semester_parse.pop(0)
             semester_parse.pop(0) # remove junk info (colum names)
-            if "Academic Standing" in semester_parse[-1] or "Akademik Durum" in semester_parse[-1] :
+            if ACADEMIC_STANDING_PATTERN.search(semester_parse[-1]) :
                 semester_parse.pop() # remove junk info (academic standing)
-            cumulative_credits_attempted = semester_parse.pop()
-            semester_credits_attempted = semester_parse.pop()
+            semester_parse.pop() # remove junk info (cumulative credits attempted)
+            semester_parse.pop() # remove junk info (semester credits attempted)
             course_list = semester_parse
             # Iterate over courses
             for course_index, course_info in enumerate(course_list) :
 
-                course_info_parse = course_info.split(" ")
-
-                course_code = course_info_parse.pop(0) + " " + course_info_parse.pop(0)
-                course_list[course_index] = {
-                    "course_code" : course_code,
-                    "course_name" : " ".join(course_info_parse[:-4]),
-                    "course_lang" : course_info_parse[-4],
-                    "course_credit" : course_info_parse[-3],
-                    "course_grade" : course_info_parse[-2],
-                    "course_grade_point" : course_info_parse[-1],
-                }
+                # Parse the course row by the grammar, layout drifts are raised.
+                course_list[course_index] = parse_course_row(course_info)
 
                 # Skip the repeated courses
-                if course_code[-1] != "*" :
+                if course_list[course_index]["course_code"][-1] != "*" :
                     original_course_list.append(course_list[course_index])
 
             # Update the semester
@@ -291,6 +407,7 @@ class OnlineParser(Parser) :
         # Update the transcript data
         self.transcript_data = output
 
+    @traced("OnlineParser.get_transcript_data", "parser")
     def get_transcript_data(self) -> dict :
         """
         Private method for getting transcript data.
@@ -300,23 +417,51 @@ class OnlineParser(Parser) :
             dict : Transcript data
         """
         
+        # Try the http backend first, a drift of the pages falls back to the browser. Rejected credentials, network errors and the other bugs are raised.
+        if self.backend == "http" :
+            try :
+                self._extract_over_http()
+                self._parse_transcript_information()
+                self.used_backend = "http"
+                return self.transcript_data
+            except self.HTTP_FALLBACK_ERRORS as error :
+                logger.warning("Http backend failed, falling back to the browser -> %s : %s", type(error).__name__, error)
+
         # Extract transcript information
-        self._extract_transcript_information()
+        self._extract_over_browser()
         
         # Parse transcript information
         self._parse_transcript_information()
+        self.used_backend = "selenium"
+
+        # Collect the photo downloaded in the background
+        self._wait_for_photo()
 
         # Return the transcript data
         return self.transcript_data
     
 class OfflineParser(Parser) :
 
-    def __init__(self, path_to_file : str = None, save_to_file : str = False, *args, **kwargs) -> None:
+    # Number of trailing lines (grading system, address etc.) at the end of the transcript.
+    FOOTER_LINE_COUNT = 31
+    # Number of column title lines of a semester, by its first title.
+    COLUMN_TITLE_COUNTS = {"Course Code" : 7, "Ders Kodu" : 6}
+    # Lines that close the course list of a semester.
+    SEMESTER_TERMINATORS = ("Semester", "Dönem")
+    # Number of lines of a course, one per field.
+    COURSE_LINE_COUNT = 6
+    # Version of the parsing logic, must be increased on any change of the output. (Invalidates the parse cache)
+    PARSER_VERSION = "2"
+
+    def __init__(self, path_to_file : str = None, save_to_file : str = False, stream : bool = False, use_cache : bool = False, cache : ParseCache = None, *args, **kwargs) -> None:
         """
         Constructor method for OfflineParser class.
         @Parameters:
             path_to_file (str) : Path to the transcript file. (default : None) -> Used to extract transcript information.
             save_to_file (bool) : Save the transcript data to file. (default : False) -> Used to save transcript data to file.
+            stream (bool) : Extract the lines page by page while parsing. (default : False) -> Used to keep the memory flat on long transcripts.
+            use_cache (bool) : Use the parse cache, a hit skips the pdf reading. (default : False) -> Used to avoid reparsing the same file.
+            cache (ParseCache) : Parse cache to be used. (default : None) -> None creates the default one under Sources.
         @Returns:
             None
         """
@@ -327,10 +472,16 @@ class OfflineParser(Parser) :
         self.path_to_file = path_to_file
 
         self.save_to_file = save_to_file
+        self.stream = stream
+
+        self.use_cache = use_cache
+        self.cache = cache if cache is not None else (ParseCache() if use_cache else None)
+        self.pdf_bytes = None
 
         self.extracted = None
         self.transcript_data = None
 
+    @traced("OfflineParser._extract_transcript_information", "parser")
     def _extract_transcript_information(self) -> None :
         """
         Private method for extracting transcript information from the source.
@@ -339,8 +490,13 @@ class OfflineParser(Parser) :
         @Returns:
             None
         """
+        # On stream mode, pages are decoded lazily while the parser consumes the lines.
+        if self.stream :
+            self.extracted = self._stream_transcript_information()
+            return
+
         # Read the pdf file
-        pdf_file = ppdf.PdfReader(self.path_to_file)
+        pdf_file = ppdf.PdfReader(self._get_pdf_source())
 
         # Iterate over pages and extract text
         output = []
@@ -352,6 +508,127 @@ class OfflineParser(Parser) :
         # Update the extracted data
         self.extracted = output
 
+    def _get_pdf_source(self) :
+        """
+        Private method for getting the source of the pdf reader. The content is reused, if it is already read for the cache key.
+        @Parameters:
+            None
+        @Returns:
+            source (str | io.BytesIO) : Path or in memory content of the transcript file.
+        """
+        if self.pdf_bytes is not None :
+            return io.BytesIO(self.pdf_bytes)
+        return self.path_to_file
+
+    def _stream_transcript_information(self) :
+        """
+        Private generator for extracting transcript information page by page.
+        @Parameters:
+            None
+        @Yields:
+            current_line (str) : The next line of the transcript.
+        """
+        # Read the pdf file, pages are decoded only when they are reached.
+        pdf_file = ppdf.PdfReader(self._get_pdf_source())
+
+        # Iterate over pages and yield their lines
+        for current_page in pdf_file.pages :
+            yield from current_page.extract_text().split("\n")
+
+    def _drop_footer(self, lines) :
+        """
+        Private generator for dropping the footer lines of the transcript, without knowing its length in advance.
+        @Parameters:
+            lines (iterator) : Lines of the transcript. -> Used to be filtered.
+        @Yields:
+            current_line (str) : The next line which is not a part of the footer.
+        """
+        # Hold the last FOOTER_LINE_COUNT lines back, they are released only when a newer line arrives.
+        held_back = deque()
+        for current_line in lines :
+            held_back.append(current_line)
+            if len(held_back) > self.FOOTER_LINE_COUNT :
+                yield held_back.popleft()
+
+    def _tokenize_semesters(self, lines) :
+        """
+        Private generator for tokenizing the semesters in a single pass, each semester is yielded as soon as the next one starts.
+        @Parameters:
+            lines (iterator) : Lines of the transcript, starting with the first semester definition. -> Used to be tokenized.
+        @Yields:
+            semester_definition (str) : Definition of the semester.
+            course_list (list) : Parsed courses of the semester.
+        """
+        # Initialize the cursor state with the first semester
+        semester_definition = next(lines)
+        state = "titles"
+        remaining_titles = 0
+        is_prep = semester_definition == "Prep"
+        course_list = []
+        current_course = []
+
+        def release() :
+            """
+            Closes the current semester. Returns None for the prep semesters, they are not parsed.
+            """
+            if is_prep :
+                return None
+            if state == "invalid" :
+                raise TranscriptParseError(f"Unexpected column titles for \"{semester_definition}\"")
+            # Add the last course to course list
+            if current_course :
+                course_list.append(parse_course_fields(current_course))
+            return semester_definition, course_list
+
+        # Iterate over stream data, move the cursor one line at a time
+        for current_string in lines :
+            # Check if current string is a splitter, than release the current semester and start the next one
+            if is_semester_header(current_string) :
+                released = release()
+                if released is not None :
+                    yield released
+                semester_definition = current_string
+                state = "titles"
+                is_prep = False
+                course_list = []
+                current_course = []
+                continue
+
+            # Prep semesters are marked, they are dropped on release
+            if current_string == "Prep" :
+                is_prep = True
+
+            if state == "titles" :
+                # remove junk info (colum names), the first title tells how many of them exist
+                if remaining_titles == 0 :
+                    if current_string not in self.COLUMN_TITLE_COUNTS :
+                        state = "invalid"
+                        continue
+                    remaining_titles = self.COLUMN_TITLE_COUNTS[current_string]
+                remaining_titles -= 1
+                if remaining_titles == 0 :
+                    state = "courses"
+
+            elif state == "courses" :
+                # Check if current string closes the course list
+                if current_string in self.SEMESTER_TERMINATORS :
+                    state = "trailer"
+                    continue
+
+                # Check if current string is a course code, than the previous course is completed
+                if len(current_course) == self.COURSE_LINE_COUNT :
+                    course_list.append(parse_course_fields(current_course))
+                    current_course = []
+
+                # Add current string to current course
+                current_course.append(current_string)
+
+        # Release the final semester
+        released = release()
+        if released is not None :
+            yield released
+
+    @traced("OfflineParser._parse_transcript_information", "parser")
     def _parse_transcript_information(self) -> None:
         """
         Private method for parsing extracted transcript information from the source.
@@ -360,125 +637,46 @@ class OfflineParser(Parser) :
         @Returns:
             None
         """
-        # Initialize the output
-        output = self.extracted
+        # Initialize the output, works for both of the extracted list and the page stream.
+        output = iter(self.extracted)
         # remove unnecessary elements
-        if "T.C" in output[0] :
-            output.pop(0) # T.C
+        first_line = next(output)
+        if "T.C" in first_line :
+            next(output) # univercity info
             sis_language = "tr"
         else :
             sis_language = "en"
-        output.pop(0) # univercity info
-        output.pop(0) # univercity info
-        for i in range(31) :
-            output.pop() # removing unneccessary elements
-
-        date = output.pop(0) # date
-
-        output.pop(0)
-        student_school_id = output.pop(0) # student id
-        output.pop(0)
-        student_national_id = output.pop(0) # national id
-        output.pop(0)
-        student_name = output.pop(0) # student name
-        output.pop(0)
-        student_surname = output.pop(0) # student surname
-        output.pop(0)
-        student_faculty = output.pop(0) # student department
-        output.pop(0)
-        student_department = output.pop(0) # student program
-        output.pop(0)
-        language_of_instruction = output.pop(0) # language of instruction
-        output.pop(0)
-        student_status = output.pop(0) # student status
-
-        # Set splitters for semester seperation
-        splitters = [
-            "Fall Semester", "Spring Semester", "Summer School", "Fall Dönemi", "Spring Dönemi", "Bahar Dönemi", "Güz Dönemi", "Yaz Okulu"
-        ]
-        founded_semesters = []
-        temp = [output.pop(0)]
-        # Iterate over stream data and seperate semesters
-        for current_string in output :
-            # Get current string
-            checker = " ".join(current_string.split(" ")[1:])
-            
-            # Check if current string is a splitter
-            if checker in splitters :
-                # Add current semester to founded semesters
-                founded_semesters.append(temp)
-                temp = [current_string]
-            else :
-                # Add current string to current semester
-                temp.extend([current_string])
-        
-        # Add the final semester to founded semesters
-        founded_semesters.append(temp)
-
-        # clean prep semesters
-        clean_index = []
-        for semester_index, current_semester in enumerate(founded_semesters) :
-            if "Prep" in current_semester :
-                clean_index.append(semester_index)
-
-        # remove prep semesters
-        for index in reversed(clean_index) :
-            founded_semesters.pop(index)
-
-        # Iterate over founded semesters and parse them
+        next(output) # univercity info
+        output = self._drop_footer(output) # removing unneccessary elements
+
+        date = next(output) # date
+
+        next(output)
+        student_school_id = next(output) # student id
+        next(output)
+        student_national_id = next(output) # national id
+        next(output)
+        student_name = next(output) # student name
+        next(output)
+        student_surname = next(output) # student surname
+        next(output)
+        student_faculty = next(output) # student department
+        next(output)
+        student_department = next(output) # student program
+        next(output)
+        language_of_instruction = next(output) # language of instruction
+        next(output)
+        student_status = next(output) # student status
+
+        # Iterate over tokenized semesters, prep semesters are already cleaned.
         semesters = {}
         semester_no = 1
         original_course_list = []
-        for semester_index, current_semester in enumerate(founded_semesters) :
-            
-            semester_definition = current_semester.pop(0)
-
-            # remove junk info from each semester
-            if current_semester[0] == "Course Code" :
-                count = 7
-            elif current_semester[0] == "Ders Kodu" :
-                count = 6
-            for i in range(count) :
-                current_semester.pop(0)
-
-            # Set feature literals for parsing
-            course_list = []
-            temp = {}
-            add_count = 1
-            map_hash = {
-                1 : "course_code",
-                2 : "course_name",
-                3 : "course_lang",
-                4 : "course_credit",
-                5 : "course_grade",
-                6 : "course_grade_point"
-            }
-            for current_string in current_semester :
-                # Check if current string is a splitter
-                if current_string == "Semester" or current_string == "Dönem":
-                    break
-                
-                # Check if current string is a course code
-                if add_count == 7 :
-                    course_list.append(temp)
-
-                    # Check if current course is a repeated course
-                    if temp["course_code"][-1] != "*" :
-                        original_course_list.append(temp)
-
-                    temp = {}
-                    add_count = 1
+        for semester_definition, course_list in self._tokenize_semesters(output) :
 
-                # Add current string to temp
-                temp[map_hash[add_count]] = current_string
-                # Update add count to avoid errors via not founding next course code
-                add_count += 1
+            # Skip the repeated courses
+            original_course_list.extend(course for course in course_list if course["course_code"][-1] != "*")
 
-            # Add the last course to course list
-            course_list.append(temp)
-            if temp["course_code"][-1] != "*" :
-                original_course_list.append(temp)
-                        
             # Add current semester to semesters
             semesters[f"semester_{semester_no}"] = {
                 "semester_definition" : semester_definition,
@@ -514,6 +712,7 @@ class OfflineParser(Parser) :
         # Set transcript data
         self.transcript_data = output
 
+    @traced("OfflineParser.get_transcript_data", "parser")
     def get_transcript_data(self) -> dict :
         """
         Private method for getting transcript data.
@@ -522,18 +721,37 @@ class OfflineParser(Parser) :
         @Returns:
             transcript_data (dict) : Transcript data.
         """
+        # Check the parse cache first, a hit does not touch the pdf reader at all.
+        if self.use_cache :
+            with open(self.path_to_file, "rb") as pdf_file :
+                self.pdf_bytes = pdf_file.read()
+            cache_key = ParseCache.make_key(self.pdf_bytes, self.PARSER_VERSION)
+            cached_data = self.cache.get(cache_key)
+            if cached_data is not None :
+                # Refresh the date, it belongs to this parsing not to the cached one.
+                cached_data["transcript_manager_date"] = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+                self.transcript_data = cached_data
+                return self.transcript_data
+
         # Extract transcript information
         self._extract_transcript_information()
 
         # Parse transcript information
         self._parse_transcript_information()
 
+        # Store the result for the next parsing of the same file. The cache is optional, a folder which can not be written (read-only install, full disk) must not fail the parsing.
+        if self.use_cache :
+            try :
+                self.cache.put(cache_key, self.transcript_data)
+            except OSError :
+                pass
+
         # Return transcript data
         return self.transcript_data
     
 class UserVerifier() :
 
-    def __init__(self, username : str = None, password : str = None, isHidden : bool = True, match_id : str = None, *args, **kwargs) -> None:
+    def __init__(self, username : str = None, password : str = None, isHidden : bool = True, match_id : str = None, browser_pool : BrowserPool = None, *args, **kwargs) -> None:
         """
         Constructor method for UserVerifier class.
         @Parameters:
@@ -541,6 +759,7 @@ class UserVerifier() :
             password - Optional : Password for user verification. (str) (default = None) -> Used to connect to the system.
             isHidden - Optional : Is the browser hidden? (bool) (default = True) -> Used to connect set Web class.
             match_id - Optional : Match id for user verification. (str) (default = None) -> Used to compare with received id.
+            browser_pool - Optional : Pool of the hidden browsers. (BrowserPool) (default = None) -> None uses the process wide pool.
         @Returns:
             None
         """
@@ -549,6 +768,7 @@ class UserVerifier() :
         self.password = password
 
         self.isHidden = isHidden
+        self.browser_pool = browser_pool
 
         self.match_id = match_id
         self.received_id = None
@@ -567,63 +787,52 @@ class UserVerifier() :
         # Get main url
         main_url = SELENIUM_DC.OLEXER_SYSTEM_LOGIN_URL
 
-        # Initialize web client with main url
-        client = Web(isHidden=self.isHidden)
-        client.open_web_page(main_url)
+        # Take a browser with a clean session, hidden ones come from the warm pool
+        with open_web_client(isHidden=self.isHidden, browser_pool=self.browser_pool) as client :
+            client.open_web_page(main_url)
 
-        # Get username entry and send username
-        username_entry = client.create_element(SELENIUM_DC.OLEXER_USERNAME_ENTRY_XPATH)
-        username_entry.send_keys(self.username)
+            # Get username entry and send username
+            username_entry = client.create_element(SELENIUM_DC.OLEXER_USERNAME_ENTRY_XPATH)
+            username_entry.send_keys(self.username)
 
-        # Get password entry and send password
-        password_entry = client.create_element(SELENIUM_DC.OLEXER_PASSWORD_ENTRY_XPATH)
-        password_entry.send_keys(self.password)
+            # Get password entry and send password
+            password_entry = client.create_element(SELENIUM_DC.OLEXER_PASSWORD_ENTRY_XPATH)
+            password_entry.send_keys(self.password)
 
-        # Get login button and click
-        login_button = client.create_element(SELENIUM_DC.OLEXER_LOGIN_BUTTON_XPATH)
-        login_button.click()
+            # Get login button and click
+            login_button = client.create_element(SELENIUM_DC.OLEXER_LOGIN_BUTTON_XPATH)
+            login_button.click()
 
-        # Get continue button and click
-        continue_button = client.create_element(SELENIUM_DC.OLEXER_CONTINUE_BUTTON_XPATH)
-        continue_button.click()
-                
-        # Get profile selection label and click to move on.
-        profile_selection_label = client.create_element(SELENIUM_DC.OLEXER_PROFILE_SELECTION_XPATH)
-        profile_selection_label.click()
-
-        # Iterate through the drop down menu and select the major inside list if exist.
-        drop_down_menu = client.create_element(SELENIUM_DC.OLEXER_DROP_DOWN_MENU_XPATH)
-        check_list = ["Diğer Kimlikler", "Other IDs", "Anadal", "Major"]
-        flag = False
-        for current_element in drop_down_menu.find_elements(by=By.TAG_NAME, value="a") :
-            # Search for major inside the drop down menu
-            if current_element.text in check_list :
-                client.click_on_element(current_element)
-                # check if major is found
-                idSelectionMenu = client.create_element(SELENIUM_DC.OLEXER_ID_SELECTION_XPATH)
-                for element in idSelectionMenu.find_elements(by=By.TAG_NAME, value="a") :
-                    if element.get_attribute(SELENIUM_DC.OLEXER_SOURCE_ATTRIBUTE_TAGS[1]).split("-")[-1].strip() in check_list :
-                        # if also passed the check, click on it, open the system with major and continue
-                        client.click_on_element(element)
-                        flag = True
-                        # break the loop to avoid unnecessary iterations and buggy result
-                        break
-                break
-        if flag:
-            # If flag is set, it means the page refreshed with major, so repeat the continue_button process
+            # Get continue button and click
             continue_button = client.create_element(SELENIUM_DC.OLEXER_CONTINUE_BUTTON_XPATH)
-            client.click_on_element(continue_button)
-
-        # Get student selection label and click to move on.
-        profile_selection_label = client.create_element(SELENIUM_DC.OLEXER_PROFILE_SELECTION_XPATH)
-        profile_selection_label.click()
+            continue_button.click()
+                
+            # Get profile selection label and click to move on.
+            profile_selection_label = client.create_element(SELENIUM_DC.OLEXER_PROFILE_SELECTION_XPATH)
+            profile_selection_label.click()
 
-        # Get student info a tag
-        student_info_a_tag = client.create_element(SELENIUM_DC.OLEXER_STUDENT_INFO_XPATH)
+            # Iterate through the drop down menu and select the major inside list if exist.
+            drop_down_menu = client.create_element(SELENIUM_DC.OLEXER_DROP_DOWN_MENU_XPATH)
+            flag = False
+            for current_element in drop_down_menu.find_elements(by=web.By.TAG_NAME, value="a") :
+                # Search for major inside the drop down menu
+                if current_element.text in OnlineParser.IDENTITY_SWITCH_TEXTS :
+                    client.click_on_element(current_element, metric_key=SELENIUM_DC.OLEXER_DROP_DOWN_MENU_XPATH)
+                    # check if major is found
+                    idSelectionMenu = client.create_element(SELENIUM_DC.OLEXER_ID_SELECTION_XPATH)
+                    for element in idSelectionMenu.find_elements(by=web.By.TAG_NAME, value="a") :
+                        if element.get_attribute(SELENIUM_DC.OLEXER_SOURCE_ATTRIBUTE_TAGS[1]).split("-")[-1].strip() in OnlineParser.IDENTITY_SWITCH_TEXTS :
+                            # if also passed the check, click on it, open the system with major and continue
+                            client.click_on_element(element, metric_key=SELENIUM_DC.OLEXER_ID_SELECTION_XPATH)
+                            flag = True
+                            # break the loop to avoid unnecessary iterations and buggy result
+                            break
+                    break
+            if flag:
+                # If flag is set, it means the page refreshed with major, so repeat the continue_button process
+                continue_button = client.create_element(SELENIUM_DC.OLEXER_CONTINUE_BUTTON_XPATH)
+                client.click_on_element(continue_button, metric_key=SELENIUM_DC.OLEXER_CONTINUE_BUTTON_XPATH)
 
-        # Check if student info a tag is empty, then repeat the process of getting profile selection label and clicking on it. than get student info a tag again.
-        if student_info_a_tag.text == "" :
-            
             # Get student selection label and click to move on.
             profile_selection_label = client.create_element(SELENIUM_DC.OLEXER_PROFILE_SELECTION_XPATH)
             profile_selection_label.click()
@@ -631,8 +840,18 @@ class UserVerifier() :
             # Get student info a tag
             student_info_a_tag = client.create_element(SELENIUM_DC.OLEXER_STUDENT_INFO_XPATH)
 
-        # Get student id and set it.
-        self.received_id = re.findall(r"\d+", student_info_a_tag.text)[0]
+            # Check if student info a tag is empty, then repeat the process of getting profile selection label and clicking on it. than get student info a tag again.
+            if student_info_a_tag.text == "" :
+            
+                # Get student selection label and click to move on.
+                profile_selection_label = client.create_element(SELENIUM_DC.OLEXER_PROFILE_SELECTION_XPATH)
+                profile_selection_label.click()
+
+                # Get student info a tag
+                student_info_a_tag = client.create_element(SELENIUM_DC.OLEXER_STUDENT_INFO_XPATH)
+
+            # Get student id and set it.
+            self.received_id = re.findall(r"\d+", student_info_a_tag.text)[0]
 
     def _compare_ids(self) -> bool:
         """
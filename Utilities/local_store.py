@@ -0,0 +1,795 @@
+from    Environment         import  DATABASE_DC # -> Local store and sync constants
+from    Utilities.database  import  UserData, create_user_documents, get_mongo_client # -> Remote database, its push statuses and documents
+from    Utilities.transcript_schema import  encode_document, decode_document # -> Compact stored documents
+from    bson                import  json_util # -> Serialization of the documents (ObjectId, datetime...)
+import  threading # -> Thread safe store and the sync worker
+import  sqlite3 # -> Embedded local store
+import  pymongo # -> Remote database errors
+import  time # -> Update times
+import  os # -> File operations
+
+class LocalStore :
+
+    # Sync states of the stored documents
+    SYNC_PENDING = "pending"
+    SYNC_SYNCED = "synced"
+    SYNC_CONFLICT = "conflict"
+    SYNC_FAILED = "failed"
+
+    # Tables of the store, created if they do not exist.
+    SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS user_info (_id TEXT PRIMARY KEY, document TEXT NOT NULL, sync_state TEXT NOT NULL, sync_error TEXT, updated_at REAL NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS user_data (owner_id TEXT NOT NULL, document_name TEXT NOT NULL, document TEXT NOT NULL, transcript_manager_date TEXT, document_size INTEGER, sync_state TEXT NOT NULL, sync_error TEXT, updated_at REAL NOT NULL, PRIMARY KEY (owner_id, document_name))",
+        "CREATE INDEX IF NOT EXISTS user_info_sync_state ON user_info (sync_state)",
+        "CREATE INDEX IF NOT EXISTS user_data_sync_state ON user_data (sync_state)",
+        "CREATE TABLE IF NOT EXISTS pulled_owners (owner_id TEXT PRIMARY KEY, pulled_at REAL NOT NULL)",
+    )
+
+    def __init__(self, store_path : str = None) -> None:
+        """
+        Constructor method for LocalStore class, a SQLite store of the user_info and user_data documents. Every read and write of the application hits it first.
+        @Parameters:
+            store_path - Optional : Path of the SQLite file. (str) (default = None) -> None loads DATABASE_DC.LOCAL_STORE_PATH
+        @Returns:
+            None
+        """
+        # Check for store config, for ungivens load the default ones from DATABASE_DC
+        if store_path is None :
+            store_path = DATABASE_DC.LOCAL_STORE_PATH
+
+        # Initialize class fields, the connection is shared by the GUI and the sync worker over the lock.
+        if store_path != ":memory:" :
+            os.makedirs(os.path.dirname(store_path) or ".", exist_ok=True)
+        self.store_path = store_path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(store_path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+
+        # Initialize the tables. WAL keeps the reads fast while the sync worker writes.
+        with self.lock, self.connection :
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            for statement in self.SCHEMA :
+                self.connection.execute(statement)
+
+    @staticmethod
+    def _dumps(document : dict) -> str:
+        """
+        Private method for serializing a document.
+        @Parameters:
+            document - Required : The document. (dict) -> Used to be serialized
+        @Returns:
+            text - Extended JSON of the document. (str)
+        """
+        return json_util.dumps(document, ensure_ascii=False)
+
+    def put_user_info(self, document : dict, sync_state : str = SYNC_PENDING) -> None:
+        """
+        Puts a user_info document, an existing one is replaced like the $set of UserInfo.push_init.
+        @Parameters:
+            document - Required : User_info document. (dict) -> Used to be stored
+            sync_state - Optional : Sync state of the document. (str) (default = SYNC_PENDING) -> SYNC_SYNCED for the documents read from the remote database
+        @Returns:
+            None
+        """
+        with self.lock, self.connection :
+            self.connection.execute("INSERT OR REPLACE INTO user_info (_id, document, sync_state, sync_error, updated_at) VALUES (?, ?, ?, NULL, ?)", (document["_id"], self._dumps(document), sync_state, time.time()))
+
+    def get_user_info_ids(self) -> list:
+        """
+        Returns the ids of the user_info documents.
+        @Parameters:
+            None
+        @Returns:
+            (list) : Ids of the users
+        """
+        with self.lock :
+            rows = self.connection.execute("SELECT _id FROM user_info").fetchall()
+        return [row["_id"] for row in rows]
+
+    def has_user_info(self, owner_id : str) -> bool:
+        """
+        Checks for a user_info document.
+        @Parameters:
+            owner_id - Required : Id of the user. (str) -> Used to find the document
+        @Returns:
+            (bool) : True if it exists
+        """
+        with self.lock :
+            return self.connection.execute("SELECT 1 FROM user_info WHERE _id = ?", (owner_id,)).fetchone() is not None
+
+    def insert_user_data(self, document : dict, sync_state : str = SYNC_PENDING) -> bool:
+        """
+        Inserts a user_data document, if the owner has no document with the same name. (Same as the $setOnInsert of UserData.push_init)
+        @Parameters:
+            document - Required : User_data document. (dict) -> Used to be stored
+            sync_state - Optional : Sync state of the document. (str) (default = SYNC_PENDING) -> SYNC_SYNCED for the documents read from the remote database
+        @Returns:
+            is_inserted - False if the name already exists. (bool)
+        """
+        document = {key : value for key, value in document.items() if key != "_id"}
+        text = self._dumps(encode_document(document))
+        with self.lock, self.connection :
+            cursor = self.connection.execute(
+                "INSERT OR IGNORE INTO user_data (owner_id, document_name, document, transcript_manager_date, document_size, sync_state, sync_error, updated_at) VALUES (?, ?, ?, ?, ?, ?, NULL, ?)",
+                (document["owner_id"], document["document_name"], text, document.get("transcript_manager_date"), len(text.encode("utf-8")), sync_state, time.time()),
+            )
+            return cursor.rowcount == 1
+
+    def list_user_data(self, owner_id : str) -> list:
+        """
+        Lists the user_data documents of an owner without their content, same as UserData.list_documents.
+        @Parameters:
+            owner_id - Required : Owner id. (str) -> Used to list the documents
+        @Returns:
+            (list) : {"document_name", "transcript_manager_date", "document_size"} of each document, ordered by the names
+        """
+        with self.lock :
+            rows = self.connection.execute("SELECT document_name, transcript_manager_date, document_size FROM user_data WHERE owner_id = ? ORDER BY document_name", (owner_id,)).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_user_data(self, owner_id : str, document_name : str) -> dict:
+        """
+        Gets a user_data document.
+        @Parameters:
+            owner_id - Required : Owner id. (str) -> Used to find the document
+            document_name - Required : Name of the document. (str) -> Used to find the document
+        @Returns:
+            (dict) : The document with the typed courses of any schema version, None if it does not exist
+        """
+        with self.lock :
+            row = self.connection.execute("SELECT document FROM user_data WHERE owner_id = ? AND document_name = ?", (owner_id, document_name)).fetchone()
+        return decode_document(json_util.loads(row["document"])) if row is not None else None
+
+    def get_pending_user_info(self, limit : int) -> list:
+        """
+        Returns the user_info documents waiting for the sync.
+        @Parameters:
+            limit - Required : Maximum number of documents. (int) -> Used to batch the sync
+        @Returns:
+            (list) : (document, updated_at) of each document, the broken ones are marked as failed and skipped
+        """
+        with self.lock :
+            rows = self.connection.execute("SELECT _id, document, updated_at FROM user_info WHERE sync_state = ? ORDER BY updated_at LIMIT ?", (self.SYNC_PENDING, limit)).fetchall()
+        pending_documents = []
+        for row in rows :
+            try :
+                pending_documents.append((json_util.loads(row["document"]), row["updated_at"]))
+            except Exception as error :
+                # A broken row must not block the rows after it on every sync.
+                self.set_user_info_state(row["_id"], row["updated_at"], self.SYNC_FAILED, f"{type(error).__name__} : {error}")
+        return pending_documents
+
+    def get_pending_user_data(self, limit : int) -> list:
+        """
+        Returns the user_data documents waiting for the sync.
+        @Parameters:
+            limit - Required : Maximum number of documents. (int) -> Used to batch the sync
+        @Returns:
+            (list) : The documents, the oldest first, the broken ones are marked as failed and skipped
+        """
+        with self.lock :
+            rows = self.connection.execute("SELECT owner_id, document_name, document FROM user_data WHERE sync_state = ? ORDER BY updated_at LIMIT ?", (self.SYNC_PENDING, limit)).fetchall()
+        pending_documents = []
+        for row in rows :
+            try :
+                pending_documents.append(decode_document(json_util.loads(row["document"])))
+            except Exception as error :
+                # A broken row must not block the rows after it on every sync.
+                self.set_user_data_state(row["owner_id"], row["document_name"], self.SYNC_FAILED, f"{type(error).__name__} : {error}")
+        return pending_documents
+
+    def set_user_info_state(self, owner_id : str, updated_at : float, sync_state : str, sync_error : str = None) -> None:
+        """
+        Sets the sync state of a user_info document, only if it is not replaced after it is read for the sync.
+        @Parameters:
+            owner_id - Required : Id of the user. (str) -> Used to find the document
+            updated_at - Required : Update time read with the document. (float) -> Used to skip the newer versions
+            sync_state - Required : New sync state. (str) -> Used to mark the document
+            sync_error - Optional : Error of the last sync. (str) (default = None) -> Used to explain the state
+        @Returns:
+            None
+        """
+        with self.lock, self.connection :
+            self.connection.execute("UPDATE user_info SET sync_state = ?, sync_error = ? WHERE _id = ? AND updated_at = ?", (sync_state, sync_error, owner_id, updated_at))
+
+    def set_user_data_state(self, owner_id : str, document_name : str, sync_state : str, sync_error : str = None) -> None:
+        """
+        Sets the sync state of a user_data document.
+        @Parameters:
+            owner_id - Required : Owner id. (str) -> Used to find the document
+            document_name - Required : Name of the document. (str) -> Used to find the document
+            sync_state - Required : New sync state. (str) -> Used to mark the document
+            sync_error - Optional : Error of the last sync. (str) (default = None) -> Used to explain the state
+        @Returns:
+            None
+        """
+        with self.lock, self.connection :
+            self.connection.execute("UPDATE user_data SET sync_state = ?, sync_error = ? WHERE owner_id = ? AND document_name = ?", (sync_state, sync_error, owner_id, document_name))
+
+    def get_conflicts(self) -> list:
+        """
+        Returns the user_data documents which have an other version with the same name on the remote database.
+        @Parameters:
+            None
+        @Returns:
+            (list) : {"owner_id", "document_name", "sync_error"} of each conflict
+        """
+        with self.lock :
+            rows = self.connection.execute("SELECT owner_id, document_name, sync_error FROM user_data WHERE sync_state = ?", (self.SYNC_CONFLICT,)).fetchall()
+        return [dict(row) for row in rows]
+
+    def get_counts(self) -> dict:
+        """
+        Returns the number of the documents in each sync state.
+        @Parameters:
+            None
+        @Returns:
+            (dict) : {sync_state : count}, the user_info and user_data documents together
+        """
+        counts = {self.SYNC_PENDING : 0, self.SYNC_SYNCED : 0, self.SYNC_CONFLICT : 0, self.SYNC_FAILED : 0}
+        with self.lock :
+            for table_name in ("user_info", "user_data") :
+                for row in self.connection.execute(f"SELECT sync_state, COUNT(*) AS count FROM {table_name} GROUP BY sync_state") :
+                    counts[row["sync_state"]] = counts.get(row["sync_state"], 0) + row["count"]
+        return counts
+
+    def is_pulled(self, owner_id : str) -> bool:
+        """
+        Checks if the documents of an owner are ever pulled from the remote database.
+        @Parameters:
+            owner_id - Required : Owner id. (str) -> Used to find the owner
+        @Returns:
+            (bool) : True if they are pulled
+        """
+        with self.lock :
+            return self.connection.execute("SELECT 1 FROM pulled_owners WHERE owner_id = ?", (owner_id,)).fetchone() is not None
+
+    def set_pulled(self, owner_id : str) -> None:
+        """
+        Marks the documents of an owner as pulled.
+        @Parameters:
+            owner_id - Required : Owner id. (str) -> Used to mark the owner
+        @Returns:
+            None
+        """
+        with self.lock, self.connection :
+            self.connection.execute("INSERT OR REPLACE INTO pulled_owners (owner_id, pulled_at) VALUES (?, ?)", (owner_id, time.time()))
+
+    def close(self) -> None:
+        """
+        Closes the store.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        with self.lock :
+            self.connection.close()
+
+class SyncWorker :
+
+    def __init__(self, store : LocalStore, remote_factory = None, interval : float = None, batch_size : int = None) -> None:
+        """
+        Constructor method for SyncWorker class, a daemon thread which pushes the pending local changes to the remote database and pulls the remote documents of the requested owners.
+        A pending user_data document which finds an other document with the same (owner_id, document_name) on the remote database is marked as a conflict, the remote one is never overwritten.
+        @Parameters:
+            store - Required : The local store. (LocalStore) -> Used to read and mark the changes
+            remote_factory - Optional : Callable returning the remote client. (callable) (default = None) -> None uses get_mongo_client on the first sync
+            interval - Optional : Seconds between the syncs. (float) (default = None) -> None loads DATABASE_DC.SYNC_INTERVAL
+            batch_size - Optional : Documents pushed in each sync. (int) (default = None) -> None loads DATABASE_DC.BULK_BATCH_SIZE
+        @Returns:
+            None
+        """
+        # Check for sync config, for ungivens load the default ones from DATABASE_DC
+        if remote_factory is None :
+            remote_factory = get_mongo_client
+        if interval is None :
+            interval = DATABASE_DC.SYNC_INTERVAL
+        if batch_size is None :
+            batch_size = DATABASE_DC.BULK_BATCH_SIZE
+
+        # Initialize class fields
+        self.store = store
+        self.remote_factory = remote_factory
+        self.remote_client = None
+        self.interval = interval
+        self.batch_size = batch_size
+        self.lock = threading.Lock()
+        self.wake_event = threading.Event()
+        self.stop_event = threading.Event()
+        self.pull_requests = {}
+        self.started_sync_count = 0
+        self.finished_sync_count = 0
+        self.sync_condition = threading.Condition()
+        self.last_sync_time = None
+        self.last_error = None
+        self.thread = None
+
+    def start(self) -> None:
+        """
+        Starts the worker thread, a second call does nothing.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        with self.lock :
+            if self.thread is None :
+                self.thread = threading.Thread(target=self._run, name="local_store_sync", daemon=True)
+                self.thread.start()
+
+    def wake(self) -> None:
+        """
+        Wakes the worker up for a sync now, used after the local writes.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        self.wake_event.set()
+
+    def get_remote_client(self) -> object:
+        """
+        Returns the remote client, creates it on the first call.
+        @Parameters:
+            None
+        @Returns:
+            client - The remote client. (MongoClient)
+        """
+        with self.lock :
+            if self.remote_client is None :
+                self.remote_client = self.remote_factory()
+            return self.remote_client
+
+    def request_pull(self, owner_id : str) -> threading.Event:
+        """
+        Requests the remote documents of an owner on the next sync.
+        @Parameters:
+            owner_id - Required : Owner id. (str) -> Used to pull the documents
+        @Returns:
+            event - Set when the pull is finished or failed. (threading.Event)
+        """
+        with self.lock :
+            event = self.pull_requests.setdefault(owner_id, threading.Event())
+        self.wake()
+        return event
+
+    def _run(self) -> None:
+        """
+        Private method for the loop of the worker thread.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        while not self.stop_event.is_set() :
+            self.wake_event.wait(self.interval)
+            self.wake_event.clear()
+            if self.stop_event.is_set() :
+                break
+            self.sync_once()
+
+    def sync_once(self) -> bool:
+        """
+        Runs one sync, the pulls first and than the pushes. An unreachable remote database leaves everything pending for the next sync.
+        Any other error is recorded in last_error too, it must not kill the worker thread for the rest of the session.
+        @Parameters:
+            None
+        @Returns:
+            is_successful - False if the sync fails. (bool)
+        """
+        with self.lock :
+            pull_requests, self.pull_requests = self.pull_requests, {}
+        with self.sync_condition :
+            self.started_sync_count += 1
+        try :
+            self.get_remote_client()
+            for owner_id in pull_requests :
+                self._pull(owner_id)
+            self._push_user_info()
+            self._push_user_data()
+            self.last_error = None
+            is_successful = True
+        except pymongo.errors.PyMongoError as error :
+            self.last_error = str(error)
+            is_successful = False
+        except Exception as error :
+            self.last_error = f"{type(error).__name__} : {error}"
+            is_successful = False
+        finally :
+            # Waiters of the pulls must not wait for an unreachable database.
+            for event in pull_requests.values() :
+                event.set()
+            with self.sync_condition :
+                self.finished_sync_count += 1
+                self.last_sync_time = time.time()
+                self.sync_condition.notify_all()
+        return is_successful
+
+    def _pull(self, owner_id : str) -> None:
+        """
+        Private method for pulling the remote documents of an owner which are missing in the local store.
+        @Parameters:
+            owner_id - Required : Owner id. (str) -> Used to pull the documents
+        @Returns:
+            None
+        """
+        local_names = {document["document_name"] for document in self.store.list_user_data(owner_id)}
+        for listed_document in self.remote_client.user_data.list_documents(owner_id) :
+            if listed_document["document_name"] in local_names :
+                continue
+            remote_document = self.remote_client.user_data.get_document(owner_id, listed_document["document_name"])
+            if remote_document is not None :
+                self.store.insert_user_data(remote_document, LocalStore.SYNC_SYNCED)
+        self.store.set_pulled(owner_id)
+
+    def _push_user_info(self) -> None:
+        """
+        Private method for pushing the pending user_info documents.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        pending_documents = self.store.get_pending_user_info(self.batch_size)
+        if not pending_documents :
+            return
+        results = self.remote_client.user_info.bulk_push([document for document, _ in pending_documents])
+        for (document, updated_at), result in zip(pending_documents, results) :
+            if result["status"] == "failed" :
+                self.store.set_user_info_state(document["_id"], updated_at, LocalStore.SYNC_PENDING, result["error"])
+            else :
+                self.store.set_user_info_state(document["_id"], updated_at, LocalStore.SYNC_SYNCED)
+
+    def _push_user_data(self) -> None:
+        """
+        Private method for pushing the pending user_data documents. An existing remote document is the same push of an earlier sync if it is equal, a conflict otherwise.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        pending_documents = self.store.get_pending_user_data(self.batch_size)
+        if not pending_documents :
+            return
+        results = self.remote_client.user_data.bulk_push(pending_documents)
+        for document, result in zip(pending_documents, results) :
+            owner_id, document_name = document["owner_id"], document["document_name"]
+            if result["status"] == UserData.PUSH_INSERTED :
+                self.store.set_user_data_state(owner_id, document_name, LocalStore.SYNC_SYNCED)
+            elif result["status"] == UserData.PUSH_EXISTS :
+                # Compare with the remote one, without its remote id.
+                remote_document = self.remote_client.user_data.get_document(owner_id, document_name)
+                if remote_document is not None and {key : value for key, value in remote_document.items() if key != "_id"} == document :
+                    self.store.set_user_data_state(owner_id, document_name, LocalStore.SYNC_SYNCED)
+                else :
+                    self.store.set_user_data_state(owner_id, document_name, LocalStore.SYNC_CONFLICT, "An other document with the same name exists on the database")
+            else :
+                # The owner is not pushed yet or the write failed, try again on the next sync.
+                self.store.set_user_data_state(owner_id, document_name, LocalStore.SYNC_PENDING, result["error"] or result["status"])
+
+    def flush(self, timeout : float = None) -> bool:
+        """
+        Wakes the worker up and waits for the end of a sync started after the call.
+        @Parameters:
+            timeout - Optional : Seconds to wait. (float) (default = None) -> None waits until the sync ends
+        @Returns:
+            is_synced - False if the sync does not end in time. (bool)
+        """
+        if self.thread is None :
+            return self.sync_once()
+
+        # A running sync may have read the changes before the call, wait for the next one.
+        with self.sync_condition :
+            target_count = self.started_sync_count + 1
+        self.wake()
+        with self.sync_condition :
+            return self.sync_condition.wait_for(lambda : self.finished_sync_count >= target_count, timeout=timeout)
+
+    def stop(self, timeout : float = None) -> bool:
+        """
+        Stops the worker thread, a running sync is waited for.
+        @Parameters:
+            timeout - Optional : Seconds to wait for the thread. (float) (default = None) -> None loads DATABASE_DC.SYNC_EXIT_TIMEOUT
+        @Returns:
+            is_stopped - False if the thread is still running after the timeout. (bool)
+        """
+        # Check for timeout, for ungiven load the default one from DATABASE_DC
+        if timeout is None :
+            timeout = DATABASE_DC.SYNC_EXIT_TIMEOUT
+
+        self.stop_event.set()
+        self.wake()
+        if self.thread is not None :
+            self.thread.join(timeout=timeout)
+            if self.thread.is_alive() :
+                return False
+        self.thread = None
+        return True
+
+    def get_status(self) -> dict:
+        """
+        Returns the state of the sync.
+        @Parameters:
+            None
+        @Returns:
+            status - {"counts" : documents in each sync state, "conflicts" : list, "last_sync_time" : epoch or None, "last_error" : str or None} (dict)
+        """
+        return {"counts" : self.store.get_counts(), "conflicts" : self.store.get_conflicts(), "last_sync_time" : self.last_sync_time, "last_error" : self.last_error}
+
+class LocalUserInfo :
+
+    def __init__(self, store : LocalStore, sync_worker : SyncWorker) -> None:
+        """
+        Constructor method for LocalUserInfo class, the UserInfo interface over the local store.
+        @Parameters:
+            store - Required : The local store. (LocalStore) -> Used to store the documents
+            sync_worker - Required : The sync worker. (SyncWorker) -> Used to push the changes
+        @Returns:
+            None
+        """
+        # Initialize class fields
+        self.store = store
+        self.sync_worker = sync_worker
+
+    def push_init(self, document : dict) -> None:
+        """
+        Method to push user_info document, to the local store at once and to the database on the next sync.
+        @Parameters:
+            document - Required : User_info document (dict) -> Used to push
+        @Returns:
+            None
+        """
+        self.store.put_user_info(document)
+        self.sync_worker.wake()
+
+    def bulk_push(self, documents : list, batch_size : int = None) -> list:
+        """
+        Method to push many user_info documents, same as push_init for each of them.
+        @Parameters:
+            documents - Required : User_info documents (list) -> Used to push
+            batch_size - Optional : Not used, the local store has no batches. (int) (default = None) -> Kept for the UserInfo interface
+        @Returns:
+            (list) : Same as UserInfo.bulk_push
+        """
+        results = []
+        for document in documents :
+            status = "updated" if self.store.has_user_info(document["_id"]) else "inserted"
+            self.store.put_user_info(document)
+            results.append({"status" : status, "_id" : document["_id"], "error" : None})
+        self.sync_worker.wake()
+        return results
+
+class LocalUserData :
+
+    # Statuses of push_init, same with UserData
+    PUSH_INSERTED = UserData.PUSH_INSERTED
+    PUSH_EXISTS = UserData.PUSH_EXISTS
+    PUSH_OWNER_NOT_FOUND = UserData.PUSH_OWNER_NOT_FOUND
+    PUSH_FAILED = UserData.PUSH_FAILED
+
+    def __init__(self, store : LocalStore, sync_worker : SyncWorker, pull_timeout : float = None) -> None:
+        """
+        Constructor method for LocalUserData class, the UserData interface over the local store.
+        @Parameters:
+            store - Required : The local store. (LocalStore) -> Used to store the documents
+            sync_worker - Required : The sync worker. (SyncWorker) -> Used to push the changes and pull the remote documents
+            pull_timeout - Optional : Seconds to wait for the first pull of an owner. (float) (default = None) -> None loads DATABASE_DC.SYNC_PULL_TIMEOUT
+        @Returns:
+            None
+        """
+        # Check for pull config, for ungiven load the default one from DATABASE_DC
+        if pull_timeout is None :
+            pull_timeout = DATABASE_DC.SYNC_PULL_TIMEOUT
+
+        # Initialize class fields
+        self.store = store
+        self.sync_worker = sync_worker
+        self.pull_timeout = pull_timeout
+        self.requested_owner_ids = set()
+
+    def push_init(self, document : dict) -> dict:
+        """
+        Method to push user_data document, if the owner exists and has no document with the same name. It is stored locally at once and pushed on the next sync.
+        @Parameters:
+            document - Required : User_data document (dict) -> Used to push
+        @Returns:
+            (dict) : Same as UserData.push_init, document_id is None until the document is synced
+        """
+        result = {"status" : None, "owner_id" : document["owner_id"], "document_name" : document["document_name"], "document_id" : None, "error" : None}
+        if not self.store.has_user_info(document["owner_id"]) :
+            result["status"] = self.PUSH_OWNER_NOT_FOUND
+        elif self.store.insert_user_data(document) :
+            result["status"] = self.PUSH_INSERTED
+            self.sync_worker.wake()
+        else :
+            result["status"] = self.PUSH_EXISTS
+        return result
+
+    def _pull(self, owner_id : str) -> None:
+        """
+        Private method for pulling the remote documents of an owner once in each run. Only the first pull of an owner on this store is waited, the later ones refresh in the background.
+        @Parameters:
+            owner_id - Required : Owner id. (str) -> Used to pull the documents
+        @Returns:
+            None
+        """
+        if owner_id in self.requested_owner_ids :
+            return
+        self.requested_owner_ids.add(owner_id)
+        is_pulled = self.store.is_pulled(owner_id)
+        event = self.sync_worker.request_pull(owner_id)
+        if not is_pulled :
+            event.wait(self.pull_timeout)
+
+    def list_documents(self, owner_id : str) -> list:
+        """
+        Method to list the documents of given user from the local store, without their transcripts.
+        @Parameters:
+            owner_id - Required : Owner id (str) -> Used to list the documents
+        @Returns:
+            (list) : Same as UserData.list_documents
+        """
+        self._pull(owner_id)
+        return self.store.list_user_data(owner_id)
+
+    def get_document(self, owner_id : str, document_name : str) -> dict:
+        """
+        Method to get one document of given user by its name from the local store
+        @Parameters:
+            owner_id - Required : Owner id (str) -> Used to find the document
+            document_name - Required : Name of the document (str) -> Used to find the document
+        @Returns:
+            (dict) : The document, None if it does not exist
+        """
+        self._pull(owner_id)
+        return self.store.get_user_data(owner_id, document_name)
+
+    def get_available_documents(self, owner_id : str) -> list:
+        """
+        Method to get available documents of given user from the local store, the full documents
+        @Parameters:
+            owner_id - Required : Owner id (str) -> Used to get available documents
+        @Returns:
+            (list) : Same as UserData.get_available_documents
+        """
+        self._pull(owner_id)
+        documents = [self.store.get_user_data(owner_id, listed_document["document_name"]) for listed_document in self.store.list_user_data(owner_id)]
+        return [document for document in documents if document is not None]
+
+    def bulk_push(self, documents : list, batch_size : int = None) -> list:
+        """
+        Method to push many user_data documents, same as push_init for each of them.
+        @Parameters:
+            documents - Required : User_data documents (list) -> Used to push
+            batch_size - Optional : Not used, the local store has no batches. (int) (default = None) -> Kept for the UserData interface
+        @Returns:
+            (list) : Same as UserData.bulk_push, document_id is None until the documents are synced
+        """
+        return [self.push_init(document) for document in documents]
+
+class LocalClient :
+
+    def __init__(self, store : LocalStore = None, sync_worker : SyncWorker = None) -> None:
+        """
+        Constructor method for LocalClient class, the MongoClient interface of the application over the local store. The changes reach the database over the sync worker.
+        @Parameters:
+            store - Optional : The local store. (LocalStore) (default = None) -> None creates one from DATABASE_DC
+            sync_worker - Optional : The sync worker. (SyncWorker) (default = None) -> None creates one from DATABASE_DC
+        @Returns:
+            None
+        """
+        # Initialize the store and the worker
+        self.store = store if store is not None else LocalStore()
+        self.sync_worker = sync_worker if sync_worker is not None else SyncWorker(self.store)
+
+        # Initialize collections
+        self.user_info = LocalUserInfo(self.store, self.sync_worker)
+        self.user_data = LocalUserData(self.store, self.sync_worker)
+
+        # Push the changes of the previous runs
+        self.sync_worker.start()
+        self.sync_worker.wake()
+
+    def documentisize(self, data : dict) -> tuple:
+        """
+        Method to create user_info and user_data documents from given data, same as MongoClient.documentisize
+        @Parameters:
+            data - Required : Data to create documents (dict) -> Used to create documents
+        @Returns:
+            (tuple) : Tuple of user_info and user_data documents
+        """
+        return create_user_documents(data)
+
+    @property
+    def user_base(self) -> object:
+        """
+        The user_base collection of the remote database, the local store keeps the full documents and has no bases.
+        """
+        return self.sync_worker.get_remote_client().user_base
+
+    def bootstrap_indexes(self) -> str:
+        """
+        Method to create the indexes of the remote database, same as MongoClient.bootstrap_indexes
+        @Parameters:
+            None
+        @Returns:
+            (str) : Summary of the created indexes
+        """
+        return self.sync_worker.get_remote_client().bootstrap_indexes()
+
+    def watch_changes(self) -> None:
+        """
+        Method to start invalidating the document cache of the remote database with its change stream, same as MongoClient.watch_changes. The pulls of the sync worker read through that cache.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        self.sync_worker.get_remote_client().watch_changes()
+
+    def get_all_user_ids(self) -> list:
+        """
+        Method to get all user ids, of the local store and of the remote database if it is reachable
+        @Parameters:
+            None
+        @Returns:
+            (list) : List of all user ids
+        """
+        user_ids = set(self.store.get_user_info_ids())
+        try :
+            user_ids.update(self.sync_worker.get_remote_client().get_all_user_ids())
+        except pymongo.errors.PyMongoError :
+            pass
+        return list(user_ids)
+
+    def close(self, timeout : float = None) -> dict:
+        """
+        Method to push the pending changes for the last time, than to close the worker and the store. The store is left open if the worker is still syncing, the daemon thread ends with the process.
+        @Parameters:
+            timeout - Optional : Seconds to wait for the last sync. (float) (default = None) -> None loads DATABASE_DC.SYNC_EXIT_TIMEOUT
+        @Returns:
+            status - Same as SyncWorker.get_status. (dict)
+        """
+        # Check for timeout, for ungiven load the default one from DATABASE_DC
+        if timeout is None :
+            timeout = DATABASE_DC.SYNC_EXIT_TIMEOUT
+
+        # Both waits share the timeout.
+        deadline = time.monotonic() + timeout
+        self.sync_worker.flush(timeout)
+        status = self.sync_worker.get_status()
+        if self.sync_worker.stop(max(0.0, deadline - time.monotonic())) :
+            self.store.close()
+        return status
+
+# Process wide local client, created by the first use.
+_LOCAL_CLIENT = None
+_LOCAL_CLIENT_LOCK = threading.Lock()
+
+def get_local_client() -> LocalClient:
+    """
+    Returns the process wide local client, its sync worker is started with it.
+    @Parameters:
+        None
+    @Returns:
+        client - The shared local client. (LocalClient)
+    """
+    global _LOCAL_CLIENT
+    with _LOCAL_CLIENT_LOCK :
+        if _LOCAL_CLIENT is None :
+            _LOCAL_CLIENT = LocalClient()
+        return _LOCAL_CLIENT
+
+def close_local_client(timeout : float = None) -> dict:
+    """
+    Closes the process wide local client, if it is created.
+    @Parameters:
+        timeout - Optional : Seconds to wait for the last sync. (float) (default = None) -> None loads DATABASE_DC.SYNC_EXIT_TIMEOUT
+    @Returns:
+        status - Same as SyncWorker.get_status, None if the local client is never created. (dict)
+    """
+    global _LOCAL_CLIENT
+    with _LOCAL_CLIENT_LOCK :
+        local_client, _LOCAL_CLIENT = _LOCAL_CLIENT, None
+    return local_client.close(timeout) if local_client is not None else None
@@ -0,0 +1,145 @@
+from    concurrent.futures  import  ThreadPoolExecutor # -> Concurrent post login steps
+from    Utilities.translation   import  get_translation_service # -> Batched translations
+from    Utilities.utils     import  get_gender # -> Gender detection
+import  threading # -> Thread safe delivery
+
+class LoginPipeline :
+
+    # User info fields which are shown in the other language of the transcript.
+    TRANSLATED_FIELDS = ("student_faculty", "student_department", "student_status", "language_of_instruction")
+
+    def __init__(self, user_info_document : dict, parsing_language : str, document_loader = None, max_workers : int = None) -> None:
+        """
+        Constructor method for LoginPipeline class, which runs the independent post login steps concurrently. (translations, gender detection, document list prefetch)
+        @Parameters:
+            user_info_document - Required : User info document of the login. (dict) -> Used to get the translated fields and the name
+            parsing_language - Required : Language of the transcript. (str) -> Used to select the translation direction
+            document_loader - Optional : Callable returning the saved documents of the user. (callable) (default = None) -> None skips the prefetch
+            max_workers - Optional : Number of threads. (int) (default = None) -> None runs every step on its own thread
+        @Returns:
+            None
+        """
+        # Initialize class fields
+        self.key = self.make_key(user_info_document, parsing_language)
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or 3, thread_name_prefix="login_pipeline")
+        self.futures = {}
+        self.delivered_keys = set()
+        self.lock = threading.Lock()
+
+        # Translate all of the fields in one batch, the direction follows the original application behaviour.
+        if parsing_language == "tr" :
+            source_language, target_language = "en", "tr"
+        else :
+            source_language, target_language = "tr", "en"
+        self.futures["translations"] = self.executor.submit(self._translate_fields, user_info_document, source_language, target_language)
+
+        # Detect the gender
+        self.futures["student_gender"] = self.executor.submit(get_gender, name=user_info_document["student_name"])
+
+        # Prefetch the saved documents, so the load and save dialogs open without a round trip.
+        if document_loader is not None :
+            self.futures["available_documents"] = self.executor.submit(lambda : list(document_loader()))
+
+        # No more steps, let the threads go as soon as they finish.
+        self.executor.shutdown(wait=False)
+
+    @classmethod
+    def _translate_fields(cls, user_info_document : dict, source_language : str, target_language : str) -> dict:
+        """
+        Private method for translating the fields with a single call to the translation service.
+        @Parameters:
+            user_info_document - Required : User info document. (dict) -> Used to get the fields
+            source_language - Required : The language of the fields. (str) -> Used to translate the fields
+            target_language - Required : The language to be translated. (str) -> Used to translate the fields
+        @Returns:
+            translations - Translated fields by their names. (dict)
+        """
+        translations = get_translation_service().translate_many([user_info_document[field_name] for field_name in cls.TRANSLATED_FIELDS], source_language, target_language)
+        return dict(zip(cls.TRANSLATED_FIELDS, translations))
+
+    @staticmethod
+    def make_key(user_info_document : dict, parsing_language : str) -> tuple:
+        """
+        Creates the key of a pipeline, pipelines with the same key produce the same results. The owner id is a part of it, the document prefetch belongs to the owner.
+        @Parameters:
+            user_info_document - Required : User info document. (dict) -> Used to create the key
+            parsing_language - Required : Language of the transcript. (str) -> Used to create the key
+        @Returns:
+            key - The key. (tuple)
+        """
+        return (parsing_language, user_info_document["_id"], user_info_document["student_name"]) + tuple(user_info_document[field_name] for field_name in LoginPipeline.TRANSLATED_FIELDS)
+
+    def collect(self, wait : bool = False) -> dict:
+        """
+        Collects the results which are finished after the previous collect. Failed steps give None, the translations are given by their field names.
+        @Parameters:
+            wait - Optional : Wait for all of the steps. (bool) (default = False) -> Used when every result is needed at once
+        @Returns:
+            results - Finished results by their names. (dict)
+        """
+        results = {}
+        with self.lock :
+            for step_name, future in self.futures.items() :
+                if step_name in self.delivered_keys or not (wait or future.done()) :
+                    continue
+                try :
+                    step_result = future.result()
+                except Exception :
+                    step_result = None
+                if step_name == "translations" :
+                    results.update(step_result or {})
+                else :
+                    results[step_name] = step_result
+                self.delivered_keys.add(step_name)
+        return results
+
+    def result(self, step_name : str, timeout : float = None) :
+        """
+        Returns the result of a step, waits for it if it is not finished. Failed or skipped steps give None.
+        @Parameters:
+            step_name - Required : Name of the step. (str) -> Used to find the step
+            timeout - Optional : Seconds to wait. (float) (default = None) -> None waits until it is finished
+        @Returns:
+            result - Result of the step. (object)
+        """
+        future = self.futures.get(step_name)
+        if future is None :
+            return None
+        try :
+            return future.result(timeout=timeout)
+        except Exception :
+            return None
+
+    def reset_delivery(self) -> None:
+        """
+        Makes the finished results collectable again, for a new consumer. (EXMP: a restarted application frame)
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        with self.lock :
+            self.delivered_keys.clear()
+
+    def is_finished(self) -> bool:
+        """
+        Checks if all of the results are delivered.
+        @Parameters:
+            None
+        @Returns:
+            True if nothing is left to collect, False otherwise. (bool)
+        """
+        with self.lock :
+            return len(self.delivered_keys) == len(self.futures)
+
+    def invalidate_documents(self) -> None:
+        """
+        Drops the prefetched document list, after a write it is stale.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        with self.lock :
+            self.futures.pop("available_documents", None)
+            self.delivered_keys.discard("available_documents")
@@ -0,0 +1,168 @@
+from    Environment     import  CACHE_DC # -> Cache constants
+import  hashlib # -> Content addressing
+import  json # -> Serialization
+import  zlib # -> Compression
+import  os # -> File operations
+
+class ParseCache :
+
+    # File extension of the cache entries. (zlib compressed compact json)
+    ENTRY_EXTENSION = ".json.z"
+
+    def __init__(self, cache_folder : str = None, max_size : int = None) -> None:
+        """
+        Constructor method for ParseCache class, an on-disk cache of parsed transcripts keyed by their content.
+        @Parameters:
+            cache_folder - Optional : Folder of the cache entries. (str) (default = None) -> None loads CACHE_DC.PARSE_CACHE_FOLDER
+            max_size - Optional : Maximum total size of the entries in bytes. (int) (default = None) -> None loads CACHE_DC.PARSE_CACHE_MAX_SIZE
+        @Returns:
+            None
+        """
+        # Check for cache config, for ungivens load the default ones from CACHE_DC
+        if cache_folder is None :
+            cache_folder = CACHE_DC.PARSE_CACHE_FOLDER
+        if max_size is None :
+            max_size = CACHE_DC.PARSE_CACHE_MAX_SIZE
+
+        # Initialize class fields
+        self.cache_folder = cache_folder
+        self.max_size = max_size
+
+    @staticmethod
+    def make_key(pdf_bytes : bytes, parser_version : str) -> str:
+        """
+        Creates the cache key of a transcript.
+        @Parameters:
+            pdf_bytes - Required : Content of the transcript file. (bytes) -> Used to address the entry
+            parser_version - Required : Version of the parser. (str) -> Used to invalidate the entries of older parsers
+        @Returns:
+            key - SHA-256 hex digest of the content and the version. (str)
+        """
+        # Hash the content and the version together
+        digest = hashlib.sha256(pdf_bytes)
+        digest.update(b"\0" + parser_version.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _entry_path(self, key : str) -> str:
+        """
+        Private method for getting the path of an entry.
+        @Parameters:
+            key - Required : Cache key. (str) -> Used to find the entry
+        @Returns:
+            path - Path of the entry. (str)
+        """
+        return os.path.join(self.cache_folder, key + self.ENTRY_EXTENSION)
+
+    def get(self, key : str) -> dict:
+        """
+        Gets a parsed transcript from the cache.
+        @Parameters:
+            key - Required : Cache key. (str) -> Used to find the entry
+        @Returns:
+            transcript_data - The cached transcript data, None on miss. (dict)
+        """
+        entry_path = self._entry_path(key)
+
+        # Read and decode the entry, a broken entry is counted as miss.
+        try :
+            with open(entry_path, "rb") as entry_file :
+                transcript_data = json.loads(zlib.decompress(entry_file.read()).decode("utf-8"))
+        except FileNotFoundError :
+            return None
+        except (OSError, ValueError, zlib.error) :
+            self._remove(entry_path)
+            return None
+
+        # Touch the entry, so it becomes the most recently used one.
+        try :
+            os.utime(entry_path)
+        except OSError :
+            pass
+
+        # Return the cached data
+        return transcript_data
+
+    def put(self, key : str, transcript_data : dict) -> None:
+        """
+        Puts a parsed transcript into the cache, than evicts the least recently used entries above the size limit.
+        @Parameters:
+            key - Required : Cache key. (str) -> Used to address the entry
+            transcript_data - Required : Parsed transcript data. (dict) -> Used to be cached
+        @Returns:
+            None
+        """
+        os.makedirs(self.cache_folder, exist_ok=True)
+
+        # Encode the entry compactly
+        payload = zlib.compress(json.dumps(transcript_data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+        # Write to a temporary file and move it, so readers never see a partial entry.
+        entry_path = self._entry_path(key)
+        temporary_path = f"{entry_path}.{os.getpid()}.tmp"
+        with open(temporary_path, "wb") as entry_file :
+            entry_file.write(payload)
+        os.replace(temporary_path, entry_path)
+
+        # Keep the cache in its size limit
+        self.evict()
+
+    def evict(self) -> None:
+        """
+        Evicts the least recently used entries until the cache fits into its size limit.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        # Collect the entries with their sizes and access times
+        entries = []
+        total_size = 0
+        try :
+            with os.scandir(self.cache_folder) as iterator :
+                for current_entry in iterator :
+                    if not current_entry.name.endswith(self.ENTRY_EXTENSION) :
+                        continue
+                    try :
+                        entry_stat = current_entry.stat()
+                    except FileNotFoundError :
+                        continue
+                    entries.append((entry_stat.st_mtime, entry_stat.st_size, current_entry.path))
+                    total_size += entry_stat.st_size
+        except FileNotFoundError :
+            return
+
+        # Remove the oldest entries first
+        entries.sort()
+        for _, entry_size, entry_path in entries :
+            if total_size <= self.max_size :
+                break
+            self._remove(entry_path)
+            total_size -= entry_size
+
+    def clear(self) -> None:
+        """
+        Removes all of the entries.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        if not os.path.isdir(self.cache_folder) :
+            return
+        for current_name in os.listdir(self.cache_folder) :
+            if current_name.endswith(self.ENTRY_EXTENSION) :
+                self._remove(os.path.join(self.cache_folder, current_name))
+
+    @staticmethod
+    def _remove(entry_path : str) -> None:
+        """
+        Private method for removing an entry, ignores the entries which are already removed.
+        @Parameters:
+            entry_path - Required : Path of the entry. (str) -> Used to remove the entry
+        @Returns:
+            None
+        """
+        try :
+            os.remove(entry_path)
+        except FileNotFoundError :
+            pass
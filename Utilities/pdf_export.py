@@ -1,5 +1,6 @@
 from abc  import ABC, abstractmethod # -> Abstraction
 from fpdf import FPDF # -> Generate PDF
+from Utilities.transcript_schema import PASSING_GRADES, FAILING_GRADES, Grade # -> Grade meanings
 
 def calculate_perfornance(course_list : list, skip_retakens : bool = False) -> dict:
     """
@@ -29,34 +30,34 @@ def calculate_perfornance(course_list : list, skip_retakens : bool = False) -> d
             if course["course_code"].endswith("*"):
                 continue
 
-        # Get course variables
-        course_credit : int = int(course["course_credit"])
+        # Get course variables, they are typed by the parser and the schema.
+        course_credit : int = course["course_credit"]
         course_grade : str = course["course_grade"]
-        course_grade_point : float = float(course["course_grade_point"])
+        course_grade_point : float = course["course_grade_point"]
 
         # Update credits attempted for each course seen
         credits_attempted += course_credit
 
         # Start calculating GPA
-        if course_grade in ["A", "A-", "B+", "B", "B-", "C+", "C", "C-", "D+", "D"]:
+        if course_grade in PASSING_GRADES:
             # If course is successful, update credits successful and credits included in GPA
             credits_successful += course_credit
             credits_included_in_gpa += course_credit
             gpa += course_grade_point
-        elif course_grade in ["S"]:
+        elif course_grade == Grade.S:
             # If course is passed, update credits successful only
             credits_successful += course_credit
-        elif course_grade == "F" or course_grade == "U":
+        elif course_grade in FAILING_GRADES:
             # If course is failed, update credits included in GPA
             credits_included_in_gpa += course_credit
             gpa += course_grade_point
-        elif course_grade == "I":
+        elif course_grade == Grade.I:
             # If course is incomplete, do not do anything
             continue
-        elif course_grade == "W":
+        elif course_grade == Grade.W:
             # If course is withdrawn, update credits attempted only
             credits_attempted -= course_credit
-        elif course_grade == "N/A":
+        elif course_grade == Grade.NA:
             # If course is not taken, do not do anything
             continue
 
@@ -251,9 +252,9 @@ class OriginalCourses(PdfElements, FPDF):
                     pdf_buffer.cell(col_widths[0], 6, course["course_code"], 1, 0, "C")
                     pdf_buffer.cell(col_widths[1], 6, course["course_name"], 1, 0, "C")
                     pdf_buffer.cell(col_widths[2], 6, course["course_lang"], 1, 0, "C")
-                    pdf_buffer.cell(col_widths[3], 6, course["course_credit"], 1, 0, "C")
+                    pdf_buffer.cell(col_widths[3], 6, str(course["course_credit"]), 1, 0, "C")
                     pdf_buffer.cell(col_widths[4], 6, course["course_grade"], 1, 0, "C")
-                    pdf_buffer.cell(col_widths[5], 6, course["course_grade_point"], 1, 1, "C")
+                    pdf_buffer.cell(col_widths[5], 6, str(course["course_grade_point"]), 1, 1, "C")
                 except UnicodeEncodeError :
                     print("UnicodeEncodeError Warning for PDF Extraction -> Please check your semester course list, there is a course with a non-english character in it.")
                     pass
@@ -0,0 +1,150 @@
+from    Environment             import  SELENIUM_DC, GUI_DC # -> Photo constants
+from    Utilities.http_client   import  get_http_session # -> Pooled http session
+from    concurrent.futures      import  ThreadPoolExecutor, Future # -> Background downloads
+from    collections             import  OrderedDict # -> LRU cache of the photos
+from    PIL                     import  Image # -> Image processing
+import  threading # -> Thread safe cache
+import  re # -> Safe file names
+import  io # -> In memory image buffers
+import  os # -> File operations
+
+def get_user_photo_path(user_key : str) -> str:
+    """
+    Returns the photo path of a user, each user has its own file.
+    @Parameters:
+        user_key - Required : Unique key of the user. (EXMP: username) (str) -> Used to name the file
+    @Returns:
+        path - Path of the user photo. (str)
+    """
+    # Keep only the file name safe characters of the key
+    return SELENIUM_DC.USER_PHOTO_OUTPUT_TEMPLATE.format(user_key=re.sub(r"[^0-9A-Za-z_.-]", "_", str(user_key)))
+
+class PhotoFetcher :
+
+    def __init__(self, max_workers : int = None, photo_size : tuple = None, cache_size : int = None) -> None:
+        """
+        Constructor method for PhotoFetcher class, which downloads and normalizes the user photos in the background.
+        @Parameters:
+            max_workers - Optional : Number of download threads. (int) (default = None) -> None loads SELENIUM_DC.PHOTO_FETCH_WORKERS
+            photo_size - Optional : Bounding box of the normalized photos. (tuple) (default = None) -> None loads GUI_DC.STUDENT_PHOTO_SIZE
+            cache_size - Optional : Number of photos kept in memory. (int) (default = None) -> None loads SELENIUM_DC.PHOTO_CACHE_SIZE
+        @Returns:
+            None
+        """
+        # Check for fetcher config, for ungivens load the default ones from SELENIUM_DC and GUI_DC
+        if max_workers is None :
+            max_workers = SELENIUM_DC.PHOTO_FETCH_WORKERS
+        if photo_size is None :
+            photo_size = GUI_DC.STUDENT_PHOTO_SIZE
+        if cache_size is None :
+            cache_size = SELENIUM_DC.PHOTO_CACHE_SIZE
+
+        # Initialize class fields
+        self.photo_size = tuple(photo_size)
+        self.cache_size = max(0, cache_size)
+        self.executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="photo_fetcher")
+
+        self.cache = OrderedDict() # (user key, url) -> encoded png
+        self.lock = threading.Lock()
+
+    def fetch(self, url : str, output_path : str, session : object = None, user_key : str = None) -> Future:
+        """
+        Starts downloading a photo in the background.
+        @Parameters:
+            url - Required : Url of the photo. (str) -> Used to download the photo
+            output_path - Required : Path of the png output. (str) -> Used to save the normalized photo
+            session - Optional : Session to download with. (requests.Session) (default = None) -> None uses the shared session, give the logged in one for the protected photos
+            user_key - Optional : Unique key of the user. (EXMP: username) (str) (default = None) -> Used to cache the photos of the logged in sessions, they are not cached without it
+        @Returns:
+            future - Resolves to the output path. (Future)
+        """
+        # A protected photo url may be relative to the session, (EXMP: "/photo" of the logged in user) so it is cached only for its user.
+        cache_key = None if session is not None and user_key is None else (user_key, url)
+        return self.executor.submit(self._fetch, url, output_path, session, cache_key)
+
+    def _fetch(self, url : str, output_path : str, session : object, cache_key : tuple) -> str:
+        """
+        Private method for downloading, normalizing and saving a photo. Runs on the worker threads.
+        @Parameters:
+            url - Required : Url of the photo. (str) -> Used to download the photo
+            output_path - Required : Path of the png output. (str) -> Used to save the normalized photo
+            session - Required : Session to download with, None uses the shared session. (requests.Session) -> Used to download the photo
+            cache_key - Required : Key of the photo in the cache, None does not cache it. (tuple) -> Used to find the cached photo
+        @Returns:
+            output_path - Path of the saved photo. (str)
+        """
+        # Use the cached one if this photo is already fetched
+        encoded_photo = None
+        if cache_key is not None :
+            with self.lock :
+                encoded_photo = self.cache.get(cache_key)
+                if encoded_photo is not None :
+                    self.cache.move_to_end(cache_key)
+
+        # Otherwise download and normalize it
+        if encoded_photo is None :
+            response = (session or get_http_session()).get(url)
+            response.raise_for_status()
+            encoded_photo = self.normalize(response.content)
+            if cache_key is not None :
+                with self.lock :
+                    self.cache[cache_key] = encoded_photo
+                    while len(self.cache) > self.cache_size :
+                        self.cache.popitem(last=False)
+
+        # Write to a temporary file and move it, so the readers never see a partial photo.
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+        temporary_path = f"{output_path}.{threading.get_ident()}.tmp"
+        with open(temporary_path, "wb") as photo_file :
+            photo_file.write(encoded_photo)
+        os.replace(temporary_path, output_path)
+
+        # Return the saved path
+        return output_path
+
+    def normalize(self, content : bytes) -> bytes:
+        """
+        Decodes a photo once, downscales it into the photo size and encodes it as png.
+        @Parameters:
+            content - Required : Raw bytes of the photo. (bytes) -> Used to be normalized
+        @Returns:
+            encoded_photo - The png bytes. (bytes)
+        """
+        with Image.open(io.BytesIO(content)) as photo :
+            # Let the jpeg decoder scale down while decoding, it is the cheapest way for the big photos.
+            photo.draft("RGB", self.photo_size)
+            photo = photo.convert("RGB")
+        photo.thumbnail(self.photo_size, Image.LANCZOS)
+
+        # Encode as png
+        output = io.BytesIO()
+        photo.save(output, "PNG")
+        return output.getvalue()
+
+    def shutdown(self) -> None:
+        """
+        Stops the worker threads, running downloads are finished.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        self.executor.shutdown(wait=False)
+
+# Process wide fetcher, created on the first use.
+_PHOTO_FETCHER = None
+_PHOTO_FETCHER_LOCK = threading.Lock()
+
+def get_photo_fetcher() -> PhotoFetcher:
+    """
+    Returns the process wide photo fetcher.
+    @Parameters:
+        None
+    @Returns:
+        photo_fetcher - The shared fetcher. (PhotoFetcher)
+    """
+    global _PHOTO_FETCHER
+    with _PHOTO_FETCHER_LOCK :
+        if _PHOTO_FETCHER is None :
+            _PHOTO_FETCHER = PhotoFetcher()
+        return _PHOTO_FETCHER
@@ -0,0 +1,213 @@
+from    Environment         import  EXECUTION_DC # -> Preflight constants
+from    concurrent.futures  import  Future, TimeoutError as FutureTimeoutError # -> Results of the running checks
+import  threading # -> Concurrent checks
+import  json # -> Cache serialization
+import  time # -> Deadlines and cache ages
+import  os # -> File operations
+
+class PreflightCache :
+
+    def __init__(self, cache_path : str = None, ttl : float = None) -> None:
+        """
+        Constructor method for PreflightCache class, which remembers the recent successful start up checks.
+        @Parameters:
+            cache_path - Optional : Path of the cache file. (str) (default = None) -> None loads EXECUTION_DC.PREFLIGHT_CACHE_PATH
+            ttl - Optional : Seconds a successful check is trusted. (float) (default = None) -> None loads EXECUTION_DC.PREFLIGHT_CACHE_TTL
+        @Returns:
+            None
+        """
+        # Check for cache config, for ungivens load the default ones from EXECUTION_DC
+        if cache_path is None :
+            cache_path = EXECUTION_DC.PREFLIGHT_CACHE_PATH
+        if ttl is None :
+            ttl = EXECUTION_DC.PREFLIGHT_CACHE_TTL
+
+        # Initialize class fields
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.entries = self._load()
+
+    def _load(self) -> dict:
+        """
+        Private method for loading the cache file, a missing or broken file gives an empty cache.
+        @Parameters:
+            None
+        @Returns:
+            entries - Cache entries by the check names. (dict)
+        """
+        try :
+            with open(self.cache_path, "r", encoding="utf-8") as cache_file :
+                entries = json.load(cache_file)
+            if isinstance(entries, dict) :
+                return {name : entry for name, entry in entries.items() if isinstance(entry, dict)}
+        except (OSError, ValueError) :
+            pass
+        return {}
+
+    def _save(self) -> None:
+        """
+        Private method for saving the cache file, over a temporary file so the readers never see a partial cache.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        try :
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            temporary_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(temporary_path, "w", encoding="utf-8") as cache_file :
+                json.dump(self.entries, cache_file)
+            os.replace(temporary_path, self.cache_path)
+        except OSError :
+            pass
+
+    def get(self, name : str, signature = None) -> dict:
+        """
+        Returns the cached success of a check, if it is younger than the ttl and has the same signature.
+        @Parameters:
+            name - Required : Name of the check. (str) -> Used to find the entry
+            signature - Optional : Current state the check depends on. (EXMP: modification time of the driver) (object) (default = None) -> Used to drop the entries of an other state
+        @Returns:
+            entry - {"time" : epoch, "message" : str, "signature" : object}, None if there is no fresh entry. (dict)
+        """
+        with self.lock :
+            entry = self.entries.get(name)
+        if entry is None or time.time() - entry.get("time", 0) > self.ttl or entry.get("signature") != signature :
+            return None
+        return entry
+
+    def set(self, name : str, message : str, signature = None) -> None:
+        """
+        Remembers a successful check.
+        @Parameters:
+            name - Required : Name of the check. (str) -> Used to name the entry
+            message - Required : Message of the check. (str) -> Used to be shown on the cached starts
+            signature - Optional : Current state the check depends on. (object) (default = None) -> Used to validate the entry later
+        @Returns:
+            None
+        """
+        with self.lock :
+            self.entries[name] = {"time" : time.time(), "message" : message, "signature" : signature}
+            self._save()
+
+    def discard(self, name : str) -> None:
+        """
+        Forgets a check, after a failure the next start checks it again.
+        @Parameters:
+            name - Required : Name of the check. (str) -> Used to find the entry
+        @Returns:
+            None
+        """
+        with self.lock :
+            if self.entries.pop(name, None) is not None :
+                self._save()
+
+class Preflight :
+
+    def __init__(self, timeout : float = None, cache : PreflightCache = None) -> None:
+        """
+        Constructor method for Preflight class, which runs the start up checks concurrently. Each check returns (is_successful, message).
+        @Parameters:
+            timeout - Optional : Seconds, deadline of the checks which block the start. (float) (default = None) -> None loads EXECUTION_DC.PREFLIGHT_TIMEOUT
+            cache - Optional : Cache of the successful checks. (PreflightCache) (default = None) -> None creates one from EXECUTION_DC
+        @Returns:
+            None
+        """
+        # Check for preflight config, for ungivens load the default ones from EXECUTION_DC
+        if timeout is None :
+            timeout = EXECUTION_DC.PREFLIGHT_TIMEOUT
+
+        # Initialize class fields, the deadline starts with the object.
+        self.deadline = time.monotonic() + timeout
+        self.cache = cache if cache is not None else PreflightCache()
+        self.futures = {}
+        self.cached_entries = {}
+
+    def start(self, name : str, check, is_cacheable : bool = False, signature = None) -> bool:
+        """
+        Starts a check on its own thread. The threads are daemons, a hung check never keeps the application open.
+        @Parameters:
+            name - Required : Name of the check. (str) -> Used to find the check
+            check - Required : Callable returning (is_successful, message). (callable) -> Used to run the check
+            is_cacheable - Optional : Remember the success of the check. (bool) (default = False) -> Used for the slow checks with stable results
+            signature - Optional : Current state the check depends on. (object) (default = None) -> Used to validate the cached success
+        @Returns:
+            is_cached - True if a fresh cached success exists, the check only refreshes it in the background. (bool)
+        """
+        # Check for a fresh cached success, before the check can refresh it.
+        entry = self.cache.get(name, signature) if is_cacheable else None
+        if entry is not None :
+            self.cached_entries[name] = entry
+
+        future = Future()
+        self.futures[name] = future
+
+        def __run() -> None:
+            try :
+                is_successful, message = check()
+            except Exception as error :
+                is_successful, message = False, str(error)
+            if is_cacheable :
+                if is_successful :
+                    self.cache.set(name, message, signature)
+                else :
+                    self.cache.discard(name)
+            future.set_result((is_successful, message))
+
+        threading.Thread(target=__run, name=f"preflight_{name}", daemon=True).start()
+        return entry is not None
+
+    def get_cached(self, name : str) -> dict:
+        """
+        Returns the cached success of a started check.
+        @Parameters:
+            name - Required : Name of the check. (str) -> Used to find the entry
+        @Returns:
+            entry - The cache entry, None if the check is not cached. (dict)
+        """
+        return self.cached_entries.get(name)
+
+    def wait(self, name : str, timeout : float = None) -> tuple:
+        """
+        Waits for the result of a check.
+        @Parameters:
+            name - Required : Name of the check. (str) -> Used to find the check
+            timeout - Optional : Seconds to wait. (float) (default = None) -> None waits until the deadline of the preflight
+        @Returns:
+            (bool, str) : Result of the check, (False, "No result in ...") if it does not finish in time.
+        """
+        remaining_time = max(0.0, self.deadline - time.monotonic()) if timeout is None else timeout
+        try :
+            return self.futures[name].result(timeout=remaining_time)
+        except FutureTimeoutError :
+            return (False, f"No result in {remaining_time:.1f} seconds")
+
+    def add_done_callback(self, name : str, callback) -> None:
+        """
+        Calls the callback with the result of a check when it finishes, on the thread of the check.
+        @Parameters:
+            name - Required : Name of the check. (str) -> Used to find the check
+            callback - Required : Callable taking (is_successful, message). (callable) -> Used for the background checks
+        @Returns:
+            None
+        """
+        self.futures[name].add_done_callback(lambda future : callback(*future.result()))
+
+# Process wide preflight, created by the first start.
+_PREFLIGHT = None
+_PREFLIGHT_LOCK = threading.Lock()
+
+def get_preflight() -> Preflight:
+    """
+    Returns the process wide preflight, so the GUI can wait for the checks which are still running in the background. (EXMP: get_preflight().wait("database"))
+    @Parameters:
+        None
+    @Returns:
+        preflight - The shared preflight. (Preflight)
+    """
+    global _PREFLIGHT
+    with _PREFLIGHT_LOCK :
+        if _PREFLIGHT is None :
+            _PREFLIGHT = Preflight()
+        return _PREFLIGHT
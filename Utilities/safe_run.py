@@ -1,16 +1,21 @@
-from    Utilities   import check_internet_connection, get_connection_details, download_chrome_driver, check_database_connection # -> Utility functions
-from    Environment import EXECUTION_DC, SELENIUM_DC, ASCII_LOG, DEBUG # -> Environment variables
+from    Utilities   import check_internet_connection, get_connection_details, download_chrome_driver, check_database_connection, get_preflight # -> Utility functions
+from    Utilities   import TRACER, span, traced # -> Instrumentation
+from    Utilities   import close_local_client, close_mongo_client # -> Last sync of the local store and the shared database client
+from    Environment import EXECUTION_DC, SELENIUM_DC, DATABASE_DC, ASCII_LOG, DEBUG # -> Environment variables
 from    GUI         import TranscriptManager # -> DRIVER CODE
 import  colorama # -> Colorful terminal
 import  shutil # -> File operations
+import  time # -> Age of the cached checks
+import  sys # -> Loaded modules
 import  os # -> Path operations
 
 # Init module variables
 prints_enabled = True
 
+@traced("safe_start", "startup")
 def safe_start() -> None:
     """
-    Method to start the application safely. It does checkout_pre_existing_checklist_must, checkout_pre_existing_checklist_relative, checkout_internet_connection, checkout_chrome_driver and checkout_database.
+    Method to start the application safely. It does checkout_pre_existing_checklist_must and checkout_pre_existing_checklist_relative, than runs the internet connection, chrome driver and database checks concurrently.
     @Parameters:
         None
     @Returns:
@@ -60,60 +65,102 @@ def safe_start() -> None:
         else :
             if prints_enabled : print(colorama.Fore.GREEN, ASCII_LOG["SUCCESS"], f"All relative packs approved -> {[os.path.basename(fname) for fname in EXECUTION_DC.PRE_EXISTING_CHECKLIST_RELATIVE]}", colorama.Fore.RESET)
     
-    def __checkout_internet_connection() -> None:
+    def __check_internet_connection() -> tuple:
         """
-        Method to checkout_internet_connection.
+        Method to check the internet connection, on the thread of the check.
         @Parameters:
             None
         @Returns:
-            None
+            (bool, str) : Result of the check.
         """
-        # Check for internet connection. If not, terminate the application.
-        if prints_enabled : print(colorama.Fore.YELLOW, ASCII_LOG["PROCCESS"], f"Checking for internet connection...", colorama.Fore.RESET)    
-        retrieval = check_internet_connection()
-        if retrieval : 
-            if prints_enabled : print(colorama.Fore.GREEN, ASCII_LOG["SUCCESS"], f"Internet connection established -> {get_connection_details()}", colorama.Fore.RESET)
-        else :
-            if prints_enabled : print(colorama.Fore.RED, ASCII_LOG["ERROR"], f"Internet connection failrue", colorama.Fore.RESET)
-            exit()
+        if check_internet_connection() :
+            return (True, f"{get_connection_details()}")
+        return (False, "No connection")
 
-    def __checkout_chrome_driver() -> None:
+    def __check_chrome_driver() -> tuple:
         """
-        Method to checkout_chrome_driver.
+        Method to check the chrome driver, downloads it if it is missing. Runs on the thread of the check.
         @Parameters:
             None
         @Returns:
+            (bool, str) : Result of the check.
+        """
+        if os.path.exists(SELENIUM_DC.CHROME_DRIVER_PATH) :
+            return (True, SELENIUM_DC.CHROME_DRIVER_PATH)
+
+        # The download needs the internet connection, wait for its check.
+        if prints_enabled : print(colorama.Fore.BLUE, ASCII_LOG["SUCCESS"], f"Chrome driver not found. Downloading...", colorama.Fore.RESET)
+        is_connected, message = preflight.wait("internet_connection")
+        if not is_connected :
+            return (False, f"Internet connection failrue -> {message}")
+        return download_chrome_driver()
+
+    def __get_chrome_driver_signature() -> float:
+        """
+        Method to get the state of the chrome driver, a replaced or deleted driver invalidates its cached check.
+        @Parameters:
             None
+        @Returns:
+            signature - Modification time of the driver, None if it is missing. (float)
         """
-        # Check for chrome driver. If not, download it.
-        if prints_enabled : print(colorama.Fore.YELLOW, ASCII_LOG["PROCCESS"], f"Checking for chrome driver...", colorama.Fore.RESET)
-        if not os.path.exists(SELENIUM_DC.CHROME_DRIVER_PATH) :
-            if prints_enabled : print(colorama.Fore.BLUE, ASCII_LOG["SUCCESS"], f"Chrome driver not found. Downloading...", colorama.Fore.RESET)
-            is_download_successfull, message = download_chrome_driver()
-            if is_download_successfull :
-                if prints_enabled : print(colorama.Fore.GREEN, ASCII_LOG["SUCCESS"], f"Chrome driver downloaded successfully -> {message}", colorama.Fore.RESET)
-            else :
-                if prints_enabled : print(colorama.Fore.RED, ASCII_LOG["FAILURE"], f"Chrome driver download failed -> {message}", colorama.Fore.RESET)
-                exit()
-        else :
-            if prints_enabled : print(colorama.Fore.GREEN, ASCII_LOG["SUCCESS"], f"Chrome driver found -> {SELENIUM_DC.CHROME_DRIVER_PATH}", colorama.Fore.RESET)
+        try :
+            return os.path.getmtime(SELENIUM_DC.CHROME_DRIVER_PATH)
+        except OSError :
+            return None
 
-    def __checkout_database() -> None:
+    def __start_checks() -> None:
         """
-        Method to checkout_database.
+        Method to start the independent checks at once, each one on its own thread.
         @Parameters:
             None
         @Returns:
             None
         """
-        # Check if mongoDB is reachable. If not, terminate the application.
-        if prints_enabled : print(colorama.Fore.YELLOW, ASCII_LOG["PROCCESS"], f"Checking for database connection...", colorama.Fore.RESET)
-        is_database_connection_successfull, message = check_database_connection()
-        if is_database_connection_successfull :
-            if prints_enabled : print(colorama.Fore.GREEN, ASCII_LOG["SUCCESS"], f"Database connection established -> {message}", colorama.Fore.RESET)
+        preflight.start("internet_connection", __check_internet_connection)
+        preflight.start("chrome_driver", __check_chrome_driver, is_cacheable=True, signature=__get_chrome_driver_signature())
+        preflight.start("database", lambda : check_database_connection(bootstrap_indexes=True), is_cacheable=True, signature=DATABASE_DC.CONNECTION_STRING)
+
+    def __report_background_check(process_name : str, is_successful : bool, message : str) -> None:
+        """
+        Method to report a check which is finished in the background, after the window is opened.
+        @Parameters:
+            process_name - Required : Name of the check in the logs. (str) -> Used to print the result
+            is_successful - Required : Result of the check. (bool) -> Used to print the result
+            message - Required : Message of the check. (str) -> Used to print the result
+        @Returns:
+            None
+        """
+        if is_successful :
+            if prints_enabled : print(colorama.Fore.GREEN, ASCII_LOG["SUCCESS"], f"{process_name} rechecked in background -> {message}", colorama.Fore.RESET)
         else :
-            if prints_enabled : print(colorama.Fore.RED, ASCII_LOG["ERROR"], f"Database connection failure -> {message}", colorama.Fore.RESET)
+            if prints_enabled : print(colorama.Fore.RED, ASCII_LOG["ERROR"], f"{process_name} failure in background, it will be checked again on the next start -> {message}", colorama.Fore.RESET)
+
+    def __checkout_check(check_name : str, process_name : str, is_required : bool = True) -> None:
+        """
+        Method to checkout a started check. A recent cached success is trusted and the check finishes in the background, otherwise it is waited until the deadline.
+        @Parameters:
+            check_name - Required : Name of the started check. (str) -> Used to find the check
+            process_name - Required : Name of the check in the logs. (str) -> Used to print the result
+            is_required - Optional : Terminate the application if the check fails. (bool) (default = True) -> False only reports the failure
+        @Returns:
+            None
+        """
+        # Check for the process. If a required one fails, terminate the application.
+        if prints_enabled : print(colorama.Fore.YELLOW, ASCII_LOG["PROCCESS"], f"Checking for {process_name.lower()}...", colorama.Fore.RESET)
+        cached_entry = preflight.get_cached(check_name)
+        if cached_entry is not None :
+            if prints_enabled : print(colorama.Fore.GREEN, ASCII_LOG["SUCCESS"], f"{process_name} approved {int((time.time() - cached_entry['time']) // 60)} min ago, rechecking in background -> {cached_entry['message']}", colorama.Fore.RESET)
+            preflight.add_done_callback(check_name, lambda is_successful, message : __report_background_check(process_name, is_successful, message))
+            return
+        with span(f"safe_start.{check_name}", "startup") :
+            is_successful, message = preflight.wait(check_name)
+        if is_successful :
+            if prints_enabled : print(colorama.Fore.GREEN, ASCII_LOG["SUCCESS"], f"{process_name} established -> {message}", colorama.Fore.RESET)
+        elif is_required :
+            if prints_enabled : print(colorama.Fore.RED, ASCII_LOG["ERROR"], f"{process_name} failure -> {message}", colorama.Fore.RESET)
             exit()
+        else :
+            if prints_enabled : print(colorama.Fore.RED, ASCII_LOG["ERROR"], f"{process_name} failure, working offline and syncing in background -> {message}", colorama.Fore.RESET)
 
     def __checkout_post_cleanup_list() -> None:
         """
@@ -142,11 +189,14 @@ def safe_start() -> None:
         # This error occurs when the application is running in background and the user tries to delete the folder manually.
         # In this case, the application will terminate without deleting the folder.
         pass
-    __checkout_pre_existing_checklist_must()
-    __checkout_pre_existing_checklist_relative()
-    __checkout_internet_connection()
-    __checkout_chrome_driver()
-    __checkout_database()
+    with span("safe_start.folders", "startup") :
+        __checkout_pre_existing_checklist_must()
+        __checkout_pre_existing_checklist_relative()
+    preflight = get_preflight()
+    __start_checks()
+    __checkout_check("internet_connection", "Internet connection")
+    __checkout_check("chrome_driver", "Chrome driver")
+    __checkout_check("database", "Database connection", is_required=not DATABASE_DC.LOCAL_STORE_ENABLED)
 
 def safe_execute() -> None:
     """
@@ -221,7 +271,95 @@ def safe_end() -> None:
         else :
             if prints_enabled : print(colorama.Fore.GREEN, ASCII_LOG["SUCCESS"], f"All folders \"clean_approved\" -> {[os.path.basename(fname) for fname in EXECUTION_DC.POST_CLEANUP_LIST]}", colorama.Fore.RESET)
 
+    def __report_wait_metrics() -> None:
+        """
+        Method to report the browser wait times, only on debug mode.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        # Nothing to report if the browser module is never loaded, do not load it just for the report.
+        web_module = sys.modules.get("Utilities.web")
+        if web_module is None :
+            return
+
+        # Print the slowest waits first, so the slow SIS pages are easy to spot.
+        wait_summary = web_module.WAIT_METRICS.get_summary()
+        if not DEBUG or not wait_summary :
+            return
+        if prints_enabled : print(colorama.Fore.YELLOW, ASCII_LOG["PROCCESS"], f"Browser wait times...", colorama.Fore.RESET)
+        for key, current_record in wait_summary.items() :
+            if prints_enabled : print(colorama.Fore.BLUE, ASCII_LOG["SUCCESS"], f"{current_record['mean_time']:.3f}s mean, {current_record['max_time']:.3f}s max, {current_record['count']} wait(s), {current_record['timeout_count']} timeout(s) -> {key}", colorama.Fore.RESET)
+
+    def __report_trace() -> None:
+        """
+        Method to save the trace and report the spans, only if the instrumentation is enabled.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        # Print the spans with the biggest total first, than save the trace for chrome://tracing.
+        trace_summary = TRACER.get_summary()
+        if not TRACER.enabled or not trace_summary :
+            return
+        if prints_enabled : print(colorama.Fore.YELLOW, ASCII_LOG["PROCCESS"], f"Span times...", colorama.Fore.RESET)
+        for name, current_record in trace_summary.items() :
+            if prints_enabled : print(colorama.Fore.BLUE, ASCII_LOG["SUCCESS"], f"{current_record['total_time']:.3f}s total, {current_record['mean_time']:.3f}s mean, {current_record['max_time']:.3f}s max, {current_record['count']} call(s) -> {name}", colorama.Fore.RESET)
+        try :
+            trace_path = TRACER.save_trace()
+            if prints_enabled : print(colorama.Fore.GREEN, ASCII_LOG["SUCCESS"], f"Trace saved -> {trace_path}", colorama.Fore.RESET)
+        except OSError as e :
+            if prints_enabled : print(colorama.Fore.RED, ASCII_LOG["FAILURE"], f"Trace could not be saved -> {e}", colorama.Fore.RESET)
+
+    def __report_sync() -> None:
+        """
+        Method to push the pending changes of the local store for the last time and report the ones left, only if the local store is used.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        sync_status = close_local_client()
+        if sync_status is None :
+            return
+        if prints_enabled : print(colorama.Fore.YELLOW, ASCII_LOG["PROCCESS"], f"Syncing local store...", colorama.Fore.RESET)
+        pending_count = sync_status["counts"]["pending"]
+        if pending_count :
+            if prints_enabled : print(colorama.Fore.RED, ASCII_LOG["ERROR"], f"{pending_count} change(s) will be synced on the next start -> {sync_status['last_error']}", colorama.Fore.RESET)
+        else :
+            if prints_enabled : print(colorama.Fore.GREEN, ASCII_LOG["SUCCESS"], f"All changes synced", colorama.Fore.RESET)
+        failed_count = sync_status["counts"]["failed"]
+        if failed_count :
+            if prints_enabled : print(colorama.Fore.RED, ASCII_LOG["ERROR"], f"{failed_count} broken change(s) are kept only in the local store", colorama.Fore.RESET)
+        for conflict in sync_status["conflicts"] :
+            if prints_enabled : print(colorama.Fore.RED, ASCII_LOG["ERROR"], f"Sync conflict, kept only in the local store -> {conflict['owner_id']} / {conflict['document_name']}", colorama.Fore.RESET)
+
+    def __report_pool_metrics() -> None:
+        """
+        Method to report the connection pool of the shared database client, only on debug mode.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        # Nothing to report if the database module is never loaded.
+        database_module = sys.modules.get("Utilities.database")
+        if database_module is None :
+            return
+        pool_summary = database_module.POOL_METRICS.get_summary()
+        if not DEBUG or not pool_summary["check_outs"] :
+            return
+        if prints_enabled : print(colorama.Fore.YELLOW, ASCII_LOG["PROCCESS"], f"Database connection pool...", colorama.Fore.RESET)
+        if prints_enabled : print(colorama.Fore.BLUE, ASCII_LOG["SUCCESS"], f"{pool_summary['check_outs']} check out(s), {pool_summary['check_out_failures']} failure(s), {pool_summary['max_checked_out']} max checked out, {pool_summary['mean_wait_time'] * 1e3:.2f}ms mean wait, {pool_summary['max_wait_time'] * 1e3:.2f}ms max wait, {pool_summary['pool_clears']} pool clear(s)", colorama.Fore.RESET)
+
     # Call all checkout methods in order
+    __report_sync()
+    __report_pool_metrics()
+    close_mongo_client()
+    __report_trace()
+    __report_wait_metrics()
     __checkout_post_cache_cleanup_list()
     try :
         __checkout_post_cleanup_list()
@@ -0,0 +1,168 @@
+from    enum    import  Enum # -> Grade enum
+
+# Version of the stored user_data and user_base documents. Documents without a "schema_version" are version 1, their courses are lists of string dicts.
+SCHEMA_VERSION = 2
+
+# Values of the numeric fields which can not be converted, (EXMP: "" or "-" of an old document) so the courses are always typed.
+DEFAULT_COURSE_CREDIT = 0
+DEFAULT_COURSE_GRADE_POINT = 0.0
+
+# Fields of a course, in the order of the transcript columns.
+COURSE_FIELDS = ("course_code", "course_name", "course_lang", "course_credit", "course_grade", "course_grade_point")
+
+# Course list fields of a document, stored column oriented from version 2.
+COURSE_LIST_FIELDS = ("original_course_list", "modified_course_list", "added_course_list", "subtracted_course_list", "updated_course_list")
+
+class Grade(str, Enum) :
+    """
+    Letter grades of the transcript. The courses keep the plain values, (EXMP: "B+") the enum gives their meaning and their compact codes.
+    """
+    A = "A"
+    A_MINUS = "A-"
+    B_PLUS = "B+"
+    B = "B"
+    B_MINUS = "B-"
+    C_PLUS = "C+"
+    C = "C"
+    C_MINUS = "C-"
+    D_PLUS = "D+"
+    D = "D"
+    F = "F"
+    U = "U"
+    S = "S"
+    I = "I"
+    W = "W"
+    NA = "N/A"
+
+# Grades counted in the GPA and the credits successful.
+PASSING_GRADES = frozenset(grade.value for grade in (Grade.A, Grade.A_MINUS, Grade.B_PLUS, Grade.B, Grade.B_MINUS, Grade.C_PLUS, Grade.C, Grade.C_MINUS, Grade.D_PLUS, Grade.D))
+# Grades counted in the GPA only.
+FAILING_GRADES = frozenset(grade.value for grade in (Grade.F, Grade.U))
+
+# Compact codes of the grades, the position in the enum. The codes are stored, so new grades must be added to the end.
+GRADE_CODES = {grade.value : grade_code for grade_code, grade in enumerate(Grade)}
+GRADES_BY_CODE = [grade.value for grade in Grade]
+
+def coerce_course_field(field_name : str, value) :
+    """
+    Converts a course field to its type, int credits and float grade points. Used for the strings of the GUI and the version 1 documents.
+    Numeric values which can not be converted are normalised to the defaults, an old document is never lost because of a broken field and its sums and sorts still work.
+    @Parameters:
+        field_name - Required : Name of the field. (str) -> Used to find the type
+        value - Required : Value of the field. (object) -> Used to be converted
+    @Returns:
+        value - The typed value. (object)
+    """
+    if field_name == "course_credit" and not isinstance(value, int) :
+        try :
+            return int(float(value))
+        except (TypeError, ValueError, OverflowError) :
+            return DEFAULT_COURSE_CREDIT
+    if field_name == "course_grade_point" and not isinstance(value, float) :
+        try :
+            return float(value)
+        except (TypeError, ValueError) :
+            return DEFAULT_COURSE_GRADE_POINT
+    return value
+
+def coerce_course(course : dict) -> dict:
+    """
+    Returns a copy of the course with the typed fields.
+    @Parameters:
+        course - Required : The course. (dict) -> Used to be converted
+    @Returns:
+        course - The typed course. (dict)
+    """
+    return {field_name : coerce_course_field(field_name, value) for field_name, value in course.items()}
+
+def encode_course_list(course_list : list) -> dict:
+    """
+    Encodes a course list column oriented, each field is written once and the grades are written as their codes.
+    @Parameters:
+        course_list - Required : The courses. (list) -> Used to be encoded
+    @Returns:
+        columns - {field_name : values}, None for a None course list. (dict)
+    """
+    if course_list is None :
+        return None
+    columns = {field_name : [] for field_name in COURSE_FIELDS}
+    for course in course_list :
+        course = coerce_course(course)
+        for field_name in COURSE_FIELDS :
+            value = course.get(field_name)
+            if field_name == "course_grade" :
+                value = GRADE_CODES.get(value, value)
+            columns[field_name].append(value)
+    return columns
+
+def decode_course_list(columns : dict) -> list:
+    """
+    Decodes a column oriented course list.
+    @Parameters:
+        columns - Required : Output of encode_course_list. (dict) -> Used to be decoded
+    @Returns:
+        course_list - The typed courses, None for None columns. (list)
+    """
+    if columns is None :
+        return None
+    course_list = [dict(zip(COURSE_FIELDS, values)) for values in zip(*(columns[field_name] for field_name in COURSE_FIELDS))]
+    for course in course_list :
+        if isinstance(course["course_grade"], int) :
+            course["course_grade"] = GRADES_BY_CODE[course["course_grade"]]
+    return course_list
+
+def get_schema_version(document : dict) -> int:
+    """
+    Returns the schema version of a stored document.
+    @Parameters:
+        document - Required : The stored document. (dict) -> Used to find the version
+    @Returns:
+        version - Schema version, 1 for the documents without it. (int)
+    """
+    return document.get("schema_version", 1)
+
+def encode_document(document : dict) -> dict:
+    """
+    Encodes a user_data or user_base document into the current schema. Only the course fields change, the rest is copied as it is.
+    @Parameters:
+        document - Required : The document with the course lists. (dict) -> Used to be encoded
+    @Returns:
+        document - The stored document. (dict)
+    """
+    encoded_document = dict(document)
+    for field_name in COURSE_LIST_FIELDS :
+        if field_name in encoded_document :
+            encoded_document[field_name] = encode_course_list(encoded_document[field_name])
+    if isinstance(encoded_document.get("semesters"), dict) :
+        encoded_document["semesters"] = {semester_id : dict(semester, course_list=encode_course_list(semester.get("course_list"))) for semester_id, semester in encoded_document["semesters"].items()}
+    encoded_document["schema_version"] = SCHEMA_VERSION
+    return encoded_document
+
+def decode_document(document : dict) -> dict:
+    """
+    Decodes a stored user_data or user_base document of any schema version into the course lists of the application, with the typed fields.
+    @Parameters:
+        document - Required : The stored document. (dict) -> Used to be decoded
+    @Returns:
+        document - The document with the course lists. (dict)
+    """
+    # Version 1 courses are the string dicts, version 2 courses are the columns.
+    decode = decode_course_list if get_schema_version(document) >= 2 else lambda course_list : [coerce_course(course) for course in course_list] if course_list is not None else None
+
+    decoded_document = {field_name : value for field_name, value in document.items() if field_name != "schema_version"}
+    for field_name in COURSE_LIST_FIELDS :
+        if field_name in decoded_document :
+            decoded_document[field_name] = decode(decoded_document[field_name])
+    if isinstance(decoded_document.get("semesters"), dict) :
+        decoded_document["semesters"] = {semester_id : dict(semester, course_list=decode(semester.get("course_list"))) for semester_id, semester in decoded_document["semesters"].items()}
+    return decoded_document
+
+def migrate_document(document : dict) -> dict:
+    """
+    Migrates a stored document of any schema version to the current one.
+    @Parameters:
+        document - Required : The stored document. (dict) -> Used to be migrated
+    @Returns:
+        document - The stored document in the current schema. (dict)
+    """
+    return encode_document(decode_document(document))
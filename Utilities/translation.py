@@ -0,0 +1,192 @@
+from    Environment     import  CACHE_DC, to_turkish, mef_vocabulary # -> Memo path and the bundled vocabularies
+from    Utilities.lazy  import  lazy_import # -> Deferred heavy imports
+import  threading # -> Thread safe memo
+import  json # -> Memo serialization
+import  os # -> File operations
+
+# Imported on the first network translation, most of the texts are known.
+googletrans = lazy_import("googletrans") # -> Translation for the unknown texts
+
+class TranslationService :
+
+    # Separator of the combined fields, EXMP: "Faculty of Engineering / Computer Engineering"
+    PART_SEPARATOR = " / "
+    # Separator of the texts in a batched network request, the translator keeps the lines.
+    BATCH_SEPARATOR = "\n"
+
+    def __init__(self, memo_path : str = None) -> None:
+        """
+        Constructor method for TranslationService class, which translates the texts from the bundled vocabularies and a persistent memo, and batches the rest into one request.
+        @Parameters:
+            memo_path - Optional : Path of the memo file. (str) (default = None) -> None loads CACHE_DC.TRANSLATION_MEMO_PATH
+        @Returns:
+            None
+        """
+        # Check for memo path, for ungiven load the default one from CACHE_DC
+        if memo_path is None :
+            memo_path = CACHE_DC.TRANSLATION_MEMO_PATH
+
+        # Initialize class fields
+        self.memo_path = memo_path
+        self.lock = threading.Lock()
+
+        # Seed the vocabulary with the bundled ones, in both of the directions.
+        self.vocabulary = {"en->tr" : {}, "tr->en" : {}}
+        for english_text, turkish_text in list(to_turkish.items()) + list(mef_vocabulary.items()) :
+            self.vocabulary["en->tr"][english_text] = turkish_text
+            self.vocabulary["tr->en"].setdefault(turkish_text, english_text)
+
+        # Load the memo of the previous network translations
+        self.memo = self._load_memo()
+
+    def _load_memo(self) -> dict:
+        """
+        Private method for loading the memo file, a missing or broken file gives an empty memo.
+        @Parameters:
+            None
+        @Returns:
+            memo - Translations by their directions. (dict)
+        """
+        try :
+            with open(self.memo_path, "r", encoding="utf-8") as memo_file :
+                memo = json.load(memo_file)
+            if isinstance(memo, dict) :
+                return {direction : dict(translations) for direction, translations in memo.items() if isinstance(translations, dict)}
+        except (OSError, ValueError) :
+            pass
+        return {}
+
+    def _save_memo(self) -> None:
+        """
+        Private method for saving the memo file, over a temporary file so the readers never see a partial memo.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        try :
+            os.makedirs(os.path.dirname(self.memo_path) or ".", exist_ok=True)
+            temporary_path = f"{self.memo_path}.{os.getpid()}.tmp"
+            with open(temporary_path, "w", encoding="utf-8") as memo_file :
+                json.dump(self.memo, memo_file, ensure_ascii=False)
+            os.replace(temporary_path, self.memo_path)
+        except OSError :
+            pass
+
+    def _lookup(self, text : str, direction : str) -> str:
+        """
+        Private method for finding a known translation.
+        @Parameters:
+            text - Required : Text to be translated. (str) -> Used to find the translation
+            direction - Required : "source->target" (str) -> Used to select the table
+        @Returns:
+            translation - The known translation, None if it is unknown. (str)
+        """
+        # Texts which are already in the target language are kept as they are.
+        source_language, target_language = direction.split("->")
+        reverse_direction = f"{target_language}->{source_language}"
+        for current_table in (self.vocabulary.get(direction, {}), self.memo.get(direction, {})) :
+            if text in current_table :
+                return current_table[text]
+        if text in self.vocabulary.get(reverse_direction, {}) :
+            return text
+        return None
+
+    def translate_many(self, texts : list, source_language : str = "en", target_language : str = "tr") -> list:
+        """
+        Translates the given texts. Known parts are taken from the vocabularies and the memo, the unknown ones are sent in one request.
+        @Parameters:
+            texts - Required : Texts to be translated. (list) -> Used to be translated
+            source_language - Optional : The language of the texts. (str) (default = "en") -> Used to translate the texts
+            target_language - Optional : The language to be translated. (str) (default = "tr") -> Used to translate the texts
+        @Returns:
+            translations - Translated texts, in the order of the given ones. (list)
+        """
+        direction = f"{source_language}->{target_language}"
+
+        # Split the combined fields, each part is translated on its own.
+        split_texts = [text.split(self.PART_SEPARATOR) for text in texts]
+
+        # Find the unknown parts
+        with self.lock :
+            unknown_parts = []
+            for current_parts in split_texts :
+                for current_part in current_parts :
+                    if current_part.strip() and self._lookup(current_part.strip(), direction) is None and current_part.strip() not in unknown_parts :
+                        unknown_parts.append(current_part.strip())
+
+        # Translate the unknown ones with a single request, than remember them.
+        if unknown_parts :
+            network_translations = self._translate_over_network(unknown_parts, source_language, target_language)
+            with self.lock :
+                self.memo.setdefault(direction, {}).update(zip(unknown_parts, network_translations))
+                self._save_memo()
+
+        # Join the translated parts back
+        with self.lock :
+            translations = []
+            for current_parts in split_texts :
+                translated_parts = []
+                for current_part in current_parts :
+                    translated_parts.append(self._lookup(current_part.strip(), direction) if current_part.strip() else current_part)
+                translations.append(self.PART_SEPARATOR.join(translated_parts))
+
+        # Return the translations
+        return translations
+
+    def translate(self, text : str, source_language : str = "en", target_language : str = "tr") -> str:
+        """
+        Translates the given text.
+        @Parameters:
+            text - Required : Text to be translated. (str) -> Used to be translated
+            source_language - Optional : The language of the text. (str) (default = "en") -> Used to translate the text
+            target_language - Optional : The language to be translated. (str) (default = "tr") -> Used to translate the text
+        @Returns:
+            translation - The translated text. (str)
+        """
+        return self.translate_many([text], source_language, target_language)[0]
+
+    def _translate_over_network(self, texts : list, source_language : str, target_language : str) -> list:
+        """
+        Private method for translating the texts with a single request.
+        @Parameters:
+            texts - Required : Texts to be translated, without the batch separator. (list) -> Used to be translated
+            source_language - Required : The language of the texts. (str) -> Used to translate the texts
+            target_language - Required : The language to be translated. (str) -> Used to translate the texts
+        @Returns:
+            translations - Translated texts. (list)
+        """
+        # Create a translator object (A new one required for each translation because of the caching bug)
+        translator = googletrans.Translator()
+
+        try :
+            # Send all of the texts as lines of a single text
+            translations = translator.translate(self.BATCH_SEPARATOR.join(texts), src=source_language, dest=target_language).text.split(self.BATCH_SEPARATOR)
+
+            # The lines are merged rarely, translate them one by one in that case.
+            if len(translations) != len(texts) :
+                translations = [translator.translate(text, src=source_language, dest=target_language).text for text in texts]
+        except :
+            # If the translation fails, raise an exception
+            raise Exception("Error: Translation failed, LOG: " + source_language + " " + target_language + " " + " | ".join(texts))
+
+        # Return the translations
+        return [translation.strip() for translation in translations]
+
+# Process wide service, created on the first use.
+_TRANSLATION_SERVICE = None
+_TRANSLATION_SERVICE_LOCK = threading.Lock()
+
+def get_translation_service() -> TranslationService:
+    """
+    Returns the process wide translation service.
+    @Parameters:
+        None
+    @Returns:
+        translation_service - The shared service. (TranslationService)
+    """
+    global _TRANSLATION_SERVICE
+    with _TRANSLATION_SERVICE_LOCK :
+        if _TRANSLATION_SERVICE is None :
+            _TRANSLATION_SERVICE = TranslationService()
+        return _TRANSLATION_SERVICE
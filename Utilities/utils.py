@@ -1,19 +1,20 @@
 from 	Environment 			import 	UTILITIES_DC, PACKAGES_DC, connect_urls, SELENIUM_DC # -> Environment variables 
-from 	bs4 					import 	BeautifulSoup # -> HTML parsing for chrome driver installation
-from 	googletrans 			import 	Translator # -> Translation for non hashable texts
-from 	win32com.client 		import 	Dispatch # -> OS manipulation
+from 	Utilities.http_client 	import 	get_http_session, create_http_session # -> Pooled http sessions
+from 	Utilities.translation 	import 	get_translation_service # -> Cached and batched translations
+from 	Utilities.gender_index 	import 	get_gender_index # -> Lazy name to gender index
+from 	Utilities.lazy 			import 	lazy_import # -> Deferred heavy imports
+from 	Utilities.transcript_schema	import 	COURSE_FIELDS, PASSING_GRADES, FAILING_GRADES, Grade, coerce_course, coerce_course_field # -> Typed courses
 from 	PIL 					import 	Image # -> Image manipulation
-import 	gender_guesser.detector as 		gender # -> Gender detection
 import 	subprocess # -> OS manipulation
 import 	requests # -> Web requests
 import 	zipfile # -> Zip file manipulation
 import 	socket # -> Internet connection check
 import 	os # -> OS manipulation
-import 	re # -> Regex manipulation
 import 	io # -> IO manipulation
 
-# Initialize a gender detector object.
-GENDER_DETECTOR = gender.Detector(case_sensitive=False)
+# Heavy modules, imported on their first use. (Only needed for the chrome driver installation)
+bs4 = lazy_import("bs4") # -> HTML parsing for chrome driver installation
+win32com_client = lazy_import("win32com.client") # -> OS manipulation
 
 def translate_text(text : str, source_language : str = "en", target_language : str = "tr") -> str:
 	"""
@@ -23,20 +24,10 @@ def translate_text(text : str, source_language : str = "en", target_language : s
 		source_language - Optional : The language of the text. (str) (default = "en") -> Used to translate the text
 		target_language - Optional : The language to be translated. (str) (default = "tr") -> Used to translate the text
 	@Returns:
-		translation.text - The translated text. (str)
+		translation - The translated text. (str)
 	"""
-	# Create a translator object (A new one required for each translation because of the caching bug)
-	translator = Translator()
-	
-	try :
-		# Try to translate the text
-		translation = translator.translate(text, src=source_language, dest=target_language)
-		
-		# Return the translated text
-		return translation.text
-	except :
-		# If the translation fails, raise an exception
-		raise Exception("Error: Translation failed, LOG: " + source_language + " " + target_language + " " + text)
+	# Translate over the shared service, known texts do not hit the network.
+	return get_translation_service().translate(text, source_language, target_language)
 
 def get_gif_frame_count(gif_file_path : str) -> int:
 	"""
@@ -63,49 +54,72 @@ def get_gif_frame_count(gif_file_path : str) -> int:
 	# Return the number of frames
 	return number_of_frames
 
-def authenticate(username : str, password : str) -> bool:
+def create_authenticated_session(username : str, password : str) -> requests.Session:
 	"""
-	Authenticates the user with the given username and password.
+	Logs into the SIS with the given username and password, and returns the logged in session.
 	@Parameters:
 		username - Required : The username of the user. (str) -> Used to authenticate the user
 		password - Required : The password of the user. (str) -> Used to authenticate the user
 	@Returns:
-		True - If the authentication is successful. (bool)
-		False - If the authentication is unsuccessful. (bool)
+		session - The authenticated session, None if the authentication is unsuccessful. (requests.Session)
 	"""
-	# Load the payload stucture.
-	payload = UTILITIES_DC.AUTH_PAYLOAD
+	# Load a copy of the payload stucture, so the credentials are not kept on the shared constant.
+	payload = dict(UTILITIES_DC.AUTH_PAYLOAD)
 	# Fill the payload with the given username and password.
 	payload.update(kullanici_adi=username, kullanici_sifre=password)
 
 	# Send the authentication request.
-	with requests.Session() as s:
-		# Send the authentication request.
-		s.post(UTILITIES_DC.AUTH_LOG_URL, data=payload)
+	session = create_http_session()
+	try :
+		session.post(UTILITIES_DC.AUTH_LOG_URL, data=payload)
 		
 		# Get the authentication result.
-		r = s.get(UTILITIES_DC.AUTH_SEC_URL)
+		r = session.get(UTILITIES_DC.AUTH_SEC_URL)
+	except :
+		session.close()
+		raise
 
-		# Check if the authentication is successful.
-		if r.url == UTILITIES_DC.AUTH_SEC_URL:
-			# Return True if the authentication is successful.
-			return True
-		
-	# Return False if the authentication is unsuccessful.
-	return False
+	# Check if the authentication is successful, the secure page redirects back to the login otherwise.
+	if r.url == UTILITIES_DC.AUTH_SEC_URL:
+		# Return the session if the authentication is successful.
+		return session
+
+	# Return None if the authentication is unsuccessful.
+	session.close()
+	return None
 
-def check_internet_connection() -> bool:
+def authenticate(username : str, password : str) -> bool:
+	"""
+	Authenticates the user with the given username and password.
+	@Parameters:
+		username - Required : The username of the user. (str) -> Used to authenticate the user
+		password - Required : The password of the user. (str) -> Used to authenticate the user
+	@Returns:
+		True - If the authentication is successful. (bool)
+		False - If the authentication is unsuccessful. (bool)
+	"""
+	# Log in and drop the session, only the result is needed.
+	session = create_authenticated_session(username, password)
+	if session is None :
+		return False
+	session.close()
+	return True
+
+def check_internet_connection(timeout : float = None) -> bool:
 	"""
 	Checks if the device is connected to the internet.
 	@Parameters:
-		None
+		timeout - Optional : Seconds to wait for the connection test url. (float) (default = None) -> None uses the default timeout of the http client
 	@Returns:
 		True - If the device is connected to the internet. (bool)
 		False - If the device is not connected to the internet. (bool)
 	"""
 	# Try to connect to the connection test url.
 	try :
-		requests.get(PACKAGES_DC.CONNECTION_TEST_URL)
+		if timeout is None :
+			get_http_session().head(PACKAGES_DC.CONNECTION_TEST_URL)
+		else :
+			get_http_session().head(PACKAGES_DC.CONNECTION_TEST_URL, timeout=timeout)
 
 		# If the connection is successful, return True.
 		return True
@@ -162,7 +176,7 @@ def download_chrome_driver() -> tuple:
 			version_base - The chrome version. (str)
 		"""
 		# Dispatch the file system object.
-		parser = Dispatch("Scripting.FileSystemObject")
+		parser = win32com_client.Dispatch("Scripting.FileSystemObject")
 
 		# Get the chrome version.
 		try :
@@ -190,10 +204,10 @@ def download_chrome_driver() -> tuple:
 	version_base = version_base.split(".")[0]
 
 	# Download the chrome driver.
-	download_page_response = requests.get(PACKAGES_DC.CHROME_DRIVER_DOWNLOAD_URL)
+	download_page_response = get_http_session().get(PACKAGES_DC.CHROME_DRIVER_DOWNLOAD_URL)
 
 	# Parse the download page.
-	parsed_page = BeautifulSoup(download_page_response.text, "html.parser")
+	parsed_page = bs4.BeautifulSoup(download_page_response.text, "html.parser")
 
 	# Get the official version.
 	all_versions = parsed_page.find_all("a", class_="XqQF9c")
@@ -210,7 +224,8 @@ def download_chrome_driver() -> tuple:
 	file_download_url = connect_urls(PACKAGES_DC.CHROME_DRIVER_DOWNLOAD_PARTITION["base"], official_version, PACKAGES_DC.CHROME_DRIVER_DOWNLOAD_PARTITION["args"])
 
 	# Download the chrome driver.
-	download_response = requests.get(file_download_url)
+	download_response = get_http_session().get(file_download_url)
+	download_response.raise_for_status()
 
 	# Get zip file.
 	zipFile = zipfile.ZipFile(io.BytesIO(download_response.content))
@@ -263,20 +278,8 @@ def get_gender(name : str = None, country : str = "turkey") -> str:
 	"""
 	# Check if the name is None.
 	if name is not None :
-		# Set up a translation map.
-		transmap = str.maketrans("ıüöçşğİÜÖÇŞĞ", "iuocsgIUOCSG")
-        
-		# Clean the name.
-		name = name.lower()
-		name = name.split(" ")[0]
-		name = name.translate(transmap)
-		name = name.capitalize()
-
-		# Remove the non-alphabetic characters.
-		name = re.sub(r"[^a-zA-Z]+", "", name)
-	
-		# Detect and return gender.
-		return GENDER_DETECTOR.get_gender(name=name, country=country)
+		# Detect and return gender, over the index of the country.
+		return get_gender_index(country).get_gender(name)
 	else :
 		# If not passed, return None.
 		return None
@@ -306,7 +309,7 @@ def _validate_input_key(key : str) -> None:
 	@Returns:
 		None
 	"""
-	if key not in ["course_code", "course_name", "course_lang", "course_credit", "course_grade", "course_grade_point"]:
+	if key not in COURSE_FIELDS:
 		# If key is not found, than raise an error. This is because this can not be outside of the scope by initial call.
 		raise ValueError("Invalid sort key")
 		
@@ -333,13 +336,8 @@ def sort_by(given_course_list : list, sorting : dict) -> list:
 	# Copy the course list.
 	course_list = given_course_list.copy()
 	
-	# Special case for course_grade_point.
-	if sort_key == "course_grade_point":
-		# Sort the course list.
-		course_list.sort(key=lambda x: float(x[sort_key]), reverse=should_reverse)
-	else :
-		# Sort the course list.
-		course_list.sort(key=lambda x: x[sort_key], reverse=should_reverse)
+	# Sort the course list. (Credits and grade points are numbers, they are sorted numerically)
+	course_list.sort(key=lambda x: x[sort_key], reverse=should_reverse)
 
 	# Return the sorted course list.
 	return course_list
@@ -360,16 +358,14 @@ def filter_by(given_course_list : list, filtering : dict) -> list:
 	# Validate the input key.
 	_validate_input_key(filter_key)
 
+	# The values of the GUI are strings, convert it once to the type of the field. (EXMP: "22.2" -> 22.2)
+	filter_value = coerce_course_field(filter_key, filter_value)
+
 	# Copy the course list.
 	course_list = given_course_list.copy()
 
-	# Special case for course_grade_point.
-	if filter_key == "course_grade_point":
-		# Filter the course list.
-		course_list = list(filter(lambda x: float(x[filter_key]) == float(filter_value), course_list))
-	else :
-		# Filter the course list.
-		course_list = list(filter(lambda x: x[filter_key] == filter_value, course_list))
+	# Filter the course list.
+	course_list = list(filter(lambda x: x[filter_key] == filter_value, course_list))
 	
 	# Return the filtered course list.
 	return course_list
@@ -383,7 +379,8 @@ def add_course(given_course_list : list, course : dict) -> list:
 	@Returns:
 		course_list (list) course list with added course.
 	"""
-	# Get values.
+	# Get values. The values of the GUI are strings, convert them to their types.
+	course = coerce_course(course)
 	course_code = course["course_code"]
 	course_name = course["course_name"]
 	course_lang = course["course_lang"]
@@ -474,12 +471,45 @@ def update_course(given_course_list : list, course : dict) -> list:
 		# Remove the old course.
 		course_list.pop(index_of_course)
 
-		# Insert the new course.
-		course_list.insert(index_of_course, course)
+		# Insert the new course. The values of the GUI are strings, convert them to their types.
+		course_list.insert(index_of_course, coerce_course(course))
 
 		# Return the updated course list.
 		return course_list
 
+def materialize_course_list(original_course_list : list, added_course_list : list = None, subtracted_course_list : list = None, updated_course_list : list = None, sorting : dict = None, filtering : list = None) -> list:
+	"""
+	Rebuilds the modified course list from the original one by replaying the changes of a scenario.
+	@Parameters:
+		original_course_list - Required : The course list of the transcript. (list) -> Used as the start of the replay.
+		added_course_list - Optional : Added courses. (list) (default = None) -> Used to add the courses.
+		subtracted_course_list - Optional : Subtracted courses. (list) (default = None) -> Used to subtract the courses.
+		updated_course_list - Optional : Updated courses. (list) (default = None) -> Used to update the courses.
+		sorting - Optional : The sorting key. (dict) (default = None) -> Used to sort the course list.
+		filtering - Optional : The filtering keys. (list) (default = None) -> Used to filter the course list.
+	@Returns:
+		course_list (list) the modified course list.
+	"""
+	# Copy the course list.
+	course_list = original_course_list.copy()
+
+	# Apply operations by one by.
+	for course in added_course_list or [] :
+		course_list = add_course(course_list, course)
+	for course in subtracted_course_list or [] :
+		course_list = subtract_course(course_list, course["course_code"])
+	for course in updated_course_list or [] :
+		course_list = update_course(course_list, course)
+	if sorting is not None :
+		course_list = sort_by(course_list, sorting)
+
+	# Lastly, apply filtering.
+	for current_filter in filtering or [] :
+		course_list = filter_by(course_list, current_filter)
+
+	# Return the modified course list.
+	return course_list
+
 def calculate_performance(course_list : list, skip_retakens : bool = False) -> dict:
 	"""
 	Calculates the GPA, credits attempted, credits successful and credits included in GPA based on the given course list.
@@ -507,34 +537,34 @@ def calculate_performance(course_list : list, skip_retakens : bool = False) -> d
 			if course["course_code"].endswith("*"):
 				continue
 
-		# Get course variables
-		course_credit : int = int(course["course_credit"])
+		# Get course variables, they are typed by the parser and the schema.
+		course_credit : int = course["course_credit"]
 		course_grade : str = course["course_grade"]
-		course_grade_point : float = float(course["course_grade_point"])
+		course_grade_point : float = course["course_grade_point"]
 
 		# Update credits attempted for each course seen
 		credits_attempted += course_credit
 
 		# Start calculating GPA
-		if course_grade in ["A", "A-", "B+", "B", "B-", "C+", "C", "C-", "D+", "D"]:
+		if course_grade in PASSING_GRADES:
 			# If course is successful, update credits successful and credits included in GPA
 			credits_successful += course_credit
 			credits_included_in_gpa += course_credit
 			gpa += course_grade_point
-		elif course_grade in ["S"]:
+		elif course_grade == Grade.S:
 			# If course is passed, update credits successful only
 			credits_successful += course_credit
-		elif course_grade == "F" or course_grade == "U":
+		elif course_grade in FAILING_GRADES:
 			# If course is failed, update credits included in GPA
 			credits_included_in_gpa += course_credit
 			gpa += course_grade_point
-		elif course_grade == "I":
+		elif course_grade == Grade.I:
 			# If course is incomplete, do not do anything
 			continue
-		elif course_grade == "W":
+		elif course_grade == Grade.W:
 			# If course is withdrawn, update credits attempted only
 			credits_attempted -= course_credit
-		elif course_grade == "N/A":
+		elif course_grade == Grade.NA:
 			# If course is not taken, do not do anything
 			continue
 
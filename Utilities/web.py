@@ -3,16 +3,79 @@ from    selenium                            import webdriver # -> Webdriver util
 from    selenium.webdriver.chrome.service   import Service # -> Service settlement
 from    selenium.webdriver.chrome.options   import Options # -> Initialization options
 from    selenium.webdriver.common.by        import By # -> Tag definer
+from    selenium.common.exceptions          import TimeoutException, WebDriverException # -> Wait failures
+import  threading # -> Thread safe metrics
+import  time # -> Wait timing
 import  os # -> OS manipulation
 
+class WaitMetrics :
+
+    def __init__(self) -> None:
+        """
+        Constructor method for WaitMetrics class, which keeps the wait time statistics of each waited XPath.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        self.records = {}
+        self.lock = threading.Lock()
+
+    def record(self, key : str, elapsed_time : float, is_timed_out : bool = False) -> None:
+        """
+        Records a finished wait.
+        @Parameters:
+            key - Required : XPath or name of the waited thing. (str) -> Used to group the waits
+            elapsed_time - Required : Seconds spent on the wait. (float) -> Used to update the statistics
+            is_timed_out - Optional : If the wait ended with a timeout. (bool) (default = False) -> Used to count the timeouts
+        @Returns:
+            None
+        """
+        with self.lock :
+            current_record = self.records.setdefault(key, {"count" : 0, "total_time" : 0.0, "max_time" : 0.0, "timeout_count" : 0})
+            current_record["count"] += 1
+            current_record["total_time"] += elapsed_time
+            current_record["max_time"] = max(current_record["max_time"], elapsed_time)
+            current_record["timeout_count"] += int(is_timed_out)
+
+    def get_summary(self) -> dict:
+        """
+        Returns a snapshot of the statistics, slowest average first.
+        @Parameters:
+            None
+        @Returns:
+            summary - Statistics of each key, {key : {"count", "total_time", "max_time", "mean_time", "timeout_count"}}. (dict)
+        """
+        with self.lock :
+            summary = {key : dict(current_record, mean_time=current_record["total_time"] / current_record["count"]) for key, current_record in self.records.items()}
+        return dict(sorted(summary.items(), key=lambda item : item[1]["mean_time"], reverse=True))
+
+    def reset(self) -> None:
+        """
+        Clears the statistics.
+        @Parameters:
+            None
+        @Returns:
+            None
+        """
+        with self.lock :
+            self.records.clear()
+
+# Process wide wait statistics, shared by all of the browsers.
+WAIT_METRICS = WaitMetrics()
+
 class Web :
 
-    def __init__(self, driver_path = None, isHidden = True) -> None:
+    def __init__(self, driver_path = None, isHidden = True, wait_timeout : float = None, poll_interval : float = None, backoff_factor : float = None, max_poll_interval : float = None) -> None:
         """
         Constructor, that initializes selenium browser.
         @Parameters:
             driver_path - Optional : Path to the driver. (str) (default = None) -> Used to initialize the browser
             isHidden    - Optional : If the browser is hidden or not. (bool) (default = True) -> Used to initialize the browser
+            wait_timeout - Optional : Seconds to wait for an element. (float) (default = None) -> None loads SELENIUM_DC.WAIT_TIMEOUT
+            poll_interval - Optional : Seconds between the first polls of a wait. (float) (default = None) -> None loads SELENIUM_DC.WAIT_POLL_INTERVAL
+            backoff_factor - Optional : Growth of the poll interval on each failed poll. (float) (default = None) -> None loads SELENIUM_DC.WAIT_BACKOFF_FACTOR
+            max_poll_interval - Optional : Upper limit of the poll interval. (float) (default = None) -> None loads SELENIUM_DC.WAIT_MAX_POLL_INTERVAL
         @Returns:
             None
         """
@@ -20,6 +83,12 @@ class Web :
         if driver_path == None :
             driver_path = SELENIUM_DC.CHROME_DRIVER_PATH
 
+        # Check for wait config, for ungivens load the default ones from SELENIUM_DC
+        self.wait_timeout = SELENIUM_DC.WAIT_TIMEOUT if wait_timeout is None else wait_timeout
+        self.poll_interval = SELENIUM_DC.WAIT_POLL_INTERVAL if poll_interval is None else poll_interval
+        self.backoff_factor = SELENIUM_DC.WAIT_BACKOFF_FACTOR if backoff_factor is None else backoff_factor
+        self.max_poll_interval = SELENIUM_DC.WAIT_MAX_POLL_INTERVAL if max_poll_interval is None else max_poll_interval
+
         # Change the permission of the driver for linux
         os.chmod(driver_path, 755)
 
@@ -42,6 +111,9 @@ class Web :
         # Maximize the browser, for better view on non headless mode and better workout on headless mode
         self.browser.maximize_window()
 
+        # Number of sessions served by this browser, used by the browser pool for recycling.
+        self.use_count = 0
+
     def open_web_page(self, url : str) -> None:
         """
         Public Class Method, that opens a web page.
@@ -75,36 +147,116 @@ class Web :
         # Terminate the browser
         self.browser.quit()
 
-    def create_element(self, xPath : str) -> None:
+    def reset_session(self) -> None:
         """
-        Public Class Method, that creates an element. With certain quarantees likewise the loop.
+        Public Class Method, that wipes the cookies and the storages of the browser. So the next user starts with a clean session.
         @Parameters:
-            xPath - Required : XPath of the element. (str) -> Used to create the element
+            None
         @Returns:
             None
         """
-        createdElement = None
-        # While the element is not created, try to create it until it is created
-        while (createdElement == None) :
+        # Clear the web storages of the current page.
+        try :
+            self.browser.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except Exception :
+            pass
+
+        # Clear the cookies and the cache of all domains over devtools, fallback to the current domain.
+        try :
+            self.browser.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            self.browser.execute_cdp_cmd("Network.clearBrowserCache", {})
+        except Exception :
+            self.browser.delete_all_cookies()
+
+        # Leave the page, so nothing of the previous user stays on the screen.
+        self.browser.get("about:blank")
+
+    def is_healthy(self) -> bool:
+        """
+        Public Class Method, that checks if the browser still responds.
+        @Parameters:
+            None
+        @Returns:
+            True if the browser responds, False otherwise. (bool)
+        """
+        # Ask something trivial to the browser.
+        try :
+            self.browser.execute_script("return 1;")
+            return True
+        except Exception :
+            return False
+
+    def wait_until(self, condition, metric_key : str, timeout : float = None) :
+        """
+        Public Class Method, that polls the condition until it returns a truthy value. Polls get sparser with the backoff, so a slow page does not keep a core busy.
+        @Parameters:
+            condition - Required : Callable to be polled, webdriver errors are counted as not ready. (callable) -> Used to check the page
+            metric_key - Required : Name of the wait. (str) -> Used to record the wait time into WAIT_METRICS
+            timeout - Optional : Seconds to wait. (float) (default = None) -> None uses the timeout of the browser
+        @Returns:
+            result - The first truthy result of the condition. (object)
+        @Raises:
+            TimeoutException : If the condition is not satisfied in time.
+        """
+        if timeout is None :
+            timeout = self.wait_timeout
+
+        start_time = time.monotonic()
+        deadline = start_time + timeout
+        current_interval = self.poll_interval
+        last_error = None
+
+        while True :
+            # Poll the condition
             try :
-                createdElement = self.browser.find_element(By.XPATH, xPath)
-            except :
-                continue
-        # Return the created element
-        return createdElement
+                result = condition()
+                if result :
+                    WAIT_METRICS.record(metric_key, time.monotonic() - start_time)
+                    return result
+            except WebDriverException as e :
+                last_error = e
+
+            # Give up when the deadline is passed, otherwise sleep until the next poll without passing the deadline.
+            remaining_time = deadline - time.monotonic()
+            if remaining_time <= 0 :
+                WAIT_METRICS.record(metric_key, time.monotonic() - start_time, is_timed_out=True)
+                reason = f" ({type(last_error).__name__})" if last_error is not None else ""
+                raise TimeoutException(f"Timed out after {timeout}s waiting for -> {metric_key}{reason}")
+            time.sleep(min(current_interval, remaining_time))
+            current_interval = min(current_interval * self.backoff_factor, self.max_poll_interval)
+
+    def create_element(self, xPath : str, timeout : float = None) -> object:
+        """
+        Public Class Method, that creates an element. Waits for the element to appear on the page.
+        @Parameters:
+            xPath - Required : XPath of the element. (str) -> Used to create the element
+            timeout - Optional : Seconds to wait for the element. (float) (default = None) -> None uses the timeout of the browser
+        @Returns:
+            createdElement - The found element. (WebElement)
+        @Raises:
+            TimeoutException : If the element does not appear in time.
+        """
+        # Wait until the element is found and return it
+        return self.wait_until(lambda : self.browser.find_element(By.XPATH, xPath), metric_key=xPath, timeout=timeout)
 
-    def click_on_element(self, element : object) -> None:
+    def click_on_element(self, element : object, timeout : float = None, metric_key : str = "click") -> None:
         """
-        Public Class Method, that clicks on an element. With certain quarantees likewise the loop.
+        Public Class Method, that clicks on an element. Retries while the element is not clickable yet.
         @Parameters:
             element - Required : Element to be clicked. (object) -> Used to click on the element
+            timeout - Optional : Seconds to wait for the element to be clickable. (float) (default = None) -> None uses the timeout of the browser
+            metric_key - Optional : Name of the wait. (str) (default = "click") -> Used to record the wait time into WAIT_METRICS
         @Returns:
             None
+        @Raises:
+            TimeoutException : If the element can not be clicked in time.
         """
-        # While the element is not clicked, try to click it until it is clicked
-        while (True) :
-            try :
-                element.click()
-                break
-            except :
-                continue
\ No newline at end of file
+        def click() -> bool:
+            """
+            Clicks on the element, reports success for the wait.
+            """
+            element.click()
+            return True
+
+        # Wait until the click goes through
+        self.wait_until(click, metric_key=metric_key, timeout=timeout)
@@ -0,0 +1,90 @@
+from Utilities import ingest_transcripts, collect_transcript_files, push_ingested_transcripts, get_mongo_client, close_mongo_client
+from Utilities.database import UserData
+from Environment import ASCII_LOG, DATABASE_DC
+import colorama
+import pymongo
+import argparse
+import json
+import time
+import sys
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parses the command line arguments of the batch ingestion.
+    @Parameters:
+        None
+    @Returns:
+        arguments - The parsed arguments. (argparse.Namespace)
+    """
+    parser = argparse.ArgumentParser(description="Batch offline transcript ingestion for the \"Transcript Manager\".")
+    parser.add_argument("source", help="A directory or a glob pattern of transcript PDF files.")
+    parser.add_argument("-o", "--output", default=None, help="Path of the JSON lines output file. (default : stdout)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Number of worker processes. (default : core count)")
+    parser.add_argument("-r", "--recursive", action="store_true", help="Search the sub directories of the source too.")
+    parser.add_argument("-p", "--push", action="store_true", help="Push the parsed transcripts to the database with bulk writes.")
+    parser.add_argument("-b", "--batch-size", type=int, default=DATABASE_DC.BULK_BATCH_SIZE, help=f"Transcripts in each bulk write. (default : {DATABASE_DC.BULK_BATCH_SIZE})")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+
+    arguments = parse_arguments()
+
+    # Collect the files once, so the progress can be reported.
+    transcript_files = collect_transcript_files(arguments.source, recursive=arguments.recursive)
+    print(colorama.Fore.YELLOW, ASCII_LOG["PROCCESS"], f"Ingesting {len(transcript_files)} transcript(s)...", colorama.Fore.RESET, file=sys.stderr)
+
+    # Connect to the database once, if the transcripts are pushed.
+    client = None
+    if arguments.push :
+        client = get_mongo_client()
+        client.bootstrap_indexes()
+
+    # Stream the results into the output as they arrive. The pushed ones wait for their batch.
+    output_file = open(arguments.output, "w", encoding="utf-8") if arguments.output else sys.stdout
+    success_count, failure_count = 0, 0
+    push_counts = {}
+    pending_results = []
+    start_time = time.perf_counter()
+
+    def flush_pending_results() -> None:
+        """
+        Pushes the pending results with one bulk write for each collection, than writes them with their push results.
+        A database error fails only the pending results, they are still written and the run goes on.
+        """
+        if not pending_results :
+            return
+        try :
+            push_results = push_ingested_transcripts(pending_results, client, batch_size=arguments.batch_size)
+        except pymongo.errors.PyMongoError as error :
+            push_results = [{"status" : UserData.PUSH_FAILED, "document_id" : None, "error" : str(error)} for _ in pending_results]
+        for result, push_result in zip(pending_results, push_results) :
+            result["push"] = push_result
+            push_counts[push_result["status"]] = push_counts.get(push_result["status"], 0) + 1
+            if push_result["error"] is not None :
+                print(colorama.Fore.RED, ASCII_LOG["FAILURE"], f"{result['path']} -> {push_result['error']}", colorama.Fore.RESET, file=sys.stderr)
+            output_file.write(json.dumps(result, ensure_ascii=False, default=str) + "\n")
+        pending_results.clear()
+
+    try :
+        for result in ingest_transcripts(transcript_files, max_workers=arguments.workers) :
+            if result["status"] == "success" :
+                success_count += 1
+                if client is not None :
+                    pending_results.append(result)
+                    if len(pending_results) >= arguments.batch_size :
+                        flush_pending_results()
+                    continue
+            else :
+                failure_count += 1
+                print(colorama.Fore.RED, ASCII_LOG["FAILURE"], f"{result['path']} -> {result['error']}", colorama.Fore.RESET, file=sys.stderr)
+            output_file.write(json.dumps(result, ensure_ascii=False) + "\n")
+        flush_pending_results()
+    finally :
+        if output_file is not sys.stdout :
+            output_file.close()
+    elapsed_time = time.perf_counter() - start_time
+
+    print(colorama.Fore.GREEN, ASCII_LOG["SUCCESS"], f"{success_count} parsed, {failure_count} failed in {elapsed_time:.2f}s", colorama.Fore.RESET, file=sys.stderr)
+    if client is not None :
+        print(colorama.Fore.GREEN, ASCII_LOG["SUCCESS"], f"Pushed -> {push_counts}", colorama.Fore.RESET, file=sys.stderr)
+        close_mongo_client()
@@ -0,0 +1,45 @@
+from Utilities import get_mongo_client, close_mongo_client, migrate_collection, rekey_base_documents, remove_unreferenced_base_documents, SCHEMA_VERSION
+from Environment import ASCII_LOG, DATABASE_DC
+import colorama
+import argparse
+import time
+import sys
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parses the command line arguments of the schema migration.
+    @Parameters:
+        None
+    @Returns:
+        arguments - The parsed arguments. (argparse.Namespace)
+    """
+    parser = argparse.ArgumentParser(description=f"Migrates the stored transcripts of the \"Transcript Manager\" to the schema version {SCHEMA_VERSION}.")
+    parser.add_argument("-n", "--dry-run", action="store_true", help="Only report the documents and the size change, do not write.")
+    parser.add_argument("-p", "--prune-bases", action="store_true", help="Remove the base transcripts no document points to, run it while no client is saving.")
+    parser.add_argument("-b", "--batch-size", type=int, default=DATABASE_DC.BULK_BATCH_SIZE, help=f"Documents in each bulk write. (default : {DATABASE_DC.BULK_BATCH_SIZE})")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+
+    arguments = parse_arguments()
+    client = get_mongo_client()
+
+    # Bases first, the migrated user data can be read with them at any point of the migration. (The readers accept every version)
+    for collection in (client.user_base, client.user_data) :
+        print(colorama.Fore.YELLOW, ASCII_LOG["PROCCESS"], f"Migrating {collection.name}{' (dry run)' if arguments.dry_run else ''}...", colorama.Fore.RESET, file=sys.stderr)
+        start_time = time.perf_counter()
+        summary = migrate_collection(collection, batch_size=arguments.batch_size, dry_run=arguments.dry_run)
+        size_change = (1 - summary["size_after"] / summary["size_before"]) * 100 if summary["size_before"] else 0.0
+        print(colorama.Fore.GREEN, ASCII_LOG["SUCCESS"], f"{summary['migrated']} migrated, {summary['failed']} failed in {time.perf_counter() - start_time:.2f}s, {summary['size_before']} -> {summary['size_after']} bytes ({size_change:.1f}% smaller)", colorama.Fore.RESET, file=sys.stderr)
+
+        # Move the bases to the _id of their typed content, before the user data is migrated.
+        if collection is client.user_base :
+            rekey_summary = rekey_base_documents(client.user_base, client.user_data, dry_run=arguments.dry_run)
+            print(colorama.Fore.GREEN, ASCII_LOG["SUCCESS"], f"{rekey_summary['rekeyed']} base(s) rekeyed, {rekey_summary['merged']} merged into an existing one", colorama.Fore.RESET, file=sys.stderr)
+
+    # Remove the unreferenced bases, if it is asked.
+    if arguments.prune_bases :
+        removed_count = remove_unreferenced_base_documents(client.user_base, client.user_data, dry_run=arguments.dry_run)
+        print(colorama.Fore.GREEN, ASCII_LOG["SUCCESS"], f"{removed_count} unreferenced base(s) {'found' if arguments.dry_run else 'removed'}", colorama.Fore.RESET, file=sys.stderr)
+
+    close_mongo_client()